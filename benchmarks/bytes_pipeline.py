@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Throughput of filtering as bytes ("--bytes") versus decoded lines.
+
+Both paths read raw lines, filter them by flake8 preset and write kept lines as bytes,
+decoded path decodes every line and encodes kept lines.
+
+Usage:
+
+python -m benchmarks.bytes_pipeline
+"""
+
+import codecs
+import sys
+import timeit
+from collections.abc import Callable
+
+from ondivi._internal.bytes_pipeline import bytes_lines_for_out  # noqa: WPS436
+from ondivi._internal.changed_lines_index import ChangedLinesIndex, index_from_ranges  # noqa: WPS436
+from ondivi._internal.filter_out_violations import lines_for_out  # noqa: WPS436
+from ondivi._internal.linter_output import stripped_lines  # noqa: WPS436
+from ondivi._internal.presets import preset_bytes_pattern, preset_format  # noqa: WPS436
+
+_REPEAT = 5
+_LINES_COUNT = 200_000
+_FILES_COUNT = 1000
+# Share of changed lines, kept lines are minority on adoption of linter in legacy code
+_CHANGED_EVERY = (1000, 100, 10)
+
+
+def _raw_output() -> list[bytes]:
+    return [
+        'src/module_{0}.py:{1}:80: E501 line too long (119 > 79 characters)\n'.format(
+            idx % _FILES_COUNT,
+            idx // _FILES_COUNT,
+        ).encode('utf-8')
+        for idx in range(_LINES_COUNT)
+    ]
+
+
+def _changed_lines(changed_every: int) -> ChangedLinesIndex:
+    lines_per_file = _LINES_COUNT // _FILES_COUNT
+    return index_from_ranges({
+        'src/module_{0}.py'.format(file_idx): [
+            (line_num, line_num)
+            for line_num in range(file_idx % changed_every, lines_per_file, changed_every)
+        ]
+        for file_idx in range(_FILES_COUNT)
+    })
+
+
+def _decoded_run(changed_lines: ChangedLinesIndex, raw_output: list[bytes]) -> Callable[[], int]:
+    parser = preset_format('flake8')
+    return lambda: sum(
+        len(line.encode('utf-8'))
+        for line, _ in lines_for_out(
+            changed_lines,
+            stripped_lines(codecs.iterdecode(raw_output, 'utf-8')),
+            parser,
+            only_violations=False,
+        )
+    )
+
+
+def _bytes_run(changed_lines: ChangedLinesIndex, raw_output: list[bytes]) -> Callable[[], int]:
+    pattern = preset_bytes_pattern('flake8')
+    return lambda: sum(
+        len(line)
+        for line, _ in bytes_lines_for_out(
+            changed_lines,
+            stripped_lines(raw_output),
+            pattern,
+            only_violations=False,
+        )
+    )
+
+
+def _lines_per_second(run: Callable[[], int]) -> float:
+    return _LINES_COUNT / min(timeit.repeat(run, number=1, repeat=_REPEAT))
+
+
+def main() -> None:
+    """Print throughput of both paths by share of changed lines."""
+    raw_output = _raw_output()
+    sys.stdout.write('{0:<16}{1:>16}{2:>16}\n'.format('changed lines', 'str lines/s', 'bytes lines/s'))
+    for changed_every in _CHANGED_EVERY:
+        changed_lines = _changed_lines(changed_every)
+        sys.stdout.write('{0:<16}{1:>16.0f}{2:>16.0f}\n'.format(
+            '1/{0}'.format(changed_every),
+            _lines_per_second(_decoded_run(changed_lines, raw_output)),
+            _lines_per_second(_bytes_run(changed_lines, raw_output)),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Latency of one ondivi run with and without daemon, by "--daemon" and by "ondivi-client".
+
+Runs in ondivi repository, diff taken against first commit.
+
+Usage:
+
+python -m benchmarks.daemon
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+_REPEAT = 10
+_LINES_COUNT = 1000
+_POLL_INTERVAL = 0.01
+_ONDIVI = (sys.executable, '-c', 'from ondivi.entry import main; main()')
+_CLIENT = (sys.executable, '-c', 'from ondivi.client import main; main()')
+
+
+def _seconds(command: tuple[str, ...], args: list[str]) -> float:
+    return min(timeit.repeat(
+        lambda: subprocess.run([*command, *args], stdout=subprocess.DEVNULL, check=False),  # noqa: S603
+        number=1,
+        repeat=_REPEAT,
+    ))
+
+
+def _filter_args(tmp_dir: Path) -> list[str]:
+    baseline = subprocess.run(
+        ['git', 'rev-list', '--max-parents=0', 'HEAD'],  # noqa: S607
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()[0]
+    linter_out = tmp_dir / 'linter_out.txt'
+    linter_out.write_text(
+        '\n'.join(
+            'ondivi/entry.py:{0}:1: E302 expected 2 blank lines, found 1'.format(line_num)
+            for line_num in range(_LINES_COUNT)
+        ),
+        encoding='utf-8',
+    )
+    return ['--baseline', baseline, '--fromfile', str(linter_out)]
+
+
+def _write_latencies(args: list[str]) -> None:
+    runs = (
+        ('no cache, s', _ONDIVI, [*args, '--no-cache']),
+        ('cache, s', _ONDIVI, args),
+        ('daemon, s', _ONDIVI, [*args, '--daemon']),
+        ('client, s', _CLIENT, args),
+    )
+    for run_name, command, run_args in runs:
+        sys.stdout.write('{0:<12}{1:>12.3f}\n'.format(run_name, _seconds(command, run_args)))
+
+
+def main() -> None:
+    """Print latency of cold run, run with cache and run by daemon."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        args = _filter_args(Path(tmp_dir))
+        socket_path = Path(tmp_dir) / 'ondivi.sock'
+        os.environ['ONDIVI_SOCKET'] = str(socket_path)
+        with subprocess.Popen([*_ONDIVI, 'serve'], stdout=subprocess.DEVNULL) as daemon:  # noqa: S603
+            while not socket_path.exists():
+                time.sleep(_POLL_INTERVAL)
+            _write_latencies(args)
+            daemon.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Time and peak memory of reading SARIF document incrementally and with json.load.
+
+Usage:
+
+python -m benchmarks.input_formats
+"""
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from ondivi._internal.input_formats import input_lines  # noqa: WPS436
+
+_RESULTS_COUNT = 200_000
+_MIB = 1_048_576
+_HEADER = '{0:<16}{1:>12}{2:>16}\n'.format('', 'time, s', 'peak, MiB')
+
+
+def _sarif_document() -> str:
+    return json.dumps({
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {'name': 'flake8'}},
+            'results': [
+                {
+                    'ruleId': 'E501',
+                    'message': {'text': 'line too long (119 > 79 characters)'},
+                    'locations': [{'physicalLocation': {
+                        'artifactLocation': {'uri': 'src/module_{0}.py'.format(result_idx % 1000)},
+                        'region': {'startLine': result_idx, 'startColumn': 80},
+                    }}],
+                }
+                for result_idx in range(_RESULTS_COUNT)
+            ],
+        }],
+    }, indent=2)
+
+
+def _seconds(read_document: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    read_document()
+    return time.perf_counter() - start
+
+
+def _peak_mib(read_document: Callable[[], object]) -> float:
+    tracemalloc.start()
+    read_document()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / _MIB
+
+
+def _read_by_json_load(path: Path) -> object:
+    with path.open(encoding='utf-8') as document:
+        return json.load(document)
+
+
+def _read_incrementally(path: Path) -> object:
+    with path.open(encoding='utf-8') as document:
+        return sum(1 for _ in input_lines(document, 'sarif'))
+
+
+def main() -> None:
+    """Print time and peak memory of reading document from file."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / 'report.sarif'
+        path.write_text(_sarif_document(), encoding='utf-8')
+        document_mib = path.stat().st_size / _MIB
+        sys.stdout.write('document: {0:.1f} MiB, {1} results\n'.format(document_mib, _RESULTS_COUNT))
+        sys.stdout.write(_HEADER)
+        for name, read_document in (('json.load', _read_by_json_load), ('--input-format', _read_incrementally)):
+            sys.stdout.write('{0:<16}{1:>12.3f}{2:>16.1f}\n'.format(
+                name,
+                _seconds(partial(read_document, path)),
+                _peak_mib(partial(read_document, path)),
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Filtering time of linter output by count of processes.
+
+Helps to choose PARALLEL_THRESHOLD, output shorter than it filtered in one process.
+
+Usage:
+
+python -m benchmarks.jobs
+"""
+
+import os
+import sys
+import timeit
+
+from ondivi._internal.changed_lines_index import index_from_ranges  # noqa: WPS436
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
+from ondivi._internal.filter_out_violations import lines_for_out, parallel_lines_for_out  # noqa: WPS436
+
+_REPEAT = 3
+_LINES_COUNTS = (10_000, 50_000, 200_000)
+_FILES_COUNT = 1000
+
+
+def _seconds(lines_count: int, jobs: int) -> float:
+    linter_out = [
+        'src/module_{0}.py:{1}:80: E501 line too long (119 > 79 characters)'.format(idx % _FILES_COUNT, idx)
+        for idx in range(lines_count)
+    ]
+    file_ranges = [(line_num, line_num + 5) for line_num in range(0, lines_count, 100)]
+    changed_lines = index_from_ranges({
+        'src/module_{0}.py'.format(file_idx): file_ranges
+        for file_idx in range(_FILES_COUNT)
+    })
+    parser = compile_format('{filename}:{line_num:d}:{col:d}: {message}')
+    if jobs == 1:
+        return min(timeit.repeat(
+            lambda: list(lines_for_out(changed_lines, linter_out, parser, only_violations=False)),
+            number=1,
+            repeat=_REPEAT,
+        ))
+    return min(timeit.repeat(
+        lambda: list(parallel_lines_for_out(changed_lines, linter_out, parser, only_violations=False, jobs=jobs)),
+        number=1,
+        repeat=_REPEAT,
+    ))
+
+
+def main() -> None:
+    """Print filtering time for one process and for all CPU cores."""
+    cpu_count = os.cpu_count() or 1
+    sys.stdout.write('{0:<12}{1:>12}{2:>12}\n'.format('lines', 'jobs=1, s', 'jobs={0}, s'.format(cpu_count)))
+    for lines_count in _LINES_COUNTS:
+        sys.stdout.write('{0:<12}{1:>12.3f}{2:>12.3f}\n'.format(
+            lines_count,
+            _seconds(lines_count, 1),
+            _seconds(lines_count, cpu_count),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Per-line cost of parsing linter output.
+
+Compare parsing every line three times by template (before)
+with parsing every line once by compiled template (after).
+
+Usage:
+
+python -m benchmarks.linter_out_parsing
+"""
+
+import sys
+import timeit
+
+from parse import parse as parse_from_pattern  # type: ignore [import-untyped]
+
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
+
+_FORMAT = '{filename}:{line_num:d}{other}'
+_LINES_COUNT = 10000
+_FILES_COUNT = 300
+_REPEAT = 5
+_US_IN_SECOND = 1_000_000
+
+
+def _linter_out() -> list[str]:
+    return [
+        'src/module_{0}.py:{1}:5: E501 line too long (123 > 120 characters)'.format(idx % _FILES_COUNT, idx)
+        for idx in range(_LINES_COUNT)
+    ]
+
+
+def _before(linter_out: list[str]) -> None:
+    for line in linter_out:
+        if parse_from_pattern(_FORMAT, line):
+            parse_from_pattern(_FORMAT, line)['filename']  # noqa: B018, WPS428
+            parse_from_pattern(_FORMAT, line)['line_num']  # noqa: B018, WPS428
+
+
+def _after(linter_out: list[str]) -> None:
+    compiled_format = compile_format(_FORMAT)
+    for line in linter_out:
+        compiled_format.violation(line)
+
+
+def _per_line_cost(func_name: str, linter_out: list[str]) -> float:
+    func = {'before': _before, 'after': _after}[func_name]
+    timings = timeit.repeat(lambda: func(linter_out), number=1, repeat=_REPEAT)
+    return min(timings) / len(linter_out)
+
+
+def main() -> None:
+    """Print per-line cost before and after."""
+    linter_out = _linter_out()
+    for func_name in ('before', 'after'):
+        sys.stdout.write('{0:<8}{1:>10.2f} us/line\n'.format(
+            func_name,
+            _per_line_cost(func_name, linter_out) * _US_IN_SECOND,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Timings of filtering pipeline stages on synthetic data.
+
+Stages:
+
+diff        building changed lines index from diff
+parse       parsing every line of linter output
+filter      parsing and filtering lines by changed lines index
+output      writing all lines of linter output
+controller  whole pipeline by `ondivi.entry.controller`
+"""
+
+import os
+import timeit
+from collections.abc import Callable, Mapping
+from contextlib import redirect_stdout
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+from benchmarks.synthetic import LINTER_SHAPES, diff_text, linter_output
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
+from ondivi._internal.define_changed_lines import define_changed_lines_index  # noqa: WPS436
+from ondivi._internal.filter_out_violations import lines_for_out  # noqa: WPS436
+from ondivi._internal.ondivi_types import Violation  # noqa: WPS436
+from ondivi._internal.output_formats import OUTPUT_FORMATS, TEXT_OUTPUT  # noqa: WPS436
+from ondivi._internal.write_output import write_stream  # noqa: WPS436
+from ondivi.entry import controller
+
+_FILES_COUNT = 1000
+_CALIBRATION_NUMBERS = 200_000
+_CALIBRATION_REPEAT = 10
+_MEDIUM_HUNKS = 10_000
+_MEDIUM_LINES = 100_000
+_LARGE_HUNKS = 1_000_000
+_LARGE_LINES = 5_000_000
+
+
+class Case(NamedTuple):
+    """Size of synthetic data."""
+
+    hunks_count: int
+    lines_count: int
+    linter: str
+
+
+CASES: Mapping[str, Case] = MappingProxyType({
+    'small': Case(10, 1000, 'flake8'),
+    'medium-flake8': Case(_MEDIUM_HUNKS, _MEDIUM_LINES, 'flake8'),
+    'medium-ruff': Case(_MEDIUM_HUNKS, _MEDIUM_LINES, 'ruff'),
+    'medium-mypy': Case(_MEDIUM_HUNKS, _MEDIUM_LINES, 'mypy'),
+    # Several minutes and few GiB of memory, not run by default
+    'large': Case(_LARGE_HUNKS, _LARGE_LINES, 'flake8'),
+})
+DEFAULT_CASES = ('small', 'medium-flake8', 'medium-ruff', 'medium-mypy')
+
+
+def calibration_seconds() -> float:
+    """Time of fixed workload, timings divided by it for compare results of different machines.
+
+    :return: float
+    """
+    return min(timeit.repeat(
+        lambda: sorted(str(number) for number in range(_CALIBRATION_NUMBERS)),
+        number=1,
+        repeat=_CALIBRATION_REPEAT,
+    ))
+
+
+def case_stages(case: Case) -> dict[str, Callable[[], object]]:
+    """Stages prepared for timing, data of case generated before.
+
+    :param case: Case
+    :return: dict[str, Callable[[], object]], stage by name
+    """
+    diff = diff_text(case.hunks_count, _FILES_COUNT)
+    linter_out = linter_output(case.lines_count, _FILES_COUNT, case.linter)
+    parser = compile_format(LINTER_SHAPES[case.linter].template)
+    changed_lines = define_changed_lines_index(diff)
+    # All lines written, as for diff with all lines changed
+    kept_lines = [(line, parser.violation(line)) for line in linter_out]
+    return {
+        'diff': lambda: define_changed_lines_index(diff),
+        'parse': lambda: [parser.violation(line) for line in linter_out],
+        'filter': lambda: list(lines_for_out(changed_lines, linter_out, parser, only_violations=False)),
+        'output': lambda: _written(kept_lines),
+        'controller': lambda: controller(
+            diff,
+            linter_out,
+            LINTER_SHAPES[case.linter].template,
+            only_violations=False,
+            random_additional=None,
+        ),
+    }
+
+
+def case_timings(case: Case, repeat: int) -> dict[str, float]:
+    """Best time of each stage.
+
+    :param case: Case
+    :param repeat: int, count of runs for each stage
+    :return: dict[str, float], seconds by stage name
+    """
+    return {
+        stage_name: min(timeit.repeat(stage, number=1, repeat=repeat))
+        for stage_name, stage in case_stages(case).items()
+    }
+
+
+def _written(kept_lines: list[tuple[str, Violation | None]]) -> bool:
+    with Path(os.devnull).open('w', encoding='utf-8') as devnull, redirect_stdout(devnull):
+        return write_stream(kept_lines, OUTPUT_FORMATS[TEXT_OUTPUT], flush_lines=False)
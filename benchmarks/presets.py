@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Throughput of built-in presets versus equivalent "--format" templates.
+
+Usage:
+
+python -m benchmarks.presets
+"""
+
+import sys
+import timeit
+
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
+from ondivi._internal.ondivi_types import ViolationParser  # noqa: WPS436
+from ondivi._internal.presets import preset_format  # noqa: WPS436
+
+_LINES_COUNT = 10000
+_REPEAT = 5
+_COLUMN_TEMPLATE = '{filename}:{line_num:d}:{col:d}: {message}'
+
+# Preset name, equivalent template, line of linter output with "{0}" placeholder for line number
+_CASES = (
+    ('flake8', _COLUMN_TEMPLATE, 'src/app.py:{0}:80: E501 line too long (119 > 79)'),
+    ('ruff', _COLUMN_TEMPLATE, 'src/app.py:{0}:5: T201 `print` found'),
+    ('pylint', _COLUMN_TEMPLATE, 'src/app.py:{0}:0: C0114: Missing module docstring'),
+    ('mypy', '{filename}:{line_num:d}: {message}', 'src/app.py:{0}: error: Incompatible types in assignment'),
+    ('eslint', _COLUMN_TEMPLATE, "src/app.js:{0}:10: 'x' is unused. [Error/no-undef]"),
+    ('rubocop', _COLUMN_TEMPLATE, 'lib/app.rb:{0}:1: C: Style/Documentation: Missing.'),
+    ('stylelint', _COLUMN_TEMPLATE, 'src/app.css:{0}:7: Unexpected unit (unit) [error]'),
+)
+
+
+def _lines_per_second(parser: ViolationParser, linter_out: list[str]) -> float:
+    timings = timeit.repeat(
+        lambda: [parser.violation(line) for line in linter_out],
+        number=1,
+        repeat=_REPEAT,
+    )
+    return len(linter_out) / min(timings)
+
+
+def main() -> None:
+    """Print throughput of each preset and equivalent template."""
+    sys.stdout.write('{0:<12}{1:>16}{2:>16}\n'.format('preset', 'preset lines/s', 'format lines/s'))
+    for preset, template, line in _CASES:
+        linter_out = [line.format(idx) for idx in range(1, _LINES_COUNT + 1)]
+        sys.stdout.write('{0:<12}{1:>16.0f}{2:>16.0f}\n'.format(
+            preset,
+            _lines_per_second(preset_format(preset), linter_out),
+            _lines_per_second(compile_format(template), linter_out),
+        ))
+
+
+if __name__ == '__main__':
+    main()
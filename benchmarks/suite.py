@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Benchmark suite of filtering pipeline with stored baseline.
+
+Timings divided by time of calibration workload before compare,
+so baseline from other machine comparable with current timings,
+"ratio" column shows slowdown of normalized time.
+Stages faster than 10 ms reported, but not compared, they are too noisy.
+
+Usage:
+
+python -m benchmarks.suite run --save benchmarks/baseline.json
+python -m benchmarks.suite compare benchmarks/baseline.json --tolerance 0.25
+"""
+
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+from benchmarks.pipeline import CASES, DEFAULT_CASES
+from benchmarks.timings import Timings, measured, ratios, regressions
+
+_ROW = '{0:<26}{1:>12}{2:>12}{3:>8}  {4}\n'
+_DEFAULT_TOLERANCE = 0.25
+
+
+def _loaded(path: Path) -> Timings:
+    return Timings(**json.loads(path.read_text(encoding='utf-8')))
+
+
+def _write_row(
+    stage: str,
+    baseline: str = '',
+    current: str = '',
+    ratio: str = '',
+    mark: str = '',
+) -> None:
+    sys.stdout.write(_ROW.format(stage, baseline, current, ratio, mark))
+
+
+@click.group()
+def main() -> None:
+    """Benchmark suite of filtering pipeline."""
+
+
+@main.command()
+@click.option(
+    '--case',
+    'case_names',
+    multiple=True,
+    type=click.Choice(list(CASES)),
+    help='Case for run, can be used multiple times (default: all except "large")',
+)
+@click.option('--repeat', default=3, type=int, help='Count of runs, best time taken (default: 3)')
+@click.option('--save', default=None, type=click.Path(path_type=Path), help='Path of JSON file for timings')
+def run(case_names: tuple[str, ...], repeat: int, save: Path | None) -> None:
+    """Print timings of stages, save them as baseline."""
+    timings = measured(case_names or DEFAULT_CASES, repeat)
+    _write_row('stage', current='seconds')
+    for stage, seconds in timings.stages.items():
+        _write_row(stage, current='{0:.4f}'.format(seconds))
+    if save:
+        saved = json.dumps(asdict(timings), indent=2)
+        save.write_text('{0}\n'.format(saved), encoding='utf-8')
+
+
+@main.command()
+@click.argument('baseline_path', type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    '--timings',
+    'timings_path',
+    default=None,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help='Saved timings for compare, cases of baseline run if not passed',
+)
+@click.option(
+    '--tolerance',
+    default=_DEFAULT_TOLERANCE,
+    type=float,
+    help='Allowed slowdown of stage, 0.25 for 25% (default: 0.25)',
+)
+@click.option('--repeat', default=3, type=int, help='Count of runs, best time taken (default: 3)')
+def compare(baseline_path: Path, timings_path: Path | None, tolerance: float, repeat: int) -> None:
+    """Compare timings with baseline, exit with code 1 if any stage slower than tolerance."""
+    baseline = _loaded(baseline_path)
+    current = _loaded(timings_path) if timings_path else measured(baseline.case_names(), repeat)
+    slower = regressions(baseline, current, tolerance)
+    _write_row('stage', 'baseline', 'current', 'ratio')
+    for stage, ratio in ratios(baseline, current).items():
+        _write_row(
+            stage,
+            '{0:.4f}'.format(baseline.stages[stage]),
+            '{0:.4f}'.format(current.stages[stage]),
+            '{0:.2f}'.format(ratio),
+            'SLOWER' if stage in slower else '',
+        )
+    if slower:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Synthetic diffs and linter outputs for benchmarks.
+
+Generated from fixed seed, same arguments give same text on every run.
+"""
+
+from collections.abc import Iterator, Mapping
+from random import Random
+from types import MappingProxyType
+from typing import NamedTuple
+
+_SEED = 2024
+_HUNK_STEP = 20
+_MAX_LINE_NUM = 2000
+
+
+class LinterShape(NamedTuple):
+    """Template and violation line of linter."""
+
+    template: str
+    # "{0}" placeholder for filename, "{1}" for line number
+    line: str
+    summary: str
+
+
+LINTER_SHAPES: Mapping[str, LinterShape] = MappingProxyType({
+    'flake8': LinterShape(
+        '{filename}:{line_num:d}:{col:d}: {message}',
+        '{0}:{1}:80: E501 line too long (119 > 79 characters)',
+        '',
+    ),
+    'ruff': LinterShape(
+        '{filename}:{line_num:d}:{col:d}: {message}',
+        '{0}:{1}:5: ANN201 Missing return type annotation for public function `handle`',
+        'Found {0} errors.',
+    ),
+    'mypy': LinterShape(
+        '{filename}:{line_num:d}: {message}',
+        '{0}:{1}: error: Incompatible types in assignment (expression has type "int", variable has type "str")',
+        'Found {0} errors in 1000 files (checked 1000 source files)',
+    ),
+})
+
+
+def filename(file_idx: int) -> str:
+    """Name of generated file.
+
+    :param file_idx: int
+    :return: str
+    """
+    return 'src/package_{0}/module_{1}.py'.format(file_idx % 10, file_idx)
+
+
+def diff_text(hunks_count: int, files_count: int) -> str:
+    """Diff with hunks spread across files, each hunk adds two lines.
+
+    :param hunks_count: int
+    :param files_count: int
+    :return: str
+    """
+    hunks_per_file, rest = divmod(hunks_count, files_count)
+    return '\n'.join(
+        diff_line
+        for file_idx in range(min(files_count, hunks_count))
+        for diff_line in _file_diff(filename(file_idx), hunks_per_file + (file_idx < rest))
+    )
+
+
+def _file_diff(name: str, hunks_count: int) -> Iterator[str]:
+    yield from (
+        'diff --git a/{0} b/{0}'.format(name),
+        'index 669d0ff..7a518fa 100644',
+        '--- a/{0}'.format(name),
+        '+++ b/{0}'.format(name),
+    )
+    for hunk_idx in range(hunks_count):
+        yield '@@ -{0},0 +{0},2 @@ def handle():'.format(hunk_idx * _HUNK_STEP + 1)
+        yield '+    request = parsed(raw_request)'
+        yield '+    return response(request)'
+
+
+def linter_output(lines_count: int, files_count: int, linter: str) -> list[str]:
+    """Lines of linter output with summary line.
+
+    Violations placed at random lines from first 2000 lines of files,
+    diff hunks change two lines of every twenty
+
+    :param lines_count: int
+    :param files_count: int
+    :param linter: str, key of LINTER_SHAPES
+    :return: list[str]
+    """
+    shape = LINTER_SHAPES[linter]
+    rnd = Random(_SEED)  # noqa: S311 . Not a cryptography
+    output_lines = [
+        shape.line.format(filename(file_idx), rnd.randrange(1, _MAX_LINE_NUM))
+        for file_idx in rnd.choices(range(files_count), k=lines_count)
+    ]
+    if shape.summary:
+        output_lines.append(shape.summary.format(lines_count))
+    return output_lines
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Timings of benchmark cases and their compare with baseline."""
+
+from dataclasses import dataclass
+
+from benchmarks.pipeline import CASES, calibration_seconds, case_timings
+
+_NOISE_SECONDS = 0.01
+
+
+@dataclass(frozen=True)
+class Timings:
+    """Timings of stages with calibration."""
+
+    calibration: float
+    # Seconds by "<case>/<stage>"
+    stages: dict[str, float]
+
+    def normalized(self, stage: str) -> float:
+        """Time of stage relative to calibration.
+
+        :param stage: str
+        :return: float
+        """
+        return self.stages[stage] / self.calibration
+
+    def case_names(self) -> tuple[str, ...]:
+        """Names of measured cases.
+
+        :return: tuple[str, ...]
+        """
+        case_names = (stage.partition('/')[0] for stage in self.stages)
+        return tuple(dict.fromkeys(case_names))
+
+
+def measured(case_names: tuple[str, ...], repeat: int) -> Timings:
+    """Timings of all stages of cases.
+
+    Calibration measured before and after each case, best time taken
+
+    :param case_names: tuple[str, ...]
+    :param repeat: int
+    :return: Timings
+    """
+    calibrations = [calibration_seconds()]
+    stages = {}
+    for case_name in case_names:
+        for stage_name, seconds in case_timings(CASES[case_name], repeat).items():
+            stages['{0}/{1}'.format(case_name, stage_name)] = seconds
+        calibrations.append(calibration_seconds())
+    return Timings(min(calibrations), stages)
+
+
+def ratios(baseline: Timings, current: Timings) -> dict[str, float]:
+    """Normalized current time divided by normalized baseline time for stages of both.
+
+    :param baseline: Timings
+    :param current: Timings
+    :return: dict[str, float]
+    """
+    return {
+        stage: current.normalized(stage) / baseline.normalized(stage)
+        for stage in current.stages
+        if stage in baseline.stages
+    }
+
+
+def regressions(baseline: Timings, current: Timings, tolerance: float) -> list[str]:
+    """Stages slower than baseline more than tolerance.
+
+    :param baseline: Timings
+    :param current: Timings
+    :param tolerance: float, allowed slowdown, 0.25 for 25%
+    :return: list[str]
+    """
+    return [
+        stage
+        for stage, ratio in ratios(baseline, current).items()
+        if ratio > 1 + tolerance and current.stages[stage] >= _NOISE_SECONDS
+    ]
@@ -0,0 +1,174 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Fingerprints of violations for filtering without git diff, see "--save-baseline"."""
+
+from __future__ import annotations
+
+import re
+import struct
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+# _internal allow into ondivi app
+from ondivi._internal.exceptions import BaselineSnapshotError  # noqa: WPS436
+from ondivi._internal.ondivi_types import (  # noqa: WPS436
+    ActualViolationsListStr,
+    FileNameStr,
+    LinterAdditionalMessageStr,
+    Violation,
+    ViolationParser,
+    ViolationStr,
+)
+from ondivi._internal.repo_paths import local_filename  # noqa: WPS436
+
+# Change on format of snapshot file or fingerprint source
+_MAGIC = b'ONDIVIB2'
+# Little endian unsigned 64 bit integer
+_FINGERPRINT_FORMAT = '<Q'
+# Line and column numbers of linter line change after edit of lines above violation,
+# digits of rule codes like "E501" are part of word and kept
+_NUMBERS = re.compile(r'(?<!\w)\d+(?!\w)')
+
+
+@dataclass(frozen=True)
+class BaselineSnapshot:
+    """Fingerprints of violations saved by "--save-baseline".
+
+    Fingerprint is hash of filename, linter line without location numbers and violation line content
+    without repeated whitespaces, so old violation found after move of its line
+    and becomes new only after edit of its line. Lookup of violation is O(1)
+    """
+
+    fingerprints: frozenset[int]
+
+    def lines_for_out(
+        self,
+        linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr],
+        parser: ViolationParser,
+        only_violations: bool,
+    ) -> Iterator[tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None]]:
+        """Lazy filter violations not found in snapshot.
+
+        :param linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr]
+        :param parser: ViolationParser
+        :param only_violations: bool
+        :yields: tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None], line for out and its violation
+        """
+        for linter_out_line, violation, fingerprint in fingerprinted(linter_out, parser):
+            if violation is None:
+                if not only_violations:
+                    yield linter_out_line, None
+            elif fingerprint not in self.fingerprints:
+                yield linter_out_line, violation
+
+    def filtered(
+        self,
+        linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr],
+        parser: ViolationParser,
+        only_violations: bool,
+    ) -> tuple[ActualViolationsListStr, bool]:
+        """Collect violations not found in snapshot.
+
+        :param linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr]
+        :param parser: ViolationParser
+        :param only_violations: bool
+        :return: tuple[ActualViolationsListStr, bool]
+        """
+        lines_for_out = list(self.lines_for_out(linter_out, parser, only_violations))
+        return (
+            [linter_out_line for linter_out_line, _ in lines_for_out],
+            any(violation is not None for _, violation in lines_for_out),
+        )
+
+
+def fingerprinted(
+    linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr],
+    parser: ViolationParser,
+) -> Iterator[tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None, int]]:
+    """Linter lines with violations and their fingerprints.
+
+    Every file of violations read once, missing file fingerprinted with empty lines
+
+    :param linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr]
+    :param parser: ViolationParser
+    :yields: tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None, int], 0 for line without violation
+    """
+    import hashlib  # noqa: WPS433, PLC0415 . Not needed in hot path
+    source_files: dict[FileNameStr, list[str]] = {}
+    for linter_out_line in linter_out:
+        violation = parser.violation(linter_out_line)
+        if violation is None:
+            yield linter_out_line, None, 0
+        else:
+            fingerprint_source = '\0'.join([
+                violation.filename,
+                _NUMBERS.sub('', linter_out_line),
+                _source_line(source_files, violation),
+            ])
+            fingerprint = hashlib.blake2b(fingerprint_source.encode('utf-8'), digest_size=8).digest()
+            yield linter_out_line, violation, int.from_bytes(fingerprint, 'little')
+
+
+def save_snapshot(
+    snapshot_file: str,
+    linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr],
+    parser: ViolationParser,
+) -> int:
+    """Write sorted fingerprints of violations to binary file.
+
+    File is 8 bytes header and little endian 64 bit fingerprints
+
+    :param snapshot_file: str
+    :param linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr]
+    :param parser: ViolationParser
+    :return: int, count of distinct fingerprints
+    """
+    fingerprints = sorted({
+        fingerprint
+        for _, violation, fingerprint in fingerprinted(linter_out, parser)
+        if violation is not None
+    })
+    Path(snapshot_file).write_bytes(b''.join([
+        _MAGIC,
+        *(struct.pack(_FINGERPRINT_FORMAT, fingerprint) for fingerprint in fingerprints),
+    ]))
+    return len(fingerprints)
+
+
+def load_snapshot(snapshot_file: str) -> BaselineSnapshot:
+    """Read fingerprints saved by save_snapshot.
+
+    :param snapshot_file: str
+    :return: BaselineSnapshot
+    :raises BaselineSnapshotError: file not found or not snapshot
+    """
+    try:
+        snapshot = Path(snapshot_file).read_bytes()
+    except OSError as err:
+        raise BaselineSnapshotError from err
+    packed_fingerprints = snapshot[len(_MAGIC):]
+    partial_fingerprint = len(packed_fingerprints) % struct.calcsize(_FINGERPRINT_FORMAT)
+    if not snapshot.startswith(_MAGIC) or partial_fingerprint:
+        raise BaselineSnapshotError
+    return BaselineSnapshot(frozenset(
+        unpacked[0]
+        for unpacked in struct.iter_unpack(_FINGERPRINT_FORMAT, packed_fingerprints)
+    ))
+
+
+def _source_line(source_files: dict[FileNameStr, list[str]], violation: Violation) -> str:
+    if violation.filename not in source_files:
+        source_files[violation.filename] = _file_lines(violation.filename)
+    file_lines = source_files[violation.filename]
+    if not 0 < violation.line_num <= len(file_lines):
+        return ''
+    return ' '.join(file_lines[violation.line_num - 1].split())
+
+
+def _file_lines(filename: FileNameStr) -> list[str]:
+    try:
+        return Path(local_filename(filename)).read_text(encoding='utf-8', errors='replace').splitlines()
+    except OSError:
+        return []
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Filtering of linter output without decoding for "--bytes"."""
+
+from __future__ import annotations
+
+import re
+import sys
+from collections.abc import Iterable, Iterator
+
+# _internal allow into ondivi app
+from ondivi._internal.changed_lines_index import ChangedLinesIndex  # noqa: WPS436
+from ondivi._internal.cli_options import CliOptions  # noqa: WPS436
+from ondivi._internal.linter_output import raw_lines, stripped_lines  # noqa: WPS436
+from ondivi._internal.ondivi_types import FileNameStr  # noqa: WPS436
+from ondivi._internal.presets import preset_bytes_pattern  # noqa: WPS436
+from ondivi._internal.repo_paths import normalized_filename  # noqa: WPS436
+from ondivi._internal.run_stats import STATS  # noqa: WPS436
+from ondivi._internal.write_output import write_raw_lines  # noqa: WPS436
+
+
+def bytes_output(options: CliOptions) -> bool:
+    """Filter lines of linter output as bytes and write kept lines as is.
+
+    :param options: CliOptions
+    :return: bool, violation found
+    """
+    conflict_option = options.bytes_conflict()
+    if conflict_option:
+        sys.stderr.write('Option "{0}" can not be used with "--bytes"'.format(conflict_option))
+        sys.exit(2)
+    if not options.preset:
+        sys.stderr.write('Option "--bytes" requires "--preset"')
+        sys.exit(2)
+    changed_lines = options.changed_lines()
+    with raw_lines(options.fromfile) as linter_output, STATS.stage('output'):
+        return write_raw_lines(
+            STATS.timed(
+                'filter_out_violations',
+                bytes_lines_for_out(
+                    changed_lines,
+                    stripped_lines(STATS.timed('read_linter_output', linter_output, 'input_lines')),
+                    preset_bytes_pattern(options.preset),
+                    options.only_violations,
+                ),
+                'kept_lines',
+            ),
+            flush_lines=options.stream,
+        )
+
+
+def bytes_lines_for_out(
+    changed_lines: ChangedLinesIndex,
+    linter_out: Iterable[bytes],
+    pattern: re.Pattern[bytes],
+    only_violations: bool,
+) -> Iterator[tuple[bytes, bool]]:
+    """Lazy filter target violations of not decoded lines.
+
+    Filename decoded and normalized once for every distinct filename,
+    other parts of line never decoded
+
+    :param changed_lines: ChangedLinesIndex
+    :param linter_out: Iterable[bytes], lines without line endings
+    :param pattern: re.Pattern[bytes], see preset_bytes_pattern
+    :param only_violations: bool
+    :yields: tuple[bytes, bool], line for out and violation flag
+    """
+    filenames: dict[bytes, FileNameStr] = {}
+    for linter_out_line in linter_out:
+        match = pattern.match(linter_out_line)
+        if match is None:
+            if not only_violations:
+                yield linter_out_line, False
+            continue
+        raw_filename = match['filename']
+        if raw_filename not in filenames:
+            filenames[raw_filename] = normalized_filename(raw_filename.decode('utf-8', errors='replace'))
+        if changed_lines.contains(filenames[raw_filename], int(match['line_num'])):
+            yield linter_out_line, True
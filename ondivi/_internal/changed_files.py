@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Changed files for "ondivi files"."""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterator
+from fnmatch import fnmatch
+from pathlib import PurePath
+
+# _internal allow into ondivi app
+from ondivi._internal.changed_lines_index import ChangedLinesIndex  # noqa: WPS436
+from ondivi._internal.ondivi_types import FileNameStr, LinesRange  # noqa: WPS436
+from ondivi._internal.repo_paths import local_filename  # noqa: WPS436
+
+
+def changed_files(
+    changed_lines: ChangedLinesIndex,
+    extensions: Collection[str],
+    globs: Collection[str],
+) -> dict[FileNameStr, list[LinesRange]]:
+    """Files with added or modified lines, deleted files and files with only removed lines skipped.
+
+    :param changed_lines: ChangedLinesIndex
+    :param extensions: Collection[str], extensions with or without dot, empty for any extension
+    :param globs: Collection[str], glob patterns of paths relative to repository root, empty for any path
+    :return: dict[FileNameStr, list[LinesRange]], changed ranges by file
+    """
+    suffixes = {'.{0}'.format(extension.lstrip('.')) for extension in extensions}
+    return {
+        filename: file_ranges
+        for filename, file_ranges in changed_lines.ranges().items()
+        if file_ranges and _matched(PurePath(filename), suffixes, globs)
+    }
+
+
+def files_lines(files: dict[FileNameStr, list[LinesRange]], with_ranges: bool) -> Iterator[str]:
+    """Paths relative to current directory for linter command.
+
+    >>> list(files_lines({'file.py': [(1, 3), (7, 7)]}, with_ranges=True))
+    ['file.py:1-3,7']
+
+    :param files: dict[FileNameStr, list[LinesRange]]
+    :param with_ranges: bool, add changed ranges after path
+    :yields: str
+    """
+    for filename, file_ranges in files.items():
+        path = local_filename(filename)
+        if with_ranges:
+            yield '{0}:{1}'.format(path, ','.join(map(_range_text, file_ranges)))
+        else:
+            yield path
+
+
+def _matched(path: PurePath, suffixes: Collection[str], globs: Collection[str]) -> bool:
+    if suffixes and path.suffix not in suffixes:
+        return False
+    posix_path = path.as_posix()
+    return not globs or any(fnmatch(posix_path, glob) for glob in globs)
+
+
+def _range_text(lines_range: LinesRange) -> str:
+    start, end = lines_range
+    if start == end:
+        return str(start)
+    return '{0}-{1}'.format(start, end)
@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Index of changed lines."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# _internal allow into ondivi app
+from ondivi._internal.ondivi_types import ChangedLinesDict, FileNameStr, LinesRange  # noqa: WPS436
+
+
+@dataclass(frozen=True)
+class ChangedLinesIndex:
+    """Changed lines of each file as sorted merged ranges.
+
+    Lookup of line is binary search by range starts, O(log h) for h ranges in file
+    """
+
+    _starts: dict[FileNameStr, list[int]]
+    _ends: dict[FileNameStr, list[int]]
+
+    def contains(self, filename: FileNameStr, line_num: int) -> bool:
+        """Line changed.
+
+        :param filename: FileNameStr
+        :param line_num: int
+        :return: bool
+        """
+        starts = self._starts.get(filename)
+        if starts is None:
+            return False
+        range_idx = bisect_right(starts, line_num) - 1
+        return range_idx >= 0 and line_num <= self._ends[filename][range_idx]
+
+    def overlaps(self, filename: FileNameStr, first_line: int, last_line: int) -> bool:
+        """Any line of range changed.
+
+        Last range started before end of checked range is only candidate, ranges not overlapped
+
+        :param filename: FileNameStr
+        :param first_line: int
+        :param last_line: int, inclusive
+        :return: bool
+        """
+        starts = self._starts.get(filename)
+        if starts is None:
+            return False
+        range_idx = bisect_right(starts, last_line) - 1
+        return range_idx >= 0 and first_line <= self._ends[filename][range_idx]
+
+    def widened(self, context: int) -> ChangedLinesIndex:
+        """Index with ranges widened by lines before and after them.
+
+        Widened ranges merged, so lookup not depend on context size
+
+        >>> index_from_ranges({'file.py': [(3, 3), (8, 9)]}).widened(2).ranges()
+        {'file.py': [(1, 11)]}
+
+        :param context: int, count of lines, less than 1 for index as is
+        :return: ChangedLinesIndex
+        """
+        if context < 1:
+            return self
+        return index_from_ranges({
+            filename: [
+                (max(start - context, 1), end + context)
+                for start, end in zip(starts, self._ends[filename], strict=True)
+            ]
+            for filename, starts in self._starts.items()
+        })
+
+    def ranges(self) -> dict[FileNameStr, list[LinesRange]]:
+        """Changed ranges of each file.
+
+        :return: dict[FileNameStr, list[LinesRange]]
+        """
+        return {
+            filename: list(zip(starts, self._ends[filename], strict=True))
+            for filename, starts in self._starts.items()
+        }
+
+    def as_dict(self) -> ChangedLinesDict:
+        """Changed lines in form of dict with list of lines for each file.
+
+        :return: ChangedLinesDict
+        """
+        return {
+            filename: [
+                line_num
+                for start, end in file_ranges
+                for line_num in range(start, end + 1)
+            ]
+            for filename, file_ranges in self.ranges().items()
+        }
+
+
+def index_from_ranges(ranges: dict[FileNameStr, list[LinesRange]]) -> ChangedLinesIndex:
+    """Build index merging overlapped and adjacent ranges.
+
+    >>> index_from_ranges({'file.py': [(5, 7), (1, 2), (3, 3)]}).ranges()
+    {'file.py': [(1, 3), (5, 7)]}
+
+    :param ranges: dict[FileNameStr, list[LinesRange]], ranges with inclusive ends
+    :return: ChangedLinesIndex
+    """
+    merged = {
+        filename: _merged_ranges(file_ranges)
+        for filename, file_ranges in ranges.items()
+    }
+    return ChangedLinesIndex(
+        {filename: [start for start, _ in file_ranges] for filename, file_ranges in merged.items()},
+        {filename: [end for _, end in file_ranges] for filename, file_ranges in merged.items()},
+    )
+
+
+def index_from_lines(changed_lines: ChangedLinesDict) -> ChangedLinesIndex:
+    """Build index from dict with list of lines for each file.
+
+    :param changed_lines: ChangedLinesDict
+    :return: ChangedLinesIndex
+    """
+    return index_from_ranges({
+        filename: [(line_num, line_num) for line_num in lines]
+        for filename, lines in changed_lines.items()
+    })
+
+
+def _merged_ranges(ranges: Iterable[LinesRange]) -> list[LinesRange]:
+    merged: list[LinesRange] = []
+    for start, end in sorted(ranges):
+        if end < start:
+            continue
+        if merged and start <= merged[-1][1] + 1:
+            prev_start, prev_end = merged.pop()
+            merged.append((prev_start, max(prev_end, end)))
+        else:
+            merged.append((start, end))
+    return merged
@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Options of command line interface."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Collection
+from dataclasses import dataclass
+from pathlib import Path
+
+from ondivi._internal.changed_lines_index import ChangedLinesIndex
+from ondivi._internal.compiled_format import compile_format
+from ondivi._internal.define_changed_lines import index_from_diff_lines
+from ondivi._internal.detect_format import AUTO_FORMAT, auto_candidates, detected_parser
+from ondivi._internal.diff_cache import cached_index
+from ondivi._internal.exceptions import BaselineSnapshotError, FromFileNotFoundError, InvalidInputError
+from ondivi._internal.git_diff import git_diff_lines
+from ondivi._internal.input_names import TEXT_INPUT, named_input_lines, named_input_parser
+from ondivi._internal.linter_output import linter_output_lines, linter_output_stream
+from ondivi._internal.ondivi_types import (
+    BaselineStr,
+    FromFilePathStr,
+    LinterAdditionalMessageStr,
+    ViolationFormatStr,
+    ViolationParser,
+    ViolationStr,
+)
+from ondivi._internal.output_formats import TEXT_OUTPUT
+from ondivi._internal.presets import preset_format
+from ondivi._internal.run_stats import STATS, stats_report
+
+
+@dataclass(frozen=True)
+class CliOptions:
+    """Options of command line interface."""
+
+    baseline: BaselineStr
+    fromfile: FromFilePathStr | None
+    violation_format: ViolationFormatStr
+    only_violations: bool
+    random_additional: int | None
+    stream: bool
+    preset: str | None = None
+    format_candidates: tuple[str, ...] = ()
+    jobs: int = 1
+    diff_linted_files: bool = False
+    no_cache: bool = False
+    input_format: str = TEXT_INPUT
+    output_format: str = TEXT_OUTPUT
+    stats: bool = False
+    stats_file: str | None = None
+    profile_cpu: str | None = None
+    profile_memory: str | None = None
+    inputs: tuple[str, ...] = ()
+    context: int = 0
+    save_baseline: str | None = None
+    against_baseline: str | None = None
+    raw_bytes: bool = False
+
+    def linter_output(self) -> list[ViolationStr | LinterAdditionalMessageStr]:
+        """Lines of linter output, line for every result of JSON document.
+
+        :return: list[ViolationStr | LinterAdditionalMessageStr]
+        """
+        with STATS.stage('read_linter_output'):
+            linter_output = self.read_linter_output()
+        STATS.count('input_lines', len(linter_output))
+        return linter_output
+
+    def parser(self, sample: list[str]) -> ViolationParser:
+        """Parser of linter lines, JSON input format and built-in preset have priority over template.
+
+        :param sample: list[str], first lines of linter output for detect format
+        :return: ViolationParser
+        """
+        if self.input_format != TEXT_INPUT:
+            return named_input_parser(self.input_format)
+        if self.preset:
+            return preset_format(self.preset)
+        if self.violation_format == AUTO_FORMAT:
+            return detected_parser(sample, auto_candidates(self.format_candidates))
+        return compile_format(self.violation_format)
+
+    def changed_lines(self, filenames: Collection[str] | None = None) -> ChangedLinesIndex:
+        """Changed lines index of diff with baseline.
+
+        :param filenames: Collection[str] | None, restrict diff to files, None for whole tree
+        :return: ChangedLinesIndex
+        """
+        # Stage time is time of cache lookup, git diff and diff parsing are nested stages
+        with STATS.stage('changed_lines'):
+            if self.no_cache:
+                changed_lines = index_from_diff_lines(git_diff_lines(self.baseline, filenames))
+            else:
+                changed_lines = cached_index(self.baseline, filenames)
+        # Counted by index, so reported for index from cache too
+        changed_ranges = changed_lines.ranges()
+        STATS.count('diff_files', len(changed_ranges))
+        STATS.count('diff_hunks', sum(map(len, changed_ranges.values())))
+        return changed_lines.widened(self.context)
+
+    def error_message(self, error: Exception) -> str:
+        """Message for not found linter output, revision or baseline snapshot and for invalid linter output.
+
+        :param error: Exception
+        :return: str
+        """
+        if isinstance(error, FromFileNotFoundError):
+            return 'File with violations "{0}" not found\n'.format(self.fromfile)
+        if isinstance(error, InvalidInputError):
+            return 'Linter output is not valid "{0}" document'.format(self.input_format)
+        if isinstance(error, BaselineSnapshotError):
+            return 'Baseline snapshot "{0}" not found or invalid'.format(self.against_baseline)
+        return 'Revision "{0}" not found'.format(self.baseline)
+
+    def stream_conflict(self) -> str | None:
+        """Option which can not be used with stream mode.
+
+        :return: str | None
+        """
+        if self.random_additional is not None:
+            return '--random-additional'
+        if self.diff_linted_files:
+            return '--diff-linted-files'
+        if self.inputs:
+            return '--input'
+        if self.save_baseline:
+            return '--save-baseline'
+        return None
+
+    def bytes_conflict(self) -> str | None:
+        """Option which can not be used with filtering of not decoded lines.
+
+        :return: str | None
+        """
+        conflicts = {
+            '--input-format': self.input_format != TEXT_INPUT,
+            '--output-format': self.output_format != TEXT_OUTPUT,
+            '--jobs': self.jobs != 1,
+            '--against-baseline': self.against_baseline is not None,
+        }
+        conflict_options = (option for option, conflict in conflicts.items() if conflict)
+        return self.stream_conflict() or next(conflict_options, None)
+
+    def read_linter_output(self) -> list[ViolationStr | LinterAdditionalMessageStr]:
+        """Lines of linter output without stats, outputs of "--input" read by threads.
+
+        :return: list[ViolationStr | LinterAdditionalMessageStr]
+        """
+        if self.input_format == TEXT_INPUT:
+            return linter_output_lines(self.fromfile)
+        with linter_output_stream(self.fromfile) as linter_output:
+            return list(named_input_lines(linter_output, self.input_format))
+
+
+def write_stats(options: CliOptions) -> None:
+    """Write stats of run to stderr and to JSON file.
+
+    :param options: CliOptions
+    """
+    if options.stats:
+        sys.stderr.write(stats_report(STATS))
+    if options.stats_file:
+        import json  # noqa: WPS433, PLC0415 . Not needed without "--stats-file"
+        stats_json = json.dumps(STATS.as_dict(), indent=2)
+        Path(options.stats_file).write_text('{0}\n'.format(stats_json), encoding='utf-8')
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Filtering of linter output by command line options."""
+
+from __future__ import annotations
+
+import codecs
+import sys
+from collections.abc import Collection, Iterable, Iterator
+
+from ondivi._internal.baseline_snapshot import load_snapshot, save_snapshot
+from ondivi._internal.bytes_pipeline import bytes_output
+from ondivi._internal.cli_options import CliOptions
+from ondivi._internal.define_additional import valid_size, with_additional
+from ondivi._internal.detect_format import AUTO_FORMAT, SAMPLE_SIZE, sampled
+from ondivi._internal.filter_out_violations import parallel_lines_for_out
+from ondivi._internal.input_names import TEXT_INPUT, named_input_lines
+from ondivi._internal.linter_inputs import filtered_inputs
+from ondivi._internal.linter_output import linted_files, linter_output_stream, raw_lines, stripped_lines
+from ondivi._internal.ondivi_types import LinterAdditionalMessageStr, Violation, ViolationParser, ViolationStr
+from ondivi._internal.output_formats import OUTPUT_FORMATS
+from ondivi._internal.run_stats import STATS
+from ondivi._internal.write_output import write_stream
+
+
+def filtered_output(options: CliOptions) -> bool:
+    """Filter linter output in mode of options.
+
+    :param options: CliOptions
+    :return: bool, violation found
+    """
+    if options.context < 0:
+        sys.stderr.write('Invalid "--context" value. Expected not negative integer got: "{0}"'.format(options.context))
+        sys.exit(2)
+    if options.raw_bytes:
+        return bytes_output(options)
+    if options.stream:
+        return stream_output(options)
+    return batch_output(options)
+
+
+def batch_output(options: CliOptions) -> bool:
+    """Read linter output, filter it and print kept lines.
+
+    File with violations read lazily if whole output not needed, see "raw_lines"
+
+    :param options: CliOptions
+    :return: bool, violation found
+    """
+    if options.inputs:
+        if options.save_baseline or options.against_baseline:
+            sys.stderr.write('Option "--input" can not be used with baseline snapshot')
+            sys.exit(2)
+        return filtered_inputs(options)
+    if options.fromfile and options.input_format == TEXT_INPUT and options.stream_conflict() is None:
+        with raw_lines(options.fromfile) as raw_output:
+            return _lazy_output(options, stripped_lines(codecs.iterdecode(raw_output, 'utf-8')), flush_lines=False)
+    linter_output = options.linter_output()
+    parser = options.parser(linter_output[:SAMPLE_SIZE])
+    if options.save_baseline:
+        return _saved_baseline(options.save_baseline, linter_output, parser)
+    return _batch_written(options, linter_output, parser)
+
+
+def stream_output(options: CliOptions) -> bool:
+    """Filter linter output line by line and print each kept line immediately.
+
+    :param options: CliOptions
+    :return: bool, violation found
+    """
+    conflict_option = options.stream_conflict()
+    if conflict_option:
+        sys.stderr.write('Option "{0}" can not be used with "--stream"'.format(conflict_option))
+        sys.exit(2)
+    with linter_output_stream(options.fromfile) as linter_output:
+        return _lazy_output(options, named_input_lines(linter_output, options.input_format), flush_lines=True)
+
+
+def _lazy_output(
+    options: CliOptions,
+    linter_output: Iterable[ViolationStr | LinterAdditionalMessageStr],
+    *,
+    flush_lines: bool,
+) -> bool:
+    sample, linter_output_lines_stream = sampled(
+        STATS.timed('read_linter_output', linter_output, 'input_lines'),
+        SAMPLE_SIZE if options.violation_format == AUTO_FORMAT else 0,
+    )
+    with STATS.stage('output'):
+        return write_stream(
+            STATS.timed(
+                'filter_out_violations',
+                _lines_for_out(options, linter_output_lines_stream, options.parser(sample)),
+                'kept_lines',
+            ),
+            OUTPUT_FORMATS[options.output_format],
+            flush_lines=flush_lines,
+        )
+
+
+def _saved_baseline(
+    snapshot_file: str,
+    linter_output: list[ViolationStr | LinterAdditionalMessageStr],
+    parser: ViolationParser,
+) -> bool:
+    with STATS.stage('save_baseline'):
+        fingerprints_count = save_snapshot(snapshot_file, linter_output, STATS.counted(parser))
+    sys.stderr.write('{0} violation(s) saved to "{1}"\n'.format(fingerprints_count, snapshot_file))
+    return False
+
+
+def _batch_written(
+    options: CliOptions,
+    linter_output: list[ViolationStr | LinterAdditionalMessageStr],
+    parser: ViolationParser,
+) -> bool:
+    lines_for_out = STATS.timed(
+        'filter_out_violations',
+        _lines_for_out(
+            options,
+            linter_output,
+            parser,
+            linted_files(linter_output, parser) if options.diff_linted_files else None,
+        ),
+        'kept_lines',
+    )
+    if options.random_additional is None:
+        with STATS.stage('output'):
+            return write_stream(lines_for_out, OUTPUT_FORMATS[options.output_format], flush_lines=False)
+    lines_with_additional, violation_found = with_additional(
+        lines_for_out,
+        linter_output,
+        parser,
+        valid_size(options.random_additional),
+    )
+    with STATS.stage('output'):
+        write_stream(lines_with_additional, OUTPUT_FORMATS[options.output_format], flush_lines=False)
+    return violation_found
+
+
+def _lines_for_out(
+    options: CliOptions,
+    linter_output: Iterable[ViolationStr | LinterAdditionalMessageStr],
+    parser: ViolationParser,
+    diff_filenames: Collection[str] | None = None,
+) -> Iterator[tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None]]:
+    if options.against_baseline:
+        with STATS.stage('load_baseline'):
+            snapshot = load_snapshot(options.against_baseline)
+        return snapshot.lines_for_out(linter_output, STATS.counted(parser), options.only_violations)
+    return parallel_lines_for_out(
+        options.changed_lines(diff_filenames),
+        linter_output,
+        STATS.counted(parser),
+        options.only_violations,
+        options.jobs,
+    )
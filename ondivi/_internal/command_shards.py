@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Changed files split to linter commands for "ondivi run"."""
+
+from __future__ import annotations
+
+import heapq
+import sys
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+FILES_PLACEHOLDER = '{files}'
+_WINDOWS_COMMAND_SIZE_LIMIT = 32_000
+_COMMAND_SIZE_LIMIT = 131_072
+# Characters of command line, Windows limit is 32767, other platforms limit arguments and environment together
+COMMAND_SIZE_LIMIT = _WINDOWS_COMMAND_SIZE_LIMIT if sys.platform == 'win32' else _COMMAND_SIZE_LIMIT
+
+
+def balanced_shards(paths: Iterable[str], shards_count: int) -> list[list[str]]:
+    """Paths split to shards with near equal total size of files.
+
+    Largest file placed to shard with least total size first
+
+    :param paths: Iterable[str]
+    :param shards_count: int
+    :return: list[list[str]], not empty shards
+    """
+    shards: list[list[str]] = [[] for _ in range(shards_count)]
+    shard_sizes = [(0, shard_idx) for shard_idx in range(shards_count)]
+    sized_paths = sorted(((_file_size(path), path) for path in paths), reverse=True)
+    for file_size, path in sized_paths:
+        _place(shards, shard_sizes, path, file_size)
+    return [shard for shard in shards if shard]
+
+
+def shard_command(command: Sequence[str], paths: list[str]) -> list[str]:
+    """Linter command for shard.
+
+    >>> shard_command(['flake8', '{files}', '--count'], ['a.py', 'b.py'])
+    ['flake8', 'a.py', 'b.py', '--count']
+
+    :param command: Sequence[str], paths added to the end without "{files}" argument
+    :param paths: list[str]
+    :return: list[str]
+    """
+    if FILES_PLACEHOLDER not in command:
+        return [*command, *paths]
+    shard_args: list[str] = []
+    for command_arg in command:
+        if command_arg == FILES_PLACEHOLDER:
+            shard_args.extend(paths)
+        else:
+            shard_args.append(command_arg)
+    return shard_args
+
+
+def shard_commands(command: Sequence[str], paths: list[str]) -> list[list[str]]:
+    """Linter commands for shard, paths split to several commands longer than COMMAND_SIZE_LIMIT.
+
+    :param command: Sequence[str], see shard_command
+    :param paths: list[str]
+    :return: list[list[str]]
+    """
+    command_size = sum(len(command_arg) + 1 for command_arg in command)
+    commands_paths: list[list[str]] = [[]]
+    size = command_size
+    for path in paths:
+        path_size = len(path) + 1
+        if commands_paths[-1] and size + path_size > COMMAND_SIZE_LIMIT:
+            commands_paths.append([])
+            size = command_size
+        commands_paths[-1].append(path)
+        size += path_size
+    return [shard_command(command, command_paths) for command_paths in commands_paths]
+
+
+def _place(
+    shards: list[list[str]],
+    shard_sizes: list[tuple[int, int]],
+    path: str,
+    file_size: int,
+) -> None:
+    shard_size, shard_idx = heapq.heappop(shard_sizes)
+    shards[shard_idx].append(path)
+    heapq.heappush(shard_sizes, (shard_size + file_size, shard_idx))
+
+
+def _file_size(path: str) -> int:
+    try:
+        return Path(path).stat().st_size
+    except OSError:
+        return 0
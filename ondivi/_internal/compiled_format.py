@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Linter message format compiled once for all lines."""
+
+from __future__ import annotations
+
+import re
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import lru_cache
+
+from parse import Parser  # type: ignore [import-untyped]
+from parse import compile as compile_pattern
+
+# _internal allow into ondivi app
+from ondivi._internal.ondivi_types import (  # noqa: WPS436
+    LinterAdditionalMessageStr,
+    ParsedViolation,
+    Violation,
+    ViolationFormatStr,
+    ViolationParser,
+    ViolationStr,
+)
+from ondivi._internal.repo_paths import normalized_filename  # noqa: WPS436
+
+DEFAULT_FORMAT = '{filename}:{line_num:d}{other}'
+_COMPILED_FORMATS_COUNT = 128
+
+
+@dataclass(frozen=True)
+class CompiledFormat:
+    """Compiled template for parsing linter messages.
+
+    Template compiles once, every linter line parses exactly once
+    """
+
+    _parser: Parser
+    _directory: str | None = None
+
+    def violation(self, raw_line: ViolationStr | LinterAdditionalMessageStr) -> Violation | None:
+        """Parse linter line.
+
+        :param raw_line: ViolationStr | LinterAdditionalMessageStr
+        :return: Violation | None, None for lines without violation
+        """
+        prsd: ParsedViolation | None = self._parser.parse(raw_line)
+        if prsd is None:
+            return None
+        # Template without ":d" conversion gives string, line without number is not violation
+        with suppress(ValueError):
+            line_num = int(prsd['line_num'])
+            return Violation(normalized_filename(prsd['filename'], self._directory), line_num)
+        return None
+
+
+@dataclass(frozen=True)
+class RegexFormat:
+    """Regular expression for parsing linter messages.
+
+    Expression must contain "filename" and "line_num" named groups
+    and matched from start of line
+    """
+
+    _pattern: re.Pattern[str]
+    _directory: str | None = None
+
+    def violation(self, raw_line: ViolationStr | LinterAdditionalMessageStr) -> Violation | None:
+        """Parse linter line.
+
+        :param raw_line: ViolationStr | LinterAdditionalMessageStr
+        :return: Violation | None, None for lines without violation
+        """
+        match = self._pattern.match(raw_line)
+        if match is None:
+            return None
+        filename = normalized_filename(match['filename'], self._directory)
+        return Violation(filename, int(match['line_num']))
+
+
+@lru_cache(maxsize=_COMPILED_FORMATS_COUNT)
+def compile_format(violation_format: ViolationFormatStr, directory: str | None = None) -> CompiledFormat:
+    """Compile template for parsing linter messages.
+
+    Compiled templates reused by long running process (see "ondivi serve")
+
+    :param violation_format: ViolationFormatStr
+    :param directory: str | None, see normalized_filename
+    :return: CompiledFormat
+    """
+    return CompiledFormat(compile_pattern(violation_format), directory)
+
+
+def violation_parser(violation_format: ViolationFormatStr | ViolationParser) -> ViolationParser:
+    """Parser for template or already compiled parser.
+
+    :param violation_format: ViolationFormatStr | ViolationParser
+    :return: ViolationParser
+    """
+    if isinstance(violation_format, str):
+        return compile_format(violation_format)
+    return violation_format
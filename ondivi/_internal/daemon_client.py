@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Client of ondivi daemon.
+
+Client send request header (JSON line with working directory and options)
+and linter output, daemon answer with frames of stdout, stderr and exit code.
+Options are fields of CliOptions or command line arguments of "ondivi-client",
+"stream" option required in both
+Each frame is header line with channel and payload size followed by payload
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import threading
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from typing import Any, BinaryIO
+
+# _internal allow into ondivi app
+from ondivi._internal.exceptions import DaemonUnavailableError  # noqa: WPS436
+
+SOCKET_ENV = 'ONDIVI_SOCKET'
+STDOUT_CHANNEL = b'o'
+STDERR_CHANNEL = b'e'
+EXIT_CHANNEL = b'x'
+_CHUNK_SIZE = 65536
+
+RequestOptions = dict[str, Any]
+
+
+def socket_path() -> Path:
+    """Socket of daemon from "ONDIVI_SOCKET" environment variable or in temp directory.
+
+    :return: Path
+    :raises DaemonUnavailableError: unix sockets not supported
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise DaemonUnavailableError
+    env_path = os.environ.get(SOCKET_ENV)
+    if env_path:
+        return Path(env_path)
+    import tempfile  # noqa: WPS433, PLC0415 . Imports random, not needed on startup
+    return Path(tempfile.gettempdir()) / 'ondivi-{0}.sock'.format(os.getuid())
+
+
+def run_by_daemon(options: RequestOptions) -> None:
+    """Exit with code of daemon, return if daemon unavailable.
+
+    :param options: RequestOptions, fields of CliOptions
+    """
+    with suppress(DaemonUnavailableError):
+        sys.exit(daemon_exit_code(socket_path(), options))
+
+
+def daemon_exit_code(path: Path, options: RequestOptions) -> int:
+    """Send linter output to daemon and write answer to stdout and stderr.
+
+    :param path: Path, socket
+    :param options: RequestOptions, fields of CliOptions
+    :return: int, exit code
+    :raises DaemonUnavailableError: daemon not started
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError) as err:
+            raise DaemonUnavailableError from err
+        # Linter output sent in separate thread, so answer in "--stream" mode read concurrently
+        threading.Thread(target=_send_request, args=(connection, options), daemon=True).start()
+        with connection.makefile('rb') as reader:
+            return _received_exit_code(reader)
+
+
+def _send_request(connection: socket.socket, options: RequestOptions) -> None:
+    header = json.dumps({'cwd': str(Path.cwd()), 'options': options})
+    with suppress(OSError):
+        connection.sendall('{0}\n'.format(header).encode())
+        if options['fromfile'] is None:
+            for chunk in iter(partial(sys.stdin.read, _CHUNK_SIZE), ''):
+                connection.sendall(chunk.encode())
+        connection.shutdown(socket.SHUT_WR)
+
+
+def _received_exit_code(reader: BinaryIO) -> int:
+    for header in iter(reader.readline, b''):
+        channel = header[:1]
+        payload_size = int(header[1:])
+        if channel == EXIT_CHANNEL:
+            return payload_size
+        # Payload written as is, lines of "--bytes" not decoded
+        stream = sys.stdout if channel == STDOUT_CHANNEL else sys.stderr
+        stream.buffer.write(reader.read(payload_size))
+        stream.buffer.flush()
+    # Daemon closed connection without exit code
+    return 1
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Long running process for filtering without interpreter startup.
+
+Changed lines and compiled formats kept in memory between requests,
+see cached_index and compile_format. Protocol described in daemon_client
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import traceback
+from collections.abc import Callable
+from contextlib import ExitStack, redirect_stderr, redirect_stdout, suppress
+from pathlib import Path
+from typing import Any, BinaryIO, cast
+
+# _internal allow into ondivi app
+from ondivi._internal.daemon_client import (  # noqa: WPS436
+    EXIT_CHANNEL,
+    STDERR_CHANNEL,
+    STDOUT_CHANNEL,
+    RequestOptions,
+    socket_path,
+)
+from ondivi._internal.exceptions import DaemonUnavailableError  # noqa: WPS436
+
+_SOCKET_MODE = 0o600
+# Not JSON header, closed connection or header without options
+_INVALID_REQUEST_ERRORS = (ValueError, LookupError, TypeError, OSError)
+_INVALID_REQUEST_CODE = 2
+
+
+def serve(path: Path | None, handle_request: Callable[[RequestOptions], None]) -> None:
+    """Handle requests until interrupted, every connection in own thread.
+
+    Request handled in working directory of client with replaced stdin, stdout and stderr.
+    Working directory and standard streams shared by process, so requests received concurrently
+    and handled one by one. Linter output of request without "stream" option received before handling,
+    so slow linter of one client not delays others
+
+    :param path: Path | None, socket, None for daemon_client.socket_path
+    :param handle_request: Callable[[RequestOptions], None], filter linter output with CLI side effects
+    :raises DaemonUnavailableError: unix sockets not supported
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise DaemonUnavailableError
+    path = path or socket_path()
+    path.unlink(missing_ok=True)
+    handling = threading.Lock()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server, ExitStack() as stack:
+        stack.callback(path.unlink, missing_ok=True)
+        server.bind(str(path))
+        # Other users must not read files by request to daemon
+        path.chmod(_SOCKET_MODE)
+        server.listen()
+        while True:  # noqa: WPS457 . Serve until interrupted
+            connection, _ = server.accept()
+            threading.Thread(
+                target=_answer,
+                args=(connection, handle_request, handling),
+                daemon=True,
+            ).start()
+
+
+def _answer(
+    connection: socket.socket,
+    handle_request: Callable[[RequestOptions], None],
+    handling: threading.Lock,
+) -> None:
+    with connection, connection.makefile('rb') as reader:
+        try:
+            request, linter_output = _received_request(reader)
+        except _INVALID_REQUEST_ERRORS:
+            exit_code = _INVALID_REQUEST_CODE
+            with suppress(OSError):
+                _frames(connection, STDERR_CHANNEL).write('Invalid request')
+        else:
+            with handling:
+                exit_code = _redirected(request, linter_output, connection, handle_request)
+        with suppress(OSError):
+            connection.sendall(b'%b%d\n' % (EXIT_CHANNEL, exit_code))
+
+
+def _received_request(reader: BinaryIO) -> tuple[dict[str, Any], BinaryIO]:
+    request = json.loads(reader.readline())
+    if request['options']['stream']:
+        return request, reader
+    return request, io.BytesIO(reader.read())
+
+
+def _redirected(
+    request: dict[str, Any],
+    linter_output: BinaryIO,
+    connection: socket.socket,
+    handle_request: Callable[[RequestOptions], None],
+) -> int:
+    with ExitStack() as stack:
+        stdin = io.TextIOWrapper(linter_output, encoding='utf-8')
+        stack.callback(stdin.detach)
+        stack.callback(setattr, sys, 'stdin', sys.stdin)
+        sys.stdin = stdin
+        stack.enter_context(redirect_stdout(_frames(connection, STDOUT_CHANNEL)))
+        stack.enter_context(redirect_stderr(_frames(connection, STDERR_CHANNEL)))
+        return _handled(request, handle_request)
+
+
+def _handled(request: dict[str, Any], handle_request: Callable[[RequestOptions], None]) -> int:
+    try:  # noqa: WPS229 . Fail of chdir handled like fail of request
+        os.chdir(request['cwd'])
+        handle_request(request['options'])
+    except SystemExit as exit_error:
+        return int(exit_error.code or 0)
+    except Exception:  # noqa: BLE001 . Daemon serve next requests after fail
+        with suppress(OSError):
+            sys.stderr.write(traceback.format_exc())
+        return 1
+    return 0
+
+
+def _frames(connection: socket.socket, channel: bytes) -> io.TextIOWrapper:
+    """Text stream with "buffer" for bytes, like sys.stdout."""
+    frame_writer = cast('BinaryIO', _FrameWriter(connection, channel))
+    return io.TextIOWrapper(frame_writer, encoding='utf-8', write_through=True)
+
+
+class _FrameWriter(io.RawIOBase):
+    """Unbuffered, frames sent to client on every write."""
+
+    def __init__(self, connection: socket.socket, channel: bytes) -> None:
+        self._connection = connection
+        self._channel = channel
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, payload: bytes) -> int:  # type: ignore [override]
+        self._connection.sendall(b'%b%d\n%b' % (self._channel, len(payload), payload))
+        return len(payload)
@@ -1,11 +1,14 @@
 # SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
 # SPDX-License-Identifier: MIT
 
-import hashlib
-from random import Random
+from collections.abc import Iterable
+from typing import TypeAlias
 
 from ondivi._internal.exceptions import InvalidSizeError
-from ondivi._internal.ondivi_types import ValidAdditionalSize
+from ondivi._internal.ondivi_types import ValidAdditionalSize, Violation, ViolationParser
+from ondivi._internal.run_stats import STATS
+
+_LinesForOut: TypeAlias = list[tuple[str, Violation | None]]
 
 
 def valid_size(size: int) -> ValidAdditionalSize:
@@ -17,9 +20,28 @@ def valid_size(size: int) -> ValidAdditionalSize:
 def define_additional(linter_output: list[str], filtered_lines: list[str], size: ValidAdditionalSize) -> list[str]:
     if not linter_output:
         return []
+    # Imports deferred until used, they are not needed in hot path
+    import hashlib  # noqa: WPS433, PLC0415
+    from random import Random  # noqa: WPS433, PLC0415
     not_actual = sorted(set(linter_output) - set(filtered_lines))
     size = min(size, len(not_actual))
     hsh = hashlib.md5(  # noqa: S324
         ''.join(not_actual).encode('utf-8'),
     ).digest()[:4]
     return sorted(Random(hsh).sample(not_actual, k=size))  # noqa: S311
+
+
+def with_additional(
+    lines_for_out: Iterable[tuple[str, Violation | None]],
+    linter_output: list[str],
+    parser: ViolationParser,
+    size: ValidAdditionalSize,
+) -> tuple[_LinesForOut, bool]:
+    filtered_lines = list(lines_for_out)
+    with STATS.stage('define_additional'):
+        additional = define_additional(linter_output, [line for line, _ in filtered_lines], size)
+    return (
+        [*filtered_lines, *((line, parser.violation(line)) for line in additional)],
+        # Additional violations not affect exit code
+        any(violation is not None for _, violation in filtered_lines),
+    )
@@ -3,15 +3,29 @@
 
 """Define changed lines in file."""
 
-from pathlib import Path
+from collections.abc import Iterable
 
 # _internal allow into ondivi app
-from ondivi._internal.ondivi_types import DiffStr, FileNameStr  # noqa: WPS436
+from ondivi._internal.changed_lines_index import ChangedLinesIndex, index_from_ranges  # noqa: WPS436
+from ondivi._internal.ondivi_types import ChangedLinesDict, DiffStr, FileNameStr, LinesRange  # noqa: WPS436
+from ondivi._internal.repo_paths import diff_filename  # noqa: WPS436
+from ondivi._internal.run_stats import STATS  # noqa: WPS436
 
 
-def define_changed_lines(diff: DiffStr) -> dict[FileNameStr, list[int]]:
+def define_changed_lines(diff: DiffStr) -> ChangedLinesDict:
     """Define changed lines in file.
 
+    Lines listed for each file, prefer `define_changed_lines_index` for lookups
+
+    :param diff: DiffStr
+    :return: ChangedLinesDict
+    """
+    return define_changed_lines_index(diff).as_dict()
+
+
+def define_changed_lines_index(diff: DiffStr) -> ChangedLinesIndex:
+    """Define changed lines ranges in file.
+
     Example of diff:
 
     +---------------------------------------------------------------------+
@@ -19,29 +33,43 @@ def define_changed_lines(diff: DiffStr) -> dict[FileNameStr, list[int]]:
     | index 669d0ff..7a518fa 100644                                       |
     | --- a/ondivi/__main__.py                                            |
     | +++ b/ondivi/__main__.py                                            |
-    | @@ -26,0 +27,2 @@ from git import Repo                              | <- Changed lines = [27, 28]
+    | @@ -26,0 +27,2 @@ from git import Repo                              | <- Changed ranges = [(27, 28)]
     | +Diff = str                                                         |
     | +FileName = str                                                     |
-    | @@ -28 +30,2 @@ from git import Repo                                | <- Changed lines = [27, 28, 30, 31]
+    | @@ -28 +30,2 @@ from git import Repo                                | <- Changed ranges = [(27, 28), (30, 31)]
     | -def define_changed_lines(diff):                                    |
     | +                                                                   |
     | +def define_changed_lines(diff: Diff) -> dict[FileName, list[int]]: |
     +---------------------------------------------------------------------+
 
     :param diff: DiffStr
-    :return: dict[FileNameStr, list[int]]
+    :return: ChangedLinesIndex
+    """
+    return index_from_diff_lines(diff.splitlines())
+
+
+def index_from_diff_lines(diff_lines: Iterable[str]) -> ChangedLinesIndex:
+    """Define changed lines ranges from diff lines.
+
+    Lines consumed one by one, so diff may be read from stream
+
+    :param diff_lines: Iterable[str]
+    :return: ChangedLinesIndex
     """
-    changed_lines: dict[FileNameStr, list[int]] = {}
+    with STATS.stage('define_changed_lines'):
+        return index_from_ranges(_changed_ranges(diff_lines))
+
+
+def _changed_ranges(diff_lines: Iterable[str]) -> dict[FileNameStr, list[LinesRange]]:
+    changed_ranges: dict[FileNameStr, list[LinesRange]] = {}
     current_file = ''
-    for line in diff.splitlines():
+    for line in diff_lines:
         if _line_contain_filename(line):
-            current_file = str(
-                Path(line.split(' b/')[-1].strip()),
-            )
-            changed_lines[current_file] = []
+            current_file = diff_filename(line.split(' b/')[-1].strip())
+            changed_ranges[current_file] = []
         elif _diff_line_contain_changed_lines(line):
-            changed_lines[current_file].extend(_changed_lines(line))
-    return changed_lines
+            changed_ranges[current_file].append(_changed_range(line))
+    return changed_ranges
 
 
 def _line_contain_filename(diff_line: str) -> bool:
@@ -52,14 +80,16 @@ def _diff_line_contain_changed_lines(diff_line: str) -> bool:
     return diff_line.startswith('@@')
 
 
-def _changed_lines(diff_line: str) -> list[int]:
-    """Changed lines.
+def _changed_range(diff_line: str) -> LinesRange:
+    """Changed lines range.
+
+    >>> _changed_range('@@ -28 +30,2 @@ from git import Repo')
+    (30, 31)
 
-    >>> _changed_lines('@@ -28 +30,2 @@ from git import Repo')
-    [30, 31]
+    Range is empty (end < start) for hunks without added lines
 
     :param diff_line: str
-    :return: list[int]
+    :return: LinesRange
     """
     splitted_line = diff_line.split('@@')[1].strip()
     added_lines = splitted_line.split('+')[1]
@@ -69,6 +99,4 @@ def _changed_lines(diff_line: str) -> list[int]:
     num_lines = 0
     if ',' in added_lines:
         num_lines = int(added_lines.split(',')[1]) - 1
-    return list(range(
-        start_line, start_line + num_lines + 1,
-    ))
+    return start_line, start_line + num_lines
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Detect format of linter output."""
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain, islice
+
+# _internal allow into ondivi app
+from ondivi._internal.compiled_format import DEFAULT_FORMAT, compile_format  # noqa: WPS436
+from ondivi._internal.ondivi_types import (  # noqa: WPS436
+    LinterAdditionalMessageStr,
+    ViolationFormatStr,
+    ViolationParser,
+    ViolationStr,
+)
+from ondivi._internal.presets import PRESETS, preset_format  # noqa: WPS436
+
+AUTO_FORMAT = 'auto'
+SAMPLE_SIZE = 100
+
+
+def auto_candidates(templates: Sequence[ViolationFormatStr]) -> list[ViolationParser]:
+    """Candidates for detection.
+
+    Built-in presets first, they are faster than templates,
+    then default template and user templates
+
+    :param templates: Sequence[ViolationFormatStr], user templates
+    :return: list[ViolationParser]
+    """
+    return [
+        *(preset_format(preset) for preset in PRESETS),
+        *(compile_format(template) for template in (DEFAULT_FORMAT, *templates)),
+    ]
+
+
+def detected_parser(
+    sample: Sequence[ViolationStr | LinterAdditionalMessageStr],
+    candidates: Sequence[ViolationParser],
+) -> ViolationParser:
+    """Candidate with the best match rate on sample.
+
+    First candidate wins when match rates are equal.
+    Default template used when nothing matched
+
+    :param sample: Sequence[ViolationStr | LinterAdditionalMessageStr]
+    :param candidates: Sequence[ViolationParser]
+    :return: ViolationParser
+    """
+    scores = [
+        sum(candidate.violation(line) is not None for line in sample)
+        for candidate in candidates
+    ]
+    if not any(scores):
+        return compile_format(DEFAULT_FORMAT)
+    return candidates[scores.index(max(scores))]
+
+
+def sampled(
+    linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr],
+    sample_size: int,
+) -> tuple[list[ViolationStr | LinterAdditionalMessageStr], Iterator[ViolationStr | LinterAdditionalMessageStr]]:
+    """First lines of linter output and iterator over whole output.
+
+    Sample read ahead from stream, then returned lines chained back
+
+    :param linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr]
+    :param sample_size: int
+    :return: tuple[list[ViolationStr | LinterAdditionalMessageStr], Iterator[...]]
+    """
+    linter_out_iter = iter(linter_out)
+    sample = list(islice(linter_out_iter, sample_size))
+    return sample, chain(sample, linter_out_iter)
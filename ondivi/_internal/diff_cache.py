@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Cache of changed lines index in git directory."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Collection
+from contextlib import suppress
+from functools import lru_cache
+from pathlib import Path
+
+# _internal allow into ondivi app
+from ondivi._internal.changed_lines_index import ChangedLinesIndex, index_from_ranges  # noqa: WPS436
+from ondivi._internal.define_changed_lines import index_from_diff_lines  # noqa: WPS436
+from ondivi._internal.git_diff import git_diff_lines, git_output  # noqa: WPS436
+from ondivi._internal.ondivi_types import BaselineStr, FileNameStr  # noqa: WPS436
+
+CACHE_DIR = 'ondivi'
+# 16 MiB
+CACHE_SIZE_LIMIT = 16_777_216
+# Change on format of cache entries
+_CACHE_VERSION = 1
+_MEMORY_ENTRIES = 32
+
+
+def cached_index(baseline: BaselineStr, filenames: Collection[FileNameStr] | None = None) -> ChangedLinesIndex:
+    """Changed lines index from cache, git diff runs only on cache miss.
+
+    Cache stored in ".git/ondivi", entry keyed by resolved baseline and HEAD commits,
+    status, size and modification time of modified files and files for diff.
+    Least recently used entries evicted when size of cache exceeds CACHE_SIZE_LIMIT.
+    Recent entries also kept in memory for long running process (see "ondivi serve")
+
+    :param baseline: BaselineStr
+    :param filenames: Collection[FileNameStr] | None, restrict diff to files, None for whole tree
+    :return: ChangedLinesIndex
+    """
+    sorted_filenames = None if filenames is None else tuple(sorted(filenames))
+    return _entry_index(_cache_file(baseline, sorted_filenames), baseline, sorted_filenames)
+
+
+def _cache_file(baseline: BaselineStr, filenames: tuple[FileNameStr, ...] | None) -> Path:
+    import hashlib  # noqa: WPS433, PLC0415 . Not needed in hot path
+    import json  # noqa: WPS433, PLC0415 . Not needed in hot path
+    toplevel, git_dir, *commits = git_output([
+        'rev-parse', '--show-toplevel', '--absolute-git-dir', 'HEAD', baseline,
+    ]).splitlines()
+    key_source = json.dumps([
+        _CACHE_VERSION,
+        commits,
+        _modified_files(Path(toplevel)),
+        filenames,
+    ])
+    key = hashlib.sha256(key_source.encode()).hexdigest()
+    return Path(git_dir) / CACHE_DIR / '{0}.json'.format(key)
+
+
+@lru_cache(maxsize=_MEMORY_ENTRIES)
+def _entry_index(
+    cache_file: Path,
+    baseline: BaselineStr,
+    filenames: tuple[FileNameStr, ...] | None,
+) -> ChangedLinesIndex:
+    import json  # noqa: WPS433, PLC0415 . Not needed in hot path
+    with suppress(OSError, ValueError):
+        index = index_from_ranges(json.loads(cache_file.read_text(encoding='utf-8')))
+        # Entry of read only cache used without update of least recently used order
+        with suppress(OSError):
+            os.utime(cache_file)
+        return index
+    index = index_from_diff_lines(git_diff_lines(baseline, filenames))
+    with suppress(OSError):
+        _store(cache_file, json.dumps(index.ranges()))
+    return index
+
+
+def _modified_files(toplevel: Path) -> list[str]:
+    status_args = ['-C', str(toplevel), 'status', '--porcelain', '-z', '--untracked-files=no', '--no-renames']
+    return [
+        '{0} {1}'.format(entry, _file_stat(toplevel / entry[3:]))
+        for entry in git_output(status_args).split('\0')
+        if entry
+    ]
+
+
+def _file_stat(path: Path) -> str:
+    try:
+        file_stat = path.stat()
+    except OSError:
+        return 'deleted'
+    return '{0} {1}'.format(file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _store(cache_file: Path, serialized_index: str) -> None:
+    cache_file.parent.mkdir(exist_ok=True)
+    tmp_file = cache_file.with_suffix('.{0}.tmp'.format(os.getpid()))
+    tmp_file.write_text(serialized_index, encoding='utf-8')
+    tmp_file.replace(cache_file)
+    _evict(cache_file.parent)
+
+
+def _evict(cache_dir: Path) -> None:
+    cache_size = 0
+    entries = sorted(
+        ((entry, entry.stat()) for entry in cache_dir.glob('*.json')),
+        key=lambda entry_with_stat: entry_with_stat[1].st_mtime_ns,
+        reverse=True,
+    )
+    for entry, entry_stat in entries:
+        cache_size += entry_stat.st_size
+        if cache_size > CACHE_SIZE_LIMIT:
+            entry.unlink(missing_ok=True)
@@ -3,3 +3,27 @@
 
 class InvalidSizeError(Exception):
     """Invalid size error."""
+
+
+class FromFileNotFoundError(Exception):
+    """File with violations not found."""
+
+
+class RevisionNotFoundError(Exception):
+    """Baseline revision not found."""
+
+
+class DaemonUnavailableError(Exception):
+    """Daemon not started or not supported on platform."""
+
+
+class InvalidInputError(Exception):
+    """Linter output not match input format."""
+
+
+class BaselineSnapshotError(Exception):
+    """Baseline snapshot file not found or invalid."""
+
+
+class LinterFailedError(Exception):
+    """Linter exited with non-zero code without output."""
@@ -5,92 +5,153 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from pathlib import Path
-
-from parse import parse as parse_from_pattern  # type: ignore [import-untyped]
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice
+from typing import TypeAlias
 
 # _internal allow into ondivi app
+from ondivi._internal.changed_lines_index import ChangedLinesIndex, index_from_lines  # noqa: WPS436
+from ondivi._internal.compiled_format import violation_parser  # noqa: WPS436
 from ondivi._internal.ondivi_types import (  # noqa: WPS436
     ActualViolationsListStr,
-    FileNameStr,
+    ChangedLinesDict,
     LinterAdditionalMessageStr,
-    ParsedViolation,
+    Violation,
     ViolationFormatStr,
+    ViolationParser,
     ViolationStr,
 )
 
-
-@dataclass(frozen=True)
-class LinterOutLine:
-
-    _raw_line: ViolationStr | LinterAdditionalMessageStr
-    _violation_format: ViolationFormatStr
-
-    def line_num(self) -> int:
-        return self._parse()['line_num']
-
-    def filename(self) -> str:
-        return str(Path(
-            self._parse()['filename']
-            .replace('./', '')
-            .replace('\\', '/'),
-        ))
-
-    def violation_exist(self) -> bool:
-        return bool(self._parse())
-
-    def _parse(self) -> ParsedViolation:
-        prsd: ParsedViolation = parse_from_pattern(self._violation_format, self._raw_line)
-        return prsd
+# Pool start and pickling of chunks cost more than filtering of smaller output
+PARALLEL_THRESHOLD = 50_000
+CHUNK_SIZE = 10_000
+_CHUNKS_IN_FLIGHT_PER_JOB = 2
+_FilteredChunk: TypeAlias = list[tuple[str, Violation | None]]
+# Index, parser and flag set by pool initializer, pickled once per worker instead of once per chunk
+_worker_filter: dict[str, tuple[ChangedLinesIndex, ViolationParser, bool]] = {}
 
 
 def filter_out_violations(
-    changed_lines: dict[FileNameStr, list[int]],
+    changed_lines: ChangedLinesIndex | ChangedLinesDict,
     linter_out: list[ViolationStr | LinterAdditionalMessageStr],
-    violation_format: ViolationFormatStr,
+    violation_format: ViolationFormatStr | ViolationParser,
     only_violations: bool,
+    jobs: int = 1,
 ) -> tuple[ActualViolationsListStr, bool]:
     """Collect target violations.
 
-    :param changed_lines: dict[FileName, list[int]], violations: list[str]
+    :param changed_lines: ChangedLinesIndex | ChangedLinesDict
     :param linter_out: list[ViolationStr | LinterAdditionalMessageStr]
-    :param violation_format: ViolationFormatStr
+    :param violation_format: ViolationFormatStr | ViolationParser, template or already compiled parser
     :param only_violations: bool
+    :param jobs: int, count of worker processes, see parallel_lines_for_out
     :return: tuple[ActualViolationsListStr, bool]
     """
     filtered_violations = []
     violation_found = False
-    for linter_out_line in linter_out:
-        line_for_out, is_violation = _is_line_for_out(
-            changed_lines,
-            LinterOutLine(linter_out_line, violation_format),
-        )
-        violation_found = violation_found or is_violation
-        if is_violation or (line_for_out and not only_violations):
-            filtered_violations.append(linter_out_line)
+    for linter_out_line, violation in parallel_lines_for_out(
+        changed_lines if isinstance(changed_lines, ChangedLinesIndex) else index_from_lines(changed_lines),
+        linter_out,
+        violation_parser(violation_format),
+        only_violations,
+        jobs,
+    ):
+        violation_found = violation_found or violation is not None
+        filtered_violations.append(linter_out_line)
     return filtered_violations, violation_found
 
 
-def _is_line_for_out(
-    changed_lines: dict[FileNameStr, list[int]],
-    linter_out_line: LinterOutLine,
-) -> tuple[bool, bool]:
-    line_for_out, is_violation = True, True
-    if not linter_out_line.violation_exist():
-        line_for_out = True
-        is_violation = False
-    elif not _is_target_violation(changed_lines, linter_out_line):
-        line_for_out = False
-        is_violation = False
-    return line_for_out, is_violation
-
-
-def _is_target_violation(changed_lines: dict[FileNameStr, list[int]], linter_out_line: LinterOutLine) -> bool:
-    violation_file = linter_out_line.filename()
-    is_target_file = violation_file in changed_lines
-    try:
-        violation_on_changed_line = linter_out_line.line_num() in changed_lines[violation_file]
-    except KeyError:
-        violation_on_changed_line = False
-    return is_target_file and violation_on_changed_line
+def lines_for_out(
+    changed_lines: ChangedLinesIndex,
+    linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr],
+    parser: ViolationParser,
+    only_violations: bool,
+) -> Iterator[tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None]]:
+    """Lazy filter target violations.
+
+    Linter output consumed line by line, so memory not depend on it size
+
+    :param changed_lines: ChangedLinesIndex
+    :param linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr]
+    :param parser: ViolationParser
+    :param only_violations: bool
+    :yields: tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None], line for out and its violation
+    """
+    for linter_out_line in linter_out:
+        violation = parser.violation(linter_out_line)
+        if violation is None:
+            if not only_violations:
+                yield linter_out_line, None
+        elif changed_lines.overlaps(
+            violation.filename,
+            violation.line_num,
+            violation.end_line_num or violation.line_num,
+        ):
+            yield linter_out_line, violation
+
+
+def parallel_lines_for_out(
+    changed_lines: ChangedLinesIndex,
+    linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr],
+    parser: ViolationParser,
+    only_violations: bool,
+    jobs: int,
+) -> Iterator[tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None]]:
+    """Lazy filter target violations in process pool.
+
+    Linter output split by chunks, workers filter chunks with own copy of index and parser,
+    results yielded in original order. Output shorter than PARALLEL_THRESHOLD lines
+    filtered in current process
+
+    :param changed_lines: ChangedLinesIndex
+    :param linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr]
+    :param parser: ViolationParser, must be picklable
+    :param only_violations: bool
+    :param jobs: int, count of worker processes, less than 1 for all CPU cores
+    :yields: tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None], line for out and its violation
+    """
+    workers = jobs if jobs >= 1 else os.cpu_count() or 1
+    linter_out_iter = iter(linter_out)
+    head = list(islice(linter_out_iter, PARALLEL_THRESHOLD)) if workers > 1 else []
+    if len(head) < PARALLEL_THRESHOLD:
+        yield from lines_for_out(changed_lines, chain(head, linter_out_iter), parser, only_violations)
+        return
+    yield from _pool_lines_for_out(
+        (changed_lines, parser, only_violations),
+        chain(head, linter_out_iter),
+        workers,
+    )
+
+
+def _pool_lines_for_out(
+    worker_filter: tuple[ChangedLinesIndex, ViolationParser, bool],
+    linter_out: Iterator[str],
+    workers: int,
+) -> Iterator[tuple[str, Violation | None]]:
+    from concurrent.futures import Future, ProcessPoolExecutor  # noqa: WPS433, PLC0415 . Not needed in hot path
+    pending: deque[Future[_FilteredChunk]] = deque()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(worker_filter,)) as pool:
+        for chunk in _chunks(linter_out):
+            pending.append(pool.submit(_chunk_lines_for_out, chunk))
+            if len(pending) >= workers * _CHUNKS_IN_FLIGHT_PER_JOB:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _init_worker(worker_filter: tuple[ChangedLinesIndex, ViolationParser, bool]) -> None:
+    _worker_filter['current'] = worker_filter
+
+
+def _chunk_lines_for_out(chunk: list[str]) -> _FilteredChunk:
+    changed_lines, parser, only_violations = _worker_filter['current']
+    return list(lines_for_out(changed_lines, chunk, parser, only_violations))
+
+
+def _chunks(linter_out: Iterator[str]) -> Iterator[list[str]]:
+    chunk = list(islice(linter_out, CHUNK_SIZE))
+    while chunk:
+        yield chunk
+        chunk = list(islice(linter_out, CHUNK_SIZE))
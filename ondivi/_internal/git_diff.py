@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Diff of working tree with baseline."""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterator
+from os import PathLike
+from pathlib import PurePosixPath
+
+# _internal allow into ondivi app
+from ondivi._internal.exceptions import RevisionNotFoundError  # noqa: WPS436
+from ondivi._internal.ondivi_types import BaselineStr, FileNameStr  # noqa: WPS436
+from ondivi._internal.run_stats import STATS  # noqa: WPS436
+
+_HEADER_PREFIXES = (b'diff --git', b'@@')
+_DIFF_COMMAND = ('git', 'diff', '--unified=0', '--no-ext-diff', '--src-prefix=a/', '--dst-prefix=b/')
+# Pathspec matching nothing, diff still check baseline exists
+_NOTHING_PATHSPEC = ':(exclude)*'
+# Full diff faster than many git calls for more files
+PATHSPEC_FILES_LIMIT = 1000
+# Length of command line on windows limited by 32767 symbols
+_PATHSPEC_BATCH_LENGTH = 30000
+
+
+def git_diff_lines(
+    baseline: BaselineStr,
+    filenames: Collection[FileNameStr] | None = None,
+    repo: str | PathLike[str] | None = None,
+) -> Iterator[str]:
+    """Header lines of diff of working tree with baseline.
+
+    Diff read from git stdout line by line, only lines with filename
+    and changed lines ranges are decoded and yielded, so memory not depend on diff size.
+    Flags not depend on user git config (external diff tool, prefixes)
+
+    :param baseline: BaselineStr
+    :param filenames: Collection[FileNameStr] | None, restrict diff to files, None for whole tree
+    :param repo: str | PathLike[str] | None, directory of repository, None for current directory
+    :yields: str
+    """
+    for pathspecs in _pathspec_batches(filenames):
+        yield from STATS.timed('git_diff', _diff_lines(baseline, pathspecs, repo))
+
+
+def git_output(args: list[str]) -> str:
+    """Output of git command.
+
+    :param args: list[str], git arguments
+    :return: str
+    :raises RevisionNotFoundError: git command failed, for example baseline not found
+    """
+    import subprocess  # noqa: S404, WPS433, PLC0415 . Run git without shell, not needed on startup
+    git_proc = subprocess.run(  # noqa: S603 . Arguments is not shell command
+        ['git', *args],  # noqa: S607 . Git from PATH like for diff
+        capture_output=True,
+        check=False,
+    )
+    if git_proc.returncode:
+        raise RevisionNotFoundError
+    return git_proc.stdout.decode('utf-8', errors='surrogateescape')
+
+
+def _pathspec_batches(filenames: Collection[FileNameStr] | None) -> Iterator[list[str]]:
+    if filenames is None or _full_diff_required(filenames):
+        yield []
+        return
+    if not filenames:
+        yield [_NOTHING_PATHSPEC]
+        return
+    batch: list[str] = []
+    batch_length = 0
+    for filename in sorted(filenames):
+        pathspec = ':(top,literal){0}'.format(filename.replace('\\', '/'))
+        if batch and batch_length + len(pathspec) > _PATHSPEC_BATCH_LENGTH:
+            yield batch
+            batch, batch_length = [], 0
+        batch.append(pathspec)
+        batch_length += len(pathspec) + 1
+    yield batch
+
+
+def _full_diff_required(filenames: Collection[FileNameStr]) -> bool:
+    # Files outside of repository not allowed in pathspec
+    return len(filenames) > PATHSPEC_FILES_LIMIT or not all(map(_in_repo, filenames))
+
+
+def _in_repo(filename: FileNameStr) -> bool:
+    path = PurePosixPath(filename.replace('\\', '/'))
+    return not path.is_absolute() and '..' not in path.parts and ':' not in filename
+
+
+def _diff_lines(
+    baseline: BaselineStr,
+    pathspecs: list[str],
+    repo: str | PathLike[str] | None,
+) -> Iterator[str]:
+    import subprocess  # noqa: S404, WPS433, PLC0415 . Run git without shell, not needed on startup
+    with subprocess.Popen(  # noqa: S603 . Arguments is not shell command
+        [*_DIFF_COMMAND, baseline, '--', *pathspecs],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        cwd=repo,
+    ) as proc:
+        for diff_line in proc.stdout:  # type: ignore [union-attr]
+            if diff_line.startswith(_HEADER_PREFIXES):
+                yield diff_line.decode('utf-8', errors='replace')
+        if proc.wait():
+            raise RevisionNotFoundError
@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Structured (JSON, SARIF) linter output.
+
+Every result converted to one JSON line, so results filtered and printed
+like lines of text output. Original objects preserved in lines
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Any, TextIO
+
+from ondivi._internal.exceptions import InvalidInputError  # noqa: WPS436
+from ondivi._internal.input_names import TEXT_INPUT  # noqa: WPS436
+from ondivi._internal.json_stream import ANY_ELEMENT, JsonStream, found  # noqa: WPS436
+from ondivi._internal.linter_output import stripped_lines  # noqa: WPS436
+from ondivi._internal.ondivi_types import (  # noqa: WPS436
+    FileNameStr,
+    InputFormatStr,
+    LinterAdditionalMessageStr,
+    Violation,
+    ViolationStr,
+)
+
+# _internal allow into ondivi app
+from ondivi._internal.repo_paths import normalized_filename  # noqa: WPS436
+
+_JSON_LINES_INPUT = 'json-lines'
+_ESLINT_INPUT = 'eslint-json'
+
+_JsonPath = tuple[str | int, ...]
+
+
+@dataclass(frozen=True)
+class JsonShape:
+    """Paths to location fields in JSON object of violation."""
+
+    filename: _JsonPath
+    line_num: _JsonPath
+    end_line_num: _JsonPath
+
+
+@dataclass(frozen=True)
+class JsonFormat:
+    """Parser of JSON lines.
+
+    First shape with filename and line number wins,
+    lines with invalid JSON or without location are not violations
+    """
+
+    _shapes: tuple[JsonShape, ...]
+    _directory: str | None = None
+
+    def violation(self, raw_line: ViolationStr | LinterAdditionalMessageStr) -> Violation | None:
+        """Parse JSON line.
+
+        :param raw_line: ViolationStr | LinterAdditionalMessageStr
+        :return: Violation | None, None for lines without violation
+        """
+        try:
+            document = json.loads(raw_line)
+        except ValueError:
+            return None
+        for shape in self._shapes:
+            filename = _field(document, shape.filename)
+            line_num = _field(document, shape.line_num)
+            if isinstance(filename, str) and isinstance(line_num, int):
+                end_line_num = _field(document, shape.end_line_num)
+                return Violation(
+                    _local_filename(filename, self._directory),
+                    line_num,
+                    end_line_num if isinstance(end_line_num, int) else None,
+                )
+        return None
+
+
+_SARIF_LOCATION = ('locations', 0, 'physicalLocation')
+_RUFF_SHAPE = JsonShape(('filename',), ('location', 'row'), ('end_location', 'row'))
+
+INPUT_FORMATS: Mapping[InputFormatStr, JsonFormat] = MappingProxyType({
+    # {"runs": [{"results": [{"locations": [{"physicalLocation": {
+    #     "artifactLocation": {"uri": "file.py"}, "region": {"startLine": 12, "endLine": 14}}}], ...}]}]}
+    'sarif': JsonFormat((JsonShape(
+        (*_SARIF_LOCATION, 'artifactLocation', 'uri'),
+        (*_SARIF_LOCATION, 'region', 'startLine'),
+        (*_SARIF_LOCATION, 'region', 'endLine'),
+    ),)),
+    # ruff --output-format json-lines: {"filename": "/app/file.py", "location": {"row": 12, ...}, ...}
+    # mypy --output json: {"file": "file.py", "line": 12, ...}
+    _JSON_LINES_INPUT: JsonFormat((_RUFF_SHAPE, JsonShape(('file',), ('line',), ('end_line',)))),
+    # ruff --output-format json: [{"filename": "/app/file.py", "location": {"row": 12, ...}, ...}]
+    'ruff-json': JsonFormat((_RUFF_SHAPE,)),
+    # eslint --format json: [{"filePath": "/app/file.js", "messages": [{"line": 12, "endLine": 14, ...}]}],
+    # each message is separate line with "filePath" of file
+    _ESLINT_INPUT: JsonFormat((JsonShape(('filePath',), ('line',), ('endLine',)),)),
+})
+
+_DOCUMENT_PATHS: Mapping[InputFormatStr, tuple[str, ...]] = MappingProxyType({
+    'sarif': ('runs', ANY_ELEMENT, 'results', ANY_ELEMENT),
+    'ruff-json': (ANY_ELEMENT,),
+    _ESLINT_INPUT: (ANY_ELEMENT,),
+})
+
+
+def input_format_parser(input_format: InputFormatStr, directory: str | None = None) -> JsonFormat:
+    """Parser of JSON input format.
+
+    :param input_format: InputFormatStr, name of INPUT_FORMATS
+    :param directory: str | None, see normalized_filename
+    :return: JsonFormat
+    """
+    parser = INPUT_FORMATS[input_format]
+    return parser if directory is None else replace(parser, _directory=directory)
+
+
+def input_lines(
+    linter_out: TextIO,
+    input_format: InputFormatStr,
+) -> Iterator[ViolationStr | LinterAdditionalMessageStr]:
+    """Lines of linter output, JSON documents read incrementally.
+
+    :param linter_out: TextIO
+    :param input_format: InputFormatStr
+    :yields: ViolationStr | LinterAdditionalMessageStr, JSON line for every result of JSON document
+    :raises InvalidInputError: document not match input format
+    """
+    if input_format in {TEXT_INPUT, _JSON_LINES_INPUT}:
+        yield from stripped_lines(linter_out)
+        return
+    json_objects = found(JsonStream(linter_out), _DOCUMENT_PATHS[input_format])
+    if input_format == _ESLINT_INPUT:
+        json_objects = _eslint_messages(json_objects)
+    try:
+        for json_object in json_objects:
+            yield json.dumps(json_object, ensure_ascii=False, separators=(',', ':'))
+    except (ValueError, TypeError) as err:
+        raise InvalidInputError from err
+
+
+def _eslint_messages(file_results: Iterable[Any]) -> Iterator[Any]:
+    for file_result in file_results:
+        file_path = _field(file_result, ('filePath',))
+        for message in _field(file_result, ('messages',)) or []:
+            yield {'filePath': file_path, **message}
+
+
+def _field(document: Any, path: Sequence[str | int]) -> Any:  # noqa: ANN401 . JSON value
+    with suppress(LookupError, TypeError):
+        for key in path:
+            document = document[key]
+        return document
+    return None
+
+
+def _local_filename(filename: str, directory: str | None) -> FileNameStr:
+    if filename.startswith('file://'):
+        from urllib.parse import unquote, urlsplit  # noqa: WPS433, PLC0415 . Only for SARIF URIs
+        filename = unquote(urlsplit(filename).path)
+    return normalized_filename(filename, directory)
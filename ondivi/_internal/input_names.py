@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Input formats by name.
+
+JSON parsers of input_formats imported only for JSON input format,
+text input read without them
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import TextIO
+
+# _internal allow into ondivi app
+from ondivi._internal.linter_output import stripped_lines  # noqa: WPS436
+from ondivi._internal.ondivi_types import (  # noqa: WPS436
+    InputFormatStr,
+    LinterAdditionalMessageStr,
+    ViolationParser,
+    ViolationStr,
+)
+
+TEXT_INPUT = 'text'
+# Keys of input_formats.INPUT_FORMATS
+INPUT_FORMAT_NAMES: tuple[InputFormatStr, ...] = ('sarif', 'json-lines', 'ruff-json', 'eslint-json')
+
+
+def named_input_lines(
+    linter_out: TextIO,
+    input_format: InputFormatStr,
+) -> Iterator[ViolationStr | LinterAdditionalMessageStr]:
+    """Lines of linter output in input format.
+
+    :param linter_out: TextIO
+    :param input_format: InputFormatStr, TEXT_INPUT or name of INPUT_FORMAT_NAMES
+    :return: Iterator[ViolationStr | LinterAdditionalMessageStr], see input_formats.input_lines
+    """
+    if input_format == TEXT_INPUT:
+        return stripped_lines(linter_out)
+    from ondivi._internal.input_formats import input_lines  # noqa: WPS433, PLC0415 . Not needed for text input
+    return input_lines(linter_out, input_format)
+
+
+def named_input_parser(input_format: InputFormatStr, directory: str | None = None) -> ViolationParser:
+    """Parser of JSON input format.
+
+    :param input_format: InputFormatStr, name of INPUT_FORMAT_NAMES
+    :param directory: str | None, see normalized_filename
+    :return: ViolationParser
+    """
+    from ondivi._internal.input_formats import input_format_parser  # noqa: WPS433, PLC0415 . Not needed for text input
+    return input_format_parser(input_format, directory)
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Values of "--input" option in form "NAME=PATH[:FORMAT]"."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import replace
+
+# _internal allow into ondivi app
+from ondivi._internal.cli_options import CliOptions  # noqa: WPS436
+from ondivi._internal.input_names import INPUT_FORMAT_NAMES, TEXT_INPUT  # noqa: WPS436
+from ondivi._internal.presets import PRESETS  # noqa: WPS436
+
+
+def input_linters(options: CliOptions) -> dict[str, CliOptions]:
+    """Options for output of every linter by its name.
+
+    :param options: CliOptions, options of run
+    :return: dict[str, CliOptions], in order of "--input" options
+    """
+    linters = dict(input_options(options, input_spec) for input_spec in options.inputs)
+    if len(linters) < len(options.inputs):
+        sys.stderr.write('Names of "--input" values must be unique')
+        sys.exit(2)
+    return linters
+
+
+def input_options(options: CliOptions, input_spec: str) -> tuple[str, CliOptions]:
+    """Name of linter and options for its output.
+
+    FORMAT is preset, input format or template, options of run used without it
+
+    :param options: CliOptions, options of run
+    :param input_spec: str, "NAME=PATH[:FORMAT]"
+    :return: tuple[str, CliOptions]
+    """
+    linter_name, _, location = input_spec.partition('=')
+    path, input_format = _input_location(location)
+    if not (linter_name and path):
+        sys.stderr.write('Invalid "--input" value. Expected "NAME=PATH[:FORMAT]" got: "{0}"'.format(input_spec))
+        sys.exit(2)
+    if not input_format:
+        return linter_name, replace(options, fromfile=path)
+    if input_format in PRESETS:
+        return linter_name, replace(options, fromfile=path, preset=input_format, input_format=TEXT_INPUT)
+    if input_format in INPUT_FORMAT_NAMES:
+        return linter_name, replace(options, fromfile=path, input_format=input_format)
+    return linter_name, replace(
+        options,
+        fromfile=path,
+        violation_format=input_format,
+        preset=None,
+        input_format=TEXT_INPUT,
+    )
+
+
+def _input_location(location: str) -> tuple[str, str]:
+    # Template contains ":", path on windows contains ":" after drive letter
+    if ':{' in location:
+        path, _, template = location.partition(':{')
+        return path, '{{{0}'.format(template)
+    path, _, input_format = location.rpartition(':')
+    if input_format in PRESETS or input_format in INPUT_FORMAT_NAMES:
+        return path, input_format
+    return location, ''
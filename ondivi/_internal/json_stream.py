@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Incremental reader of large JSON documents."""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterator
+from contextlib import suppress
+from typing import Any, TextIO
+
+ANY_ELEMENT = '*'
+_CHUNK_SIZE = 65536
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def found(json_stream: JsonStream, path: tuple[str, ...]) -> Iterator[Any]:
+    """Values at path of document.
+
+    >>> import io
+    >>> list(found(
+    ...     JsonStream(io.StringIO('{"runs": [{"results": [1, 2]}, {"results": [3]}]}')),
+    ...     ('runs', '*', 'results', '*'),
+    ... ))
+    [1, 2, 3]
+
+    :param json_stream: JsonStream
+    :param path: tuple[str, ...], object keys, ANY_ELEMENT for each element of array
+    :yields: Any
+    """
+    if not path:
+        yield json_stream.decoded()
+        return
+    key, *rest = path
+    entries = (
+        json_stream.elements()
+        if key == ANY_ELEMENT
+        else (member for member in json_stream.members() if member == key)
+    )
+    for _ in entries:
+        yield from found(json_stream, tuple(rest))
+
+
+class JsonStream:
+    """JSON document read from text stream chunk by chunk.
+
+    Only requested values decoded, memory not depend on document size
+    """
+
+    def __init__(self, text_stream: TextIO) -> None:
+        """Ctor.
+
+        :param text_stream: TextIO
+        """
+        self._text = _ChunkedText(text_stream)
+        self._decoder = json.JSONDecoder()
+
+    def elements(self) -> Iterator[int]:
+        """Indexes of array elements, element skipped if not read after yield.
+
+        :yields: int
+        :raises json.JSONDecodeError: not an array
+        """
+        self._expect('[')
+        element_idx = 0
+        while self._next_entry(']', first=not element_idx):
+            yield from self._consumed(element_idx)
+            element_idx += 1
+
+    def members(self) -> Iterator[str]:
+        """Keys of object members, value skipped if not read after yield.
+
+        :yields: str
+        :raises json.JSONDecodeError: not an object
+        """
+        self._expect('{')
+        members_count = 0
+        while self._next_entry('}', first=not members_count):
+            key = self.decoded()
+            self._expect(':')
+            yield from self._consumed(key)
+            members_count += 1
+
+    def decoded(self) -> Any:  # noqa: ANN401 . JSON value
+        """Value at current position.
+
+        :return: Any
+        """
+        return self._text.decoded(self._decoder)
+
+    def _consumed(self, entry: Any) -> Iterator[Any]:  # noqa: ANN401 . Key or index
+        position = self._text.position()
+        yield entry
+        if self._text.position() == position:
+            self.decoded()
+
+    def _next_entry(self, closing: str, *, first: bool) -> bool:
+        if self._text.skipped(closing):
+            return False
+        # Entries separated by commas like for json.loads, closing after trailing comma fails as not a value
+        if not first:
+            self._expect(',')
+        return True
+
+    def _expect(self, char: str) -> None:
+        if not self._text.skipped(char):
+            msg = 'Expecting "{0}"'.format(char)
+            raise json.JSONDecodeError(msg, '', self._text.position())
+
+
+class _ChunkedText:
+    """Not consumed part of text stream."""
+
+    def __init__(self, text_stream: TextIO) -> None:
+        self._text_stream = text_stream
+        self._text = ''
+        self._pos = 0
+        self._trimmed = 0
+        self._eof = False
+
+    def position(self) -> int:
+        return self._trimmed + self._pos
+
+    def next_char(self) -> str:
+        self._pos = _WHITESPACE.match(self._text, self._pos).end()  # type: ignore [union-attr]
+        while self._pos == len(self._text) and self._read_chunk():
+            self._pos = _WHITESPACE.match(self._text, self._pos).end()  # type: ignore [union-attr]
+        return self._text[self._pos:self._pos + 1]
+
+    def skipped(self, char: str) -> bool:
+        if self.next_char() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def decoded(self, decoder: json.JSONDecoder) -> Any:  # noqa: ANN401 . JSON value
+        self.next_char()
+        while not self._eof:
+            with suppress(json.JSONDecodeError):
+                decoded_value, end = decoder.raw_decode(self._text, self._pos)
+                # Number at end of text may continue in next chunk
+                if end < len(self._text):
+                    self._pos = end
+                    return decoded_value
+            self._read_chunk()
+        decoded_value, end = decoder.raw_decode(self._text, self._pos)
+        self._pos = end
+        return decoded_value
+
+    def _read_chunk(self) -> bool:
+        self._trimmed += self._pos
+        # Size doubled for long values, decoding restarts after each read
+        chunk = self._text_stream.read(max(_CHUNK_SIZE, len(self._text)))
+        self._text = ''.join((self._text[self._pos:], chunk))
+        self._pos = 0
+        self._eof = not chunk
+        return not self._eof
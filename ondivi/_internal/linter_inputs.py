@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Outputs of several linters filtered by one diff for "--input"."""
+
+from __future__ import annotations
+
+import sys
+from functools import partial
+from itertools import chain
+from typing import TypeAlias
+
+from ondivi._internal.changed_lines_index import ChangedLinesIndex
+from ondivi._internal.cli_options import CliOptions
+from ondivi._internal.define_additional import valid_size, with_additional
+from ondivi._internal.detect_format import SAMPLE_SIZE
+from ondivi._internal.exceptions import FromFileNotFoundError, InvalidInputError
+from ondivi._internal.filter_out_violations import parallel_lines_for_out
+from ondivi._internal.input_specs import input_linters
+from ondivi._internal.linter_output import linted_files
+from ondivi._internal.ondivi_types import LinterAdditionalMessageStr, Violation, ViolationParser, ViolationStr
+from ondivi._internal.output_formats import OUTPUT_FORMATS
+from ondivi._internal.run_stats import STATS
+from ondivi._internal.write_output import write_stream
+
+_LinesForOut: TypeAlias = list[tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None]]
+_LinterOutput: TypeAlias = list[ViolationStr | LinterAdditionalMessageStr]
+
+
+def filtered_inputs(options: CliOptions) -> bool:
+    """Filter outputs of linters by one changed lines index.
+
+    Outputs read concurrently, so linters writing to pipes not wait each other.
+    Kept lines of all linters printed in order of "--input" options,
+    count of violations of every linter printed to stderr
+
+    :param options: CliOptions
+    :return: bool, violation found in any output
+    """
+    linters = input_linters(options)
+    linter_outputs = _read(list(linters.values()))
+    parsers = [
+        linter_options.parser(linter_output[:SAMPLE_SIZE])
+        for linter_options, linter_output in zip(linters.values(), linter_outputs, strict=True)
+    ]
+    return _filtered(options, linters, linter_outputs, parsers)
+
+
+def _filtered(
+    options: CliOptions,
+    linters: dict[str, CliOptions],
+    linter_outputs: list[_LinterOutput],
+    parsers: list[ViolationParser],
+) -> bool:
+    changed_lines = options.changed_lines(
+        set().union(*map(linted_files, linter_outputs, parsers))
+        if options.diff_linted_files
+        else None,
+    )
+    kept_lines = list(map(
+        partial(_kept, changed_lines),
+        linters,
+        linters.values(),
+        linter_outputs,
+        parsers,
+    ))
+    with STATS.stage('output'):
+        write_stream(
+            chain.from_iterable(lines_for_out for lines_for_out, _ in kept_lines),
+            OUTPUT_FORMATS[options.output_format],
+            flush_lines=False,
+        )
+    return any(violation_found for _, violation_found in kept_lines)
+
+
+def _read(linters_options: list[CliOptions]) -> list[_LinterOutput]:
+    from concurrent.futures import ThreadPoolExecutor  # noqa: WPS433, PLC0415 . Not needed without "--input"
+    with STATS.stage('read_linter_output'), ThreadPoolExecutor(len(linters_options)) as pool:
+        linter_outputs = list(pool.map(_read_one, linters_options))
+    STATS.count('input_lines', sum(map(len, linter_outputs)))
+    return linter_outputs
+
+
+def _read_one(options: CliOptions) -> _LinterOutput:
+    try:
+        return options.read_linter_output()
+    except (FromFileNotFoundError, InvalidInputError) as err:
+        sys.stdout.write(options.error_message(err))
+        sys.exit(1)
+
+
+def _kept(
+    changed_lines: ChangedLinesIndex,
+    linter_name: str,
+    options: CliOptions,
+    linter_output: _LinterOutput,
+    parser: ViolationParser,
+) -> tuple[_LinesForOut, bool]:
+    lines_for_out = STATS.timed(
+        'filter_out_violations',
+        parallel_lines_for_out(
+            changed_lines,
+            linter_output,
+            STATS.counted(parser),
+            options.only_violations,
+            options.jobs,
+        ),
+        'kept_lines',
+    )
+    if options.random_additional is None:
+        kept_lines = list(lines_for_out)
+        violation_found = _violations_count(kept_lines) > 0
+    else:
+        kept_lines, violation_found = with_additional(
+            lines_for_out,
+            linter_output,
+            parser,
+            valid_size(options.random_additional),
+        )
+    sys.stderr.write('{0}: {1} violation(s)\n'.format(linter_name, _violations_count(kept_lines)))
+    return kept_lines, violation_found
+
+
+def _violations_count(lines_for_out: _LinesForOut) -> int:
+    return sum(violation is not None for _, violation in lines_for_out)
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Read linter output."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import AbstractContextManager, closing, contextmanager, nullcontext
+from itertools import chain
+from pathlib import Path
+from typing import AnyStr, BinaryIO, TextIO
+
+# _internal allow into ondivi app
+from ondivi._internal.exceptions import FromFileNotFoundError  # noqa: WPS436
+from ondivi._internal.ondivi_types import (  # noqa: WPS436
+    FileNameStr,
+    FromFilePathStr,
+    LinterAdditionalMessageStr,
+    ViolationParser,
+    ViolationStr,
+)
+
+
+def linter_output_lines(fromfile: FromFilePathStr | None) -> list[ViolationStr | LinterAdditionalMessageStr]:
+    """Linter output from file or stdin.
+
+    :param fromfile: FromFilePathStr | None
+    :return: list[ViolationStr | LinterAdditionalMessageStr]
+    """
+    if not fromfile:
+        return sys.stdin.read().strip().splitlines()
+    _check_exists(fromfile)
+    return Path(fromfile).read_text(encoding='utf-8').strip().splitlines()
+
+
+def linter_output_stream(fromfile: FromFilePathStr | None) -> AbstractContextManager[TextIO]:
+    """Linter output from file or stdin for line by line reading.
+
+    :param fromfile: FromFilePathStr | None
+    :return: AbstractContextManager[TextIO]
+    """
+    if not fromfile:
+        return nullcontext(sys.stdin)
+    _check_exists(fromfile)
+    return Path(fromfile).open(encoding='utf-8')
+
+
+@contextmanager
+def raw_lines(fromfile: FromFilePathStr | None) -> Iterator[Iterator[bytes]]:
+    """Lines of linter output from file or stdin as bytes with line endings.
+
+    File read by memory map, pages of file loaded on access,
+    so memory not depend on file size
+
+    :param fromfile: FromFilePathStr | None
+    :yields: Iterator[bytes]
+    """
+    if not fromfile:
+        yield iter(sys.stdin.buffer)
+        return
+    _check_exists(fromfile)
+    # Empty file can not be mapped
+    if not Path(fromfile).stat().st_size:
+        yield iter(())
+        return
+    with Path(fromfile).open('rb') as output_file, closing(_mapped_lines(output_file)) as mapped_lines:
+        yield mapped_lines
+
+
+def stripped_lines(lines: Iterable[AnyStr]) -> Iterator[AnyStr]:
+    """Lines without line endings, leading and trailing blank lines.
+
+    Lazy analog of `text.strip().splitlines()` for str and bytes lines,
+    blank lines inside text held until next not blank line
+
+    :param lines: Iterable[AnyStr]
+    :yields: AnyStr
+    """
+    lines_iter = iter(lines)
+    first_line = next((raw_line for raw_line in lines_iter if raw_line.strip()), None)
+    if first_line is None:
+        return
+    # Type of line endings chosen once, not for every line
+    line_endings = '\r\n' if isinstance(first_line, str) else b'\r\n'
+    held_blank_lines: list[AnyStr] = []
+    for raw_line in chain((first_line,), lines_iter):
+        if raw_line.strip():
+            yield from held_blank_lines
+            held_blank_lines.clear()
+            yield raw_line.rstrip(line_endings)
+        else:
+            held_blank_lines.append(raw_line.rstrip(line_endings))
+
+
+def linted_files(
+    linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr],
+    parser: ViolationParser,
+) -> set[FileNameStr]:
+    """Files with violations from linter output.
+
+    :param linter_out: Iterable[ViolationStr | LinterAdditionalMessageStr]
+    :param parser: ViolationParser
+    :return: set[FileNameStr]
+    """
+    return {
+        violation.filename
+        for violation in map(parser.violation, linter_out)
+        if violation is not None
+    }
+
+
+def _mapped_lines(output_file: BinaryIO) -> Generator[bytes, None, None]:
+    import mmap  # noqa: WPS433, PLC0415 . Not needed without "--fromfile"
+    with mmap.mmap(output_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+        yield from iter(mapped_file.readline, b'')
+
+
+def _check_exists(fromfile: FromFilePathStr) -> None:
+    if not Path(fromfile).exists():
+        raise FromFileNotFoundError
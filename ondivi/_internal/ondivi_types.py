@@ -3,7 +3,7 @@
 
 """Ondivi app types."""
 
-from typing import TypedDict
+from typing import NamedTuple, Protocol, TypedDict
 
 DiffStr = str
 # Diff str is out of `git diff` command
@@ -26,6 +26,14 @@ FileNameStr = str
 # Filename with path to file
 # This name must be equal in git diff and linter out
 
+ChangedLinesDict = dict[FileNameStr, list[int]]
+# Numbers of changed lines for each file
+# See `define_changed_lines`
+
+LinesRange = tuple[int, int]
+# First and last (inclusive) line numbers of changed lines range
+# Hunk "@@ -26,0 +27,2 @@" contain range from 27 to 28 line
+
 ViolationStr = str
 # One line of violation output
 # Example:
@@ -46,6 +54,18 @@ ViolationFormatStr = str
 # {line_num}   The line number with the error/warning (integer)',
 # See "--format" option, https://github.com/r1chardj0n3s/parse
 
+PresetNameStr = str
+# Name of built-in linter format (flake8, mypy, eslint, ...)
+# See "--preset" option
+
+InputFormatStr = str
+# Format of linter output: "text" or name of JSON format (sarif, ruff-json, ...)
+# See "--input-format" option
+
+OutputFormatStr = str
+# Format of filtered output: "text", "json-lines", "sarif", "junit" or "github"
+# See "--output-format" option
+
 BaselineStr = str
 # Branch name or commit hash
 
@@ -61,5 +81,27 @@ class ParsedViolation(TypedDict):
     After parsing parse.parse takes dict type
     """
 
+    filename: FileNameStr
+    line_num: int | str
+
+
+class Violation(NamedTuple):
+    """Violation parsed from linter line.
+
+    Line parsed once, record carry only fields needed for filtering.
+    Last line known only for structured output, see "--input-format"
+    """
+
     filename: FileNameStr
     line_num: int
+    end_line_num: int | None = None
+
+
+class ViolationParser(Protocol):
+    """Parser of linter lines compiled once for all lines."""
+
+    def violation(self, raw_line: ViolationStr | LinterAdditionalMessageStr) -> Violation | None:
+        """Parse linter line.
+
+        :param raw_line: ViolationStr | LinterAdditionalMessageStr
+        """
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Formats of filtered linter output.
+
+Output written item by item between header and footer,
+violations taken from filtering, lines not parsed second time
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+# _internal allow into ondivi app
+from ondivi._internal.ondivi_types import (  # noqa: WPS436
+    LinterAdditionalMessageStr,
+    OutputFormatStr,
+    Violation,
+    ViolationStr,
+)
+
+TEXT_OUTPUT = 'text'
+_GITHUB_DATA_ESCAPES = str.maketrans({'%': '%25', '\r': '%0D', '\n': '%0A'})
+_GITHUB_PROPERTY_ESCAPES = MappingProxyType({**_GITHUB_DATA_ESCAPES, ord(':'): '%3A', ord(','): '%2C'})
+# XML parsers replace whitespace characters of attribute values with spaces
+_XML_ATTRIBUTE_ESCAPES = str.maketrans({'\n': '&#10;', '\r': '&#13;', '\t': '&#9;'})
+# Characters not allowed in XML 1.0 even escaped, for example "\x1b" of colored output
+_XML_INVALID_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+
+@dataclass(frozen=True)
+class OutputFormat:
+    """Header, footer and items of output.
+
+    Formatted line is None for skipped line, structured formats skip lines without violation
+    """
+
+    header: str
+    footer: str
+    separator: str
+    formatted: Callable[[ViolationStr | LinterAdditionalMessageStr, Violation | None], str | None]
+
+
+def _text_line(line: ViolationStr | LinterAdditionalMessageStr, violation: Violation | None) -> str:
+    return '{0}\n'.format(line)
+
+
+def _json_line(line: ViolationStr | LinterAdditionalMessageStr, violation: Violation | None) -> str | None:
+    if violation is None:
+        return None
+    import json  # noqa: WPS433, PLC0415 . Not needed for text output
+    return '{0}\n'.format(json.dumps(
+        {**violation._asdict(), 'line': line},
+        ensure_ascii=False,
+    ))
+
+
+def _sarif_result(line: ViolationStr | LinterAdditionalMessageStr, violation: Violation | None) -> str | None:
+    if violation is None:
+        return None
+    import json  # noqa: WPS433, PLC0415 . Not needed for text output
+    return json.dumps(
+        {
+            'level': 'error',
+            'message': {'text': line},
+            'locations': [{'physicalLocation': {
+                'artifactLocation': {'uri': violation.filename.replace('\\', '/')},
+                'region': {'startLine': violation.line_num, 'endLine': violation.end_line_num or violation.line_num},
+            }}],
+        },
+        ensure_ascii=False,
+    )
+
+
+def _junit_testcase(line: ViolationStr | LinterAdditionalMessageStr, violation: Violation | None) -> str | None:
+    if violation is None:
+        return None
+    escaped_line = _xml_text(line)
+    return '<testcase classname="{0}" name="{0}:{1}"><failure message="{2}">{3}</failure></testcase>\n'.format(
+        _xml_text(violation.filename),
+        violation.line_num,
+        escaped_line.translate(_XML_ATTRIBUTE_ESCAPES),
+        escaped_line,
+    )
+
+
+def _xml_text(text: str) -> str:
+    from html import escape  # noqa: WPS433, PLC0415 . Not needed for text output
+    return escape(_XML_INVALID_CHARS.sub('', text))
+
+
+def _github_command(line: ViolationStr | LinterAdditionalMessageStr, violation: Violation | None) -> str | None:
+    if violation is None:
+        return None
+    return '::error file={0},line={1},endLine={2}::{3}\n'.format(
+        violation.filename.replace('\\', '/').translate(_GITHUB_PROPERTY_ESCAPES),
+        violation.line_num,
+        violation.end_line_num or violation.line_num,
+        line.translate(_GITHUB_DATA_ESCAPES),
+    )
+
+
+OUTPUT_FORMATS: Mapping[OutputFormatStr, OutputFormat] = MappingProxyType({
+    TEXT_OUTPUT: OutputFormat('', '', '', _text_line),
+    # JSON object with fields of violation and original line in "line" field
+    'json-lines': OutputFormat('', '', '', _json_line),
+    # SARIF 2.1.0 log with one run, result for each violation
+    'sarif': OutputFormat(
+        ''.join((
+            '{"version": "2.1.0", ',
+            '"$schema": "https://json.schemastore.org/sarif-2.1.0.json", ',
+            '"runs": [{"tool": {"driver": {"name": "ondivi", ',
+            '"informationUri": "https://github.com/blablatdinov/ondivi"}}, "results": [\n',
+        )),
+        '\n]}]}\n',
+        ',\n',
+        _sarif_result,
+    ),
+    # Failed testcase for each violation, empty testsuite for success
+    'junit': OutputFormat(
+        '<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n<testsuite name="ondivi">\n',
+        '</testsuite>\n</testsuites>\n',
+        '',
+        _junit_testcase,
+    ),
+    # Workflow command "::error file=...,line=...::message" for each violation
+    'github': OutputFormat('', '', '', _github_command),
+})
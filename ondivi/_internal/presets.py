@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Built-in formats of popular linters.
+
+Presets are precompiled regular expressions, they are faster than generic templates
+"""
+
+import re
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
+
+# _internal allow into ondivi app
+from ondivi._internal.compiled_format import RegexFormat  # noqa: WPS436
+from ondivi._internal.ondivi_types import PresetNameStr  # noqa: WPS436
+
+_LOCATION = r'(?P<filename>.+?):(?P<line_num>\d+)'
+
+PRESETS: Mapping[PresetNameStr, str] = MappingProxyType({
+    # file.py:12:80: E501 line too long (119 > 79 characters)
+    'flake8': ''.join((_LOCATION, r':\d+: [A-Z]+\d+ ')),
+    # file.py:12:5: T201 `print` found
+    'ruff': ''.join((_LOCATION, r':\d+: [A-Z]+\d+ ')),
+    # file.py:1:0: C0114: Missing module docstring (missing-module-docstring)
+    'pylint': ''.join((_LOCATION, r':\d+: [CRWEFI]\d{4}: ')),
+    # file.py:16: error: Argument 2 to "User" has incompatible type "str"; expected "int"  [arg-type]
+    'mypy': ''.join((_LOCATION, r':(?:\d+:)? (?:error|warning|note): ')),
+    # /app/src/file.js:1:10: 'x' is defined but never used. [Error/no-unused-vars]
+    'eslint': ''.join((_LOCATION, r':\d+: .*\[(?:Error|Warning)(?:/[^\]]+)?\]$')),
+    # /app/lib/file.rb:3:1: C: Style/FrozenStringLiteralComment: Missing frozen string literal comment.
+    'rubocop': ''.join((_LOCATION, r':\d+: [CWEFR]: ')),
+    # src/style.css:1:7: Unexpected unit (length-zero-no-unit) [error]
+    'stylelint': ''.join((_LOCATION, r':\d+: .*\[(?:error|warning)\]$')),
+})
+
+
+@cache
+def preset_format(preset: PresetNameStr, directory: str | None = None) -> RegexFormat:
+    """Compiled built-in format.
+
+    :param preset: PresetNameStr
+    :param directory: str | None, see normalized_filename
+    :return: RegexFormat
+    """
+    return RegexFormat(re.compile(PRESETS[preset]), directory)
+
+
+@cache
+def preset_bytes_pattern(preset: PresetNameStr) -> re.Pattern[bytes]:
+    """Built-in format for lines not decoded from bytes, see "--bytes".
+
+    :param preset: PresetNameStr
+    :return: re.Pattern[bytes], same expression as preset_format, digits of line number only ASCII
+    """
+    return re.compile(PRESETS[preset].encode('ascii'))
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""CPU and memory profiles of run for "--profile-cpu" and "--profile-memory"."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import TextIO
+
+_TOP_ALLOCATIONS = 10
+_MIB = 1_048_576
+
+StageHook = Callable[[str], None]
+
+
+@contextmanager
+def profiled(cpu_file: str | None, memory_file: str | None) -> Iterator[StageHook | None]:
+    """Profile run, profilers not imported and not started without files.
+
+    :param cpu_file: str | None, path for cProfile dump, read it by pstats or snakeviz
+    :param memory_file: str | None, path for report with top allocation sites at start of each stage
+    :yields: StageHook | None, hook for first start of stage, None without memory profile
+    """
+    with ExitStack() as stack:
+        if cpu_file:
+            stack.enter_context(_cpu_profile(Path(cpu_file)))
+        yield stack.enter_context(_memory_profile(Path(memory_file))) if memory_file else None
+
+
+@contextmanager
+def _cpu_profile(path: Path) -> Iterator[None]:
+    import cProfile  # noqa: WPS433, PLC0415 . Not needed without profile
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        profile.dump_stats(path)
+
+
+@contextmanager
+def _memory_profile(path: Path) -> Iterator[StageHook]:
+    import tracemalloc  # noqa: WPS433, PLC0415 . Not needed without profile
+    tracemalloc.start()
+    with path.open('w', encoding='utf-8') as report:
+        try:
+            yield lambda stage_name: _write_snapshot(report, 'Start of stage "{0}"'.format(stage_name))
+        finally:
+            _write_snapshot(report, 'End of run')
+            tracemalloc.stop()
+
+
+def _write_snapshot(report: TextIO, title: str) -> None:
+    import tracemalloc  # noqa: WPS433, PLC0415 . Not needed without profile
+    profiler_traces = tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)
+    snapshot = tracemalloc.take_snapshot().filter_traces((profiler_traces,))
+    traced, peak = tracemalloc.get_traced_memory()
+    report.write('{0}: {1:.1f} MiB traced, {2:.1f} MiB peak\n'.format(title, traced / _MIB, peak / _MIB))
+    report.writelines(
+        '    {0}\n'.format(statistic)
+        for statistic in snapshot.statistics('lineno')[:_TOP_ALLOCATIONS]
+    )
+    report.write('\n')
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Filenames of linter output and diff in one form."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from contextlib import suppress
+from functools import lru_cache, partial
+from pathlib import Path
+
+# _internal allow into ondivi app
+from ondivi._internal.ondivi_types import FileNameStr  # noqa: WPS436
+
+# Daemon changes current directory for every request
+_DIRECTORIES_COUNT = 16
+_FILENAMES_COUNT = 65_536
+
+
+def normalized_filename(filename: str, directory: str | None = None) -> FileNameStr:
+    """Filename relative to repository root in form of git diff.
+
+    Absolute paths, "./" prefixes, windows separators and paths relative
+    to subdirectory of repository normalized once for every distinct filename
+
+    >>> normalized_filename('./file.py')
+    'file.py'
+
+    :param filename: str
+    :param directory: str | None, absolute path of directory where linter started, None for current directory
+    :return: FileNameStr
+    """
+    return _directory_filenames(directory or os.getcwd())(filename)  # noqa: PTH109 . String is cheaper key of cache
+
+
+def diff_filename(filename: str) -> FileNameStr:
+    """Filename from diff in form of normalized filename.
+
+    :param filename: str, path relative to repository root with "/" separators
+    :return: FileNameStr
+    """
+    return str(Path(filename))
+
+
+def local_filename(filename: FileNameStr) -> str:
+    """Path relative to current directory for normalized filename, for passing it to linter.
+
+    :param filename: FileNameStr
+    :return: str
+    """
+    current_dir = Path.cwd()
+    return os.path.relpath(_repo_root(current_dir) / filename, current_dir)
+
+
+@lru_cache(maxsize=_DIRECTORIES_COUNT)
+def _directory_filenames(cwd: str) -> Callable[[str], FileNameStr]:
+    current_dir = Path(cwd)
+    repo_root = _repo_root(current_dir)
+    return lru_cache(maxsize=_FILENAMES_COUNT)(partial(_repo_filename, repo_root, current_dir.relative_to(repo_root)))
+
+
+def _repo_root(current_dir: Path) -> Path:
+    return next(
+        (directory for directory in (current_dir, *current_dir.parents) if (directory / '.git').exists()),
+        current_dir,
+    )
+
+
+def _repo_filename(repo_root: Path, cwd_prefix: Path, filename: str) -> FileNameStr:
+    path = Path(os.path.normpath(filename.replace('\\', '/')))
+    if not path.is_absolute():
+        return diff_filename(os.path.normpath(cwd_prefix / path))
+    with suppress(ValueError):
+        return diff_filename(str(path.relative_to(repo_root)))
+    return diff_filename(str(path))
@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Time of stages and counters of run for "--stats"."""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, TypeVar
+
+# _internal allow into ondivi app
+from ondivi._internal.ondivi_types import (  # noqa: WPS436
+    LinterAdditionalMessageStr,
+    Violation,
+    ViolationParser,
+    ViolationStr,
+)
+
+_ItemT = TypeVar('_ItemT')
+_NO_STAGE = nullcontext()
+_END = object()
+_STAGE_ROW = '{0:<24}{1:>12}{2:>12}\n'
+_COUNTER_ROW = '{0:<24}{1:>12}\n'
+
+
+class RunStats:
+    """Wall and CPU time of stages and counters.
+
+    Stage time not include time of nested stages.
+    Methods do nothing until recording started, so disabled stats cost nothing
+    """
+
+    def __init__(self) -> None:
+        """Ctor."""
+        self._enabled = False
+        self._timer = _StageTimer(None)
+        self._counters: dict[str, int] = {}
+
+    def start(self, enabled: bool, stage_hook: Callable[[str], object] | None = None) -> None:
+        """Start recording of new run.
+
+        :param enabled: bool, False for skip recording
+        :param stage_hook: Callable[[str], object] | None, called with stage name on first start of stage
+        """
+        self._enabled = enabled
+        self._timer = _StageTimer(stage_hook)
+        self._counters = {}
+
+    def stage(self, stage_name: str) -> AbstractContextManager[object]:
+        """Context of stage.
+
+        :param stage_name: str
+        :return: AbstractContextManager[object]
+        """
+        if not self._enabled:
+            return _NO_STAGE
+        return _Stage(self._timer, stage_name)
+
+    def timed(self, stage_name: str, iterable: Iterable[_ItemT], counter_name: str = '') -> Iterable[_ItemT]:
+        """Time of getting items is time of stage, lazy iterables consumed by later stages.
+
+        :param stage_name: str
+        :param iterable: Iterable[_ItemT]
+        :param counter_name: str, counter of items, empty for skip counting
+        :return: Iterable[_ItemT], iterable as is if recording not started
+        """
+        if not self._enabled:
+            return iterable
+        return _timed_items(self, stage_name, iter(iterable), counter_name)
+
+    def count(self, counter_name: str, increment: int = 1) -> None:
+        """Increase counter.
+
+        :param counter_name: str
+        :param increment: int
+        """
+        if self._enabled:
+            self._counters[counter_name] = self._counters.get(counter_name, 0) + increment
+
+    def counted(self, parser: ViolationParser) -> ViolationParser:
+        """Parser counting parsed violations and unparsable lines.
+
+        Lines parsed by worker processes of "--jobs" not counted
+
+        :param parser: ViolationParser
+        :return: ViolationParser, parser as is if recording not started
+        """
+        if not self._enabled:
+            return parser
+        return _CountingParser(parser, self)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Stages with wall and CPU seconds, counters with peak memory of process.
+
+        :return: dict[str, Any]
+        """
+        counters: dict[str, float] = dict(self._counters)
+        if sys.platform != 'win32':
+            import resource  # noqa: WPS433, PLC0415 . Not available on windows
+            # Kilobytes on linux, bytes on macOS
+            peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            counters['peak_rss_kib'] = peak_rss // 1024 if sys.platform == 'darwin' else peak_rss
+        return {'stages': self._timer.stages(), 'counters': counters}
+
+
+class _StageTimer:
+    """Stack of running stages."""
+
+    def __init__(self, stage_hook: Callable[[str], object] | None) -> None:
+        self._stage_hook = stage_hook
+        self._times: dict[str, list[float]] = {}
+        self._running: list[tuple[str, float, float]] = []
+
+    def enter(self, stage_name: str) -> None:
+        if stage_name not in self._times:
+            self._times[stage_name] = [0, 0]
+            if self._stage_hook:
+                self._stage_hook(stage_name)
+        self._running.append((stage_name, time.perf_counter(), time.process_time()))
+
+    def exit(self) -> None:
+        stage_name, wall_start, cpu_start = self._running.pop()
+        elapsed = (time.perf_counter() - wall_start, time.process_time() - cpu_start)
+        self._add(stage_name, elapsed)
+        if self._running:
+            # Time of nested stage excluded from outer stage
+            outer_stage_name = self._running[-1][0]
+            self._add(outer_stage_name, (-elapsed[0], -elapsed[1]))
+
+    def stages(self) -> dict[str, dict[str, float]]:
+        return {
+            stage_name: {'wall': wall, 'cpu': cpu}
+            for stage_name, (wall, cpu) in self._times.items()
+        }
+
+    def _add(self, stage_name: str, elapsed: tuple[float, float]) -> None:
+        times = self._times[stage_name]
+        times[0] += elapsed[0]
+        times[1] += elapsed[1]
+
+
+class _Stage:
+
+    def __init__(self, timer: _StageTimer, stage_name: str) -> None:
+        self._timer = timer
+        self._stage_name = stage_name
+
+    def __enter__(self) -> None:
+        self._timer.enter(self._stage_name)
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._timer.exit()
+
+
+class _CountingParser:
+
+    def __init__(self, origin: ViolationParser, stats: RunStats) -> None:
+        self._origin = origin
+        self._stats = stats
+
+    def violation(self, raw_line: ViolationStr | LinterAdditionalMessageStr) -> Violation | None:
+        violation = self._origin.violation(raw_line)
+        self._stats.count('unparsable_lines' if violation is None else 'parsed_violations')
+        return violation
+
+    def __getstate__(self) -> dict[str, object]:
+        # Worker processes of "--jobs" not count lines, stats with hook of memory profile not picklable
+        return {'_origin': self._origin, '_stats': RunStats()}
+
+
+def _timed_items(stats: RunStats, stage_name: str, iterator: Iterator[_ItemT], counter_name: str) -> Iterator[_ItemT]:
+    while True:
+        with stats.stage(stage_name):
+            next_item = next(iterator, _END)
+        if next_item is _END:
+            return
+        if counter_name:
+            stats.count(counter_name)
+        yield next_item  # type: ignore [misc]
+
+
+def stats_report(run_stats: RunStats) -> str:
+    """Table of stages and counters.
+
+    :param run_stats: RunStats
+    :return: str
+    """
+    stats = run_stats.as_dict()
+    return ''.join((
+        _STAGE_ROW.format('stage', 'wall, s', 'cpu, s'),
+        *(_stage_row(stage_name, times) for stage_name, times in stats['stages'].items()),
+        _COUNTER_ROW.format('counter', 'value'),
+        *(_COUNTER_ROW.format(*counter) for counter in stats['counters'].items()),
+    ))
+
+
+def _stage_row(stage_name: str, times: dict[str, float]) -> str:
+    wall = '{0:.3f}'.format(times['wall'])
+    cpu = '{0:.3f}'.format(times['cpu'])
+    return _STAGE_ROW.format(stage_name, wall, cpu)
+
+
+# Stats of current run, recording started by "--stats"
+STATS = RunStats()
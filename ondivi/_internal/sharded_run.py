@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Linter runs on shards of changed files for "ondivi run"."""
+
+from __future__ import annotations
+
+import itertools
+import os
+import subprocess  # noqa: S404 . Linter command from user
+import threading
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from queue import Queue
+from typing import TypeAlias
+
+# _internal allow into ondivi app
+from ondivi._internal.changed_lines_index import ChangedLinesIndex  # noqa: WPS436
+from ondivi._internal.command_shards import balanced_shards, shard_commands  # noqa: WPS436
+from ondivi._internal.exceptions import LinterFailedError  # noqa: WPS436
+from ondivi._internal.filter_out_violations import lines_for_out  # noqa: WPS436
+from ondivi._internal.linter_output import stripped_lines  # noqa: WPS436
+from ondivi._internal.ondivi_types import (  # noqa: WPS436
+    LinterAdditionalMessageStr,
+    Violation,
+    ViolationParser,
+    ViolationStr,
+)
+
+_LineForOut: TypeAlias = tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None]
+# Kept lines of shard, then exit code of failed linter (0 without fail) or error of linter start
+_ShardLines: TypeAlias = 'Queue[_LineForOut | int | OSError]'
+
+
+def sharded_lines(  # noqa: PLR0913, PLR0917 . Options of linter run
+    command: Sequence[str],
+    paths: Iterable[str],
+    changed_lines: ChangedLinesIndex,
+    parser: ViolationParser,
+    only_violations: bool,
+    jobs: int,
+) -> Iterator[_LineForOut]:
+    """Kept lines of linter runs on shards of paths in order of shards.
+
+    Shard for every job, commands run by threads, output of every command filtered while linter writes it.
+    Lines of first not finished shard yielded immediately, lines of next shards held until it finished.
+    Stderr of linters not captured. Non-zero exit code means found violations for most linters,
+    so only linter exited with non-zero code without output failed
+
+    :param command: Sequence[str], see command_shards.shard_command
+    :param paths: Iterable[str], paths for linter
+    :param changed_lines: ChangedLinesIndex
+    :param parser: ViolationParser
+    :param only_violations: bool
+    :param jobs: int, count of shards run at once, less than 1 for all CPU cores
+    :yields: tuple[ViolationStr | LinterAdditionalMessageStr, Violation | None], line for out and its violation
+    :raises LinterFailedError: linter failed, raised after lines of all shards with first exit code
+    """
+    workers = jobs if jobs >= 1 else os.cpu_count() or 1
+    shards_lines = [
+        _started_shard(changed_lines, parser, only_violations, shard_commands(command, shard))
+        for shard in balanced_shards(paths, workers)
+    ]
+    failed_exit_code = 0
+    for shard_lines in shards_lines:
+        exit_code = yield from _received_lines(shard_lines)
+        failed_exit_code = failed_exit_code or exit_code
+    if failed_exit_code:
+        raise LinterFailedError(failed_exit_code)
+
+
+def failed_run_message(command_name: str, err: LinterFailedError | OSError) -> str:
+    """Error message of linter run.
+
+    :param command_name: str
+    :param err: LinterFailedError | OSError, error of sharded_lines
+    :return: str
+    """
+    if isinstance(err, LinterFailedError):
+        return 'Command "{0}" failed with exit code {1}'.format(command_name, err.args[0])
+    if isinstance(err, FileNotFoundError):
+        return 'Command "{0}" not found'.format(command_name)
+    return 'Command "{0}" not started: {1}'.format(command_name, err.strerror)
+
+
+def _started_shard(
+    changed_lines: ChangedLinesIndex,
+    parser: ViolationParser,
+    only_violations: bool,
+    commands: list[list[str]],
+) -> _ShardLines:
+    shard_lines: _ShardLines = Queue()
+    shard_run = threading.Thread(
+        target=_shard_run,
+        args=(changed_lines, parser, only_violations, commands, shard_lines),
+        daemon=True,
+    )
+    shard_run.start()
+    return shard_lines
+
+
+def _received_lines(shard_lines: _ShardLines) -> Generator[_LineForOut, None, int]:
+    shard_item = shard_lines.get()
+    while isinstance(shard_item, tuple):
+        yield shard_item
+        shard_item = shard_lines.get()
+    if isinstance(shard_item, OSError):
+        raise shard_item
+    return shard_item
+
+
+def _shard_run(
+    changed_lines: ChangedLinesIndex,
+    parser: ViolationParser,
+    only_violations: bool,
+    commands: list[list[str]],
+    shard_lines: _ShardLines,
+) -> None:
+    try:
+        exit_codes = [
+            _command_run(changed_lines, parser, only_violations, command, shard_lines)
+            for command in commands
+        ]
+    except OSError as err:
+        shard_lines.put(err)
+    else:
+        shard_lines.put(next((exit_code for exit_code in exit_codes if exit_code), 0))
+
+
+def _command_run(
+    changed_lines: ChangedLinesIndex,
+    parser: ViolationParser,
+    only_violations: bool,
+    command: list[str],
+    shard_lines: _ShardLines,
+) -> int:
+    with subprocess.Popen(  # noqa: S603 . Linter command from user
+        command,
+        stdout=subprocess.PIPE,
+        encoding='utf-8',
+        errors='replace',
+    ) as linter_proc:
+        linter_out = stripped_lines(linter_proc.stdout)  # type: ignore [arg-type]
+        first_line = next(linter_out, None)
+        if first_line is not None:
+            for line_for_out in lines_for_out(
+                changed_lines,
+                itertools.chain([first_line], linter_out),
+                parser,
+                only_violations,
+            ):
+                shard_lines.put(line_for_out)
+        return linter_proc.wait() if first_line is None else 0
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Write filtered linter output."""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Iterable
+from typing import NoReturn
+
+# _internal allow into ondivi app
+from ondivi._internal.ondivi_types import Violation  # noqa: WPS436
+from ondivi._internal.output_formats import OutputFormat  # noqa: WPS436
+
+
+def write_stream(
+    lines_for_out_stream: Iterable[tuple[str, Violation | None]],
+    output_format: OutputFormat,
+    *,
+    flush_lines: bool = True,
+) -> bool:
+    """Write each line while filtering, whole output not held in memory.
+
+    :param lines_for_out_stream: Iterable[tuple[str, Violation | None]], line for out and its violation
+    :param output_format: OutputFormat
+    :param flush_lines: bool, print each line immediately
+    :return: bool, violation found
+    """
+    try:
+        return _written(lines_for_out_stream, output_format, flush_lines)
+    except BrokenPipeError:
+        _exit_on_closed_pipe()
+
+
+def write_raw_lines(raw_lines_for_out: Iterable[tuple[bytes, bool]], *, flush_lines: bool = True) -> bool:
+    """Write lines as bytes without encoding, each line on own line of text output.
+
+    :param raw_lines_for_out: Iterable[tuple[bytes, bool]], line for out without line ending and violation flag
+    :param flush_lines: bool, print each line immediately
+    :return: bool, violation found
+    """
+    try:
+        return _written_raw(raw_lines_for_out, flush_lines)
+    except BrokenPipeError:
+        _exit_on_closed_pipe()
+
+
+def _written(
+    lines_for_out_stream: Iterable[tuple[str, Violation | None]],
+    output_format: OutputFormat,
+    flush_lines: bool,
+) -> bool:
+    violation_found = False
+    separator = ''
+    sys.stdout.write(output_format.header)
+    for line_for_out, violation in lines_for_out_stream:
+        violation_found = violation_found or violation is not None
+        formatted_line = output_format.formatted(line_for_out, violation)
+        if formatted_line is None:
+            continue
+        sys.stdout.write(separator)
+        sys.stdout.write(formatted_line)
+        separator = output_format.separator
+        if flush_lines:
+            sys.stdout.flush()
+    sys.stdout.write(output_format.footer)
+    return violation_found
+
+
+def _written_raw(raw_lines_for_out: Iterable[tuple[bytes, bool]], flush_lines: bool) -> bool:
+    violation_found = False
+    for raw_line, is_violation in raw_lines_for_out:
+        violation_found = violation_found or is_violation
+        sys.stdout.buffer.write(raw_line)
+        sys.stdout.buffer.write(b'\n')
+        if flush_lines:
+            sys.stdout.buffer.flush()
+    return violation_found
+
+
+def _exit_on_closed_pipe() -> NoReturn:
+    # Reader closed pipe (for example `ondivi --stream | head`),
+    # redirect stdout to devnull for avoid second error on interpreter exit
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    sys.exit(1)
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Minimal client of daemon started by "ondivi serve".
+
+Options of "ondivi" parsed by daemon, so client not imports CLI and starts faster than "ondivi --daemon".
+Usage example:
+
+flake8 . | ondivi-client --baseline main
+"""
+
+from __future__ import annotations
+
+import sys
+
+# _internal allow into ondivi app
+from ondivi._internal.daemon_client import run_by_daemon  # noqa: WPS436
+
+
+def main() -> None:
+    """Filter by daemon, in current process like "ondivi" if daemon not started."""
+    args = sys.argv[1:]
+    run_by_daemon({
+        'args': args,
+        'fromfile': _option_value(args, '--fromfile'),
+        'stream': '--stream' in args,
+    })
+    from ondivi.entry import main as ondivi_main  # noqa: WPS433, PLC0415 . Imported only without daemon
+    ondivi_main()
+
+
+def _option_value(args: list[str], option: str) -> str | None:
+    prefix = '{0}='.format(option)
+    for position, arg in enumerate(args):
+        if arg.startswith(prefix):
+            return arg[len(prefix):]
+        if arg == option and position + 1 < len(args):
+            return args[position + 1]
+    return None
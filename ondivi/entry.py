@@ -9,51 +9,82 @@ only for changed lines in a Git repo.
 
 from __future__ import annotations
 
+import signal
 import sys
-import traceback
+from dataclasses import asdict
 from pathlib import Path
+from typing import Any
 
 import click
-from git import Repo
-from git.exc import GitCommandError
 
+from ondivi._internal.baseline_snapshot import BaselineSnapshot
+from ondivi._internal.changed_files import changed_files, files_lines
+from ondivi._internal.changed_lines_index import ChangedLinesIndex
+from ondivi._internal.cli_options import CliOptions as CliOptions  # noqa: PLC0414 . Explicit re-export
+from ondivi._internal.cli_options import write_stats
+from ondivi._internal.cli_pipeline import filtered_output
+from ondivi._internal.compiled_format import DEFAULT_FORMAT, compile_format, violation_parser
 from ondivi._internal.define_additional import define_additional, valid_size
-from ondivi._internal.define_changed_lines import define_changed_lines
-from ondivi._internal.exceptions import InvalidSizeError
+from ondivi._internal.define_changed_lines import define_changed_lines_index
+from ondivi._internal.diff_cache import cached_index
+from ondivi._internal.exceptions import (
+    BaselineSnapshotError,
+    DaemonUnavailableError,
+    FromFileNotFoundError,
+    InvalidInputError,
+    InvalidSizeError,
+    LinterFailedError,
+    RevisionNotFoundError,
+)
 from ondivi._internal.filter_out_violations import filter_out_violations
+from ondivi._internal.input_names import INPUT_FORMAT_NAMES, TEXT_INPUT
 from ondivi._internal.ondivi_types import (
     ActualViolationsListStr,
-    BaselineStr,
     DiffStr,
-    FromFilePathStr,
     LinterAdditionalMessageStr,
     ViolationFormatStr,
+    ViolationParser,
     ViolationStr,
 )
+from ondivi._internal.output_formats import OUTPUT_FORMATS, TEXT_OUTPUT
+from ondivi._internal.presets import PRESETS, preset_format
+from ondivi._internal.profiling import profiled
+from ondivi._internal.run_stats import STATS
+from ondivi._internal.write_output import write_stream
+
+# Errors of options and inputs, reported without stack trace
+_INPUT_ERRORS = (FromFileNotFoundError, RevisionNotFoundError, InvalidInputError, BaselineSnapshotError)
 
 
-def controller(
-    diff: DiffStr,
+def controller(  # noqa: PLR0913 . Keyword only option
+    diff: DiffStr | ChangedLinesIndex | BaselineSnapshot,
     linter_out: list[ViolationStr | LinterAdditionalMessageStr],
-    violation_format: ViolationFormatStr,
+    violation_format: ViolationFormatStr | ViolationParser,
     only_violations: bool,
     random_additional: int | None,
+    *,
+    jobs: int = 1,
 ) -> tuple[ActualViolationsListStr, bool]:
     """Entrypoint.
 
-    :param diff: Diff
+    :param diff: Diff, changed lines index already built from it or fingerprints of baseline violations
     :param linter_out: list[str]
-    :param violation_format: ViolationFormatStr
+    :param violation_format: Template or already compiled parser
     :param only_violations: bool
     :param random_additional: int | None
+    :param jobs: int, count of worker processes for filtering
     :return: tuple[ActualViolationsListStr, bool]
     """
-    filtered_lines, violation_found = filter_out_violations(
-        define_changed_lines(diff),
-        linter_out,
-        violation_format,
-        only_violations,
-    )
+    if isinstance(diff, BaselineSnapshot):
+        filtered_lines, violation_found = diff.filtered(linter_out, violation_parser(violation_format), only_violations)
+    else:
+        filtered_lines, violation_found = filter_out_violations(
+            diff if isinstance(diff, ChangedLinesIndex) else define_changed_lines_index(diff),
+            linter_out,
+            violation_format,
+            only_violations,
+            jobs,
+        )
     if random_additional is not None:
         filtered_lines.extend(define_additional(
             linter_out,
@@ -63,60 +94,31 @@ def controller(
     return filtered_lines, violation_found
 
 
-def _linter_output_from_file(file_path: FromFilePathStr) -> list[str]:
-    if not Path(file_path).exists():
-        sys.stdout.write('File with violations "{0}" not found\n'.format(file_path))
-        sys.exit(1)
-    return Path(file_path).read_text(encoding='utf-8').strip().splitlines()
-
-
-def cli(
-    baseline: BaselineStr,
-    fromfile: FromFilePathStr | None,
-    violation_format: ViolationFormatStr,
-    only_violations: bool,
-    random_additional: int | None,
-) -> None:
+def cli(options: CliOptions) -> None:
     """Controller with CLI side effects.
 
-    :param baseline: BaselineStr
-    :param fromfile: FromFilePathStr | None
-    :param violation_format: ViolationFormatStr
-    :param only_violations: bool
-    :param random_additional: int | None
+    :param options: CliOptions
     """
-    linter_output = (
-        _linter_output_from_file(fromfile)
-        if fromfile
-        else sys.stdin.read().strip().splitlines()
-    )
-    try:
-        diff = Repo('.').git.diff('--unified=0', '--no-ext-diff', '--src-prefix=a/', '--dst-prefix=b/', baseline)
-    except GitCommandError:
-        sys.stdout.write('Revision "{0}" not found'.format(baseline))
-        sys.exit(1)
-    try:
-        filtered_lines, violation_found = controller(
-            diff,
-            linter_output,
-            violation_format,
-            only_violations,
-            random_additional,
-        )
-    except InvalidSizeError:
-        sys.stderr.write('Invalid "size" value. Expected positive integer got: "{0}"'.format(random_additional))
-        sys.exit(2)
-    if filtered_lines:
-        sys.stdout.write(
-            '{0}\n'.format(
-                '\n'.join(filtered_lines),
-            ),
-        )
+    with profiled(options.profile_cpu, options.profile_memory) as stage_hook:
+        # Memory snapshots taken at stage boundaries, so stages recorded for them too
+        stats_requested = options.stats or options.stats_file is not None
+        STATS.start(stats_requested or stage_hook is not None, stage_hook)
+        try:
+            violation_found = filtered_output(options)
+        except _INPUT_ERRORS as err:
+            sys.stdout.write(options.error_message(err))
+            sys.exit(1)
+        except InvalidSizeError:
+            sys.stderr.write(
+                'Invalid "size" value. Expected positive integer got: "{0}"'.format(options.random_additional),
+            )
+            sys.exit(2)
+    write_stats(options)
     if violation_found:
         sys.exit(1)
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option(
     '--baseline',
     default='master',
@@ -129,12 +131,16 @@ def cli(
 @click.option(
     '--fromfile',
     default=None,
-    help='Path to file with violations. Expected "utf-8" encoding',
+    help=' '.join([
+        'Path to file with violations. Expected "utf-8" encoding.',
+        'File read by memory map line by line, whole output kept in memory only for',
+        '"--random-additional", "--diff-linted-files", "--save-baseline" and JSON input formats',
+    ]),
 )
 @click.option(
     '--format',
     'violation_format',
-    default='{filename}:{line_num:d}{other}',
+    default=DEFAULT_FORMAT,
     help=''.join([
         'Template for parsing linter messages. The template should include the following named parts:\n\n',
         '{filename}   The name of the file with the error/warning\n',
@@ -147,10 +153,92 @@ def cli(
         ' - filename: "src/app_types/listable.py"\n\t\t\t\t',
         ' - line_num: 23\n\t\t\t\t\t',
         ' - other: :1: "UP035 Import from collections.abc instead: Sequence"\n\n',
-        'Ensure that the template matches the format of the messages generated by your linter.\n\t\t\t\t',
+        'Ensure that the template matches the format of the messages generated by your linter.\n\n',
+        'Use "--format auto" to detect format by first lines of linter output.\n\t\t\t\t',
         '(default: "{filename}:{line_num:d}{other}")',
     ]),
 )
+@click.option(
+    '--format-candidate',
+    'format_candidates',
+    multiple=True,
+    help=' '.join([
+        'Additional template checked by "--format auto" after built-in presets.',
+        'Can be used multiple times',
+    ]),
+)
+@click.option(
+    '--preset',
+    default=None,
+    type=click.Choice(sorted(PRESETS)),
+    help=' '.join([
+        'Built-in format of linter messages.',
+        'Faster than equivalent "--format" template, overrides "--format"',
+    ]),
+)
+@click.option(
+    '--input-format',
+    default=TEXT_INPUT,
+    type=click.Choice([TEXT_INPUT, *INPUT_FORMAT_NAMES]),
+    help=' '.join([
+        'Format of linter output.',
+        '"text" lines parsed by "--format" or "--preset".',
+        'JSON documents ("sarif", "ruff-json", "eslint-json") read incrementally,',
+        '"json-lines" expects ruff "--output-format json-lines" or mypy "--output json" lines.',
+        'Every kept result printed as JSON line with original object.',
+        'Multiline results kept if any of their lines changed (default: "text")',
+    ]),
+)
+@click.option(
+    '--output-format',
+    default=TEXT_OUTPUT,
+    type=click.Choice(list(OUTPUT_FORMATS)),
+    help=' '.join([
+        'Format of filtered output.',
+        '"json-lines" prints JSON line with violation location and original line,',
+        '"sarif" prints SARIF 2.1.0 log, "junit" prints failed testcase for every violation,',
+        '"github" prints workflow commands for GitHub Actions annotations.',
+        'Lines without violation printed only by "text" (default: "text")',
+    ]),
+)
+@click.option(
+    '--input',
+    'inputs',
+    multiple=True,
+    help=' '.join([
+        'Output of linter as "NAME=PATH[:FORMAT]", can be used multiple times.',
+        'Outputs filtered by one diff, FORMAT is preset, input format or template,',
+        '"--format", "--preset" and "--input-format" used without it.',
+        'Count of violations of every linter printed to stderr.',
+        'Can not be used with "--stream"',
+    ]),
+)
+@click.option(
+    '--context',
+    default=0,
+    type=int,
+    help=' '.join([
+        'Keep violations within N lines before and after changed lines,',
+        'for example unused import near edited line (default: 0)',
+    ]),
+)
+@click.option(
+    '--save-baseline',
+    default=None,
+    help=' '.join([
+        'Path to file for fingerprints of violations in linter output, nothing printed.',
+        'Fingerprint is hash of filename, message and content of violation line',
+    ]),
+)
+@click.option(
+    '--against-baseline',
+    default=None,
+    help=' '.join([
+        'Path to file saved by "--save-baseline".',
+        'Keep violations not found in it instead of violations on changed lines, "git diff" not run.',
+        'Old violation kept after edit of its line',
+    ]),
+)
 @click.option(
     '--only-violations',
     default=False,
@@ -168,13 +256,124 @@ def cli(
         'Requires a positive integer value.',
     ]),
 )
+@click.option(
+    '--stream',
+    default=False,
+    help=' '.join([
+        'Filter linter output line by line and print each kept line immediately.',
+        'Memory usage not depend on linter output size.',
+        'Can not be used with "--random-additional"',
+    ]),
+    is_flag=True,
+)
+@click.option(
+    '--bytes',
+    'raw_bytes',
+    default=False,
+    help=' '.join([
+        'Filter linter output as bytes, kept lines printed without decoding.',
+        'Only filenames decoded, faster for large output.',
+        'Requires "--preset", text input and output formats',
+    ]),
+    is_flag=True,
+)
+@click.option(
+    '--jobs',
+    default=1,
+    type=int,
+    help=' '.join([
+        'Count of processes for filtering linter output, less than 1 for all CPU cores.',
+        'Output shorter than 50000 lines filtered in one process.',
+        'Order of lines preserved (default: 1)',
+    ]),
+)
+@click.option(
+    '--diff-linted-files',
+    default=False,
+    help=' '.join([
+        'Diff only files from linter output, faster for large repositories.',
+        'Whole tree diffed for more than 1000 files.',
+        'Can not be used with "--stream"',
+    ]),
+    is_flag=True,
+)
+@click.option(
+    '--no-cache',
+    default=False,
+    help=' '.join([
+        'Always run "git diff".',
+        'By default changed lines cached in ".git/ondivi" for same baseline, HEAD and modified files',
+    ]),
+    is_flag=True,
+)
+@click.option(
+    '--stats',
+    default=False,
+    help=' '.join([
+        'Print wall and CPU time of stages (linter output read, git diff, diff parsing, filtering, output)',
+        'and counters (input lines, parsed violations, diff files and hunks, kept lines, peak memory) to stderr',
+    ]),
+    is_flag=True,
+)
+@click.option(
+    '--stats-file',
+    default=None,
+    help='Path to JSON file for time of stages and counters, same as "--stats" output',
+)
+@click.option(
+    '--profile-cpu',
+    default=None,
+    help=' '.join([
+        'Path to cProfile dump of run, open it by "python -m pstats FILE" or snakeviz.',
+        'Worker processes of "--jobs" not profiled',
+    ]),
+)
+@click.option(
+    '--profile-memory',
+    default=None,
+    help=' '.join([
+        'Path to tracemalloc report with top allocation sites at start of each stage and at end of run.',
+        'Run slower with this option, times of "--stats" include taking of snapshots',
+    ]),
+)
+@click.option(
+    '--daemon',
+    default=False,
+    help=' '.join([
+        'Filter by daemon started with "ondivi serve", it keeps changed lines and formats in memory.',
+        'Socket path taken from "ONDIVI_SOCKET" environment variable.',
+        'Filter in current process if daemon not started or profile requested.',
+        'Client "ondivi-client" with same options starts faster',
+    ]),
+    is_flag=True,
+)
+@click.pass_context
 # click API based on decorators
-def main(  # noqa: WPS216
+def main(  # noqa: WPS216, PLR0913, PLR0917
+    ctx: click.Context,
     baseline: str,
     fromfile: str | None,
     violation_format: str,
+    format_candidates: tuple[str, ...],
+    preset: str | None,
+    input_format: str,
+    output_format: str,
+    inputs: tuple[str, ...],
+    context: int,
+    save_baseline: str | None,
+    against_baseline: str | None,
     only_violations: bool,
     random_additional: int | None,
+    stream: bool,
+    raw_bytes: bool,
+    jobs: int,
+    diff_linted_files: bool,
+    no_cache: bool,
+    stats: bool,
+    stats_file: str | None,
+    profile_cpu: str | None,
+    profile_memory: str | None,
+    daemon: bool,
 ) -> None:
     """Ondivi (Only diff violations).
 
@@ -184,15 +383,39 @@ def main(  # noqa: WPS216
 
     flake8 script.py | ondivi
     """
+    if ctx.invoked_subcommand:
+        return
+    options = CliOptions(
+        baseline,
+        fromfile,
+        violation_format,
+        only_violations,
+        random_additional,
+        stream,
+        preset,
+        format_candidates,
+        jobs,
+        diff_linted_files,
+        no_cache,
+        input_format,
+        output_format,
+        stats,
+        stats_file,
+        profile_cpu,
+        profile_memory,
+        inputs,
+        context,
+        save_baseline,
+        against_baseline,
+        raw_bytes,
+    )
+    if daemon and not (profile_cpu or profile_memory):
+        from ondivi._internal.daemon_client import run_by_daemon  # noqa: WPS433, PLC0415 . Not needed in hot path
+        run_by_daemon(asdict(options))
     try:
-        cli(
-            baseline,
-            fromfile,
-            violation_format,
-            only_violations,
-            random_additional,
-        )
+        cli(options)
     except Exception as err:  # noqa: BLE001 . Application entrypoint
+        import traceback  # noqa: WPS433, PLC0415 . Not needed in hot path
         sys.stdout.write('\n'.join([
             'Ondivi fail with: "{0}"'.format(err),
             'Please submit it to https://github.com/blablatdinov/ondivi/issues',
@@ -201,3 +424,190 @@ def main(  # noqa: WPS216
             traceback.format_exc(),
         ]))
         sys.exit(1)
+
+
+@main.command()
+@click.option(
+    '--baseline',
+    default='master',
+    help='Commit or branch which will contain legacy code (default: "master")',
+)
+@click.option(
+    '--ext',
+    'extensions',
+    multiple=True,
+    help='Extension of files, for example "--ext py". Can be used multiple times',
+)
+@click.option(
+    '--glob',
+    'globs',
+    multiple=True,
+    help='Glob pattern of path relative to repository root, for example "--glob \'src/*\'". Can be used multiple times',
+)
+@click.option(
+    '--lines',
+    'with_ranges',
+    default=False,
+    help='Print changed lines ranges after path, for example "src/app.py:3-5,12"',
+    is_flag=True,
+)
+@click.option(
+    '-z',
+    '--null',
+    default=False,
+    help='Separate paths by NUL character for "xargs -0"',
+    is_flag=True,
+)
+# click API based on decorators
+def files(  # noqa: WPS216
+    baseline: str,
+    extensions: tuple[str, ...],
+    globs: tuple[str, ...],
+    with_ranges: bool,
+    null: bool,
+) -> None:
+    """Print files with changed lines for linting only them.
+
+    Deleted files and files with only removed lines skipped,
+    paths relative to current directory. Usage example:
+
+    ondivi files -z --ext py | xargs -0 -r flake8 | ondivi
+    """
+    try:
+        changed_lines = cached_index(baseline)
+    except RevisionNotFoundError:
+        sys.stdout.write('Revision "{0}" not found'.format(baseline))
+        sys.exit(1)
+    separator = '\0' if null else '\n'
+    sys.stdout.writelines(
+        '{0}{1}'.format(file_line, separator)
+        for file_line in files_lines(changed_files(changed_lines, extensions, globs), with_ranges)
+    )
+
+
+@main.command()
+@click.option(
+    '--baseline',
+    default='master',
+    help='Commit or branch which will contain legacy code (default: "master")',
+)
+@click.option(
+    '-j',
+    '--jobs',
+    default=0,
+    type=int,
+    help='Count of linter commands run at once, less than 1 for all CPU cores (default: 0)',
+)
+@click.option(
+    '--format',
+    'violation_format',
+    default=DEFAULT_FORMAT,
+    help='Template for parsing linter messages, "auto" not supported (default: "{filename}:{line_num:d}{other}")',
+)
+@click.option(
+    '--preset',
+    default=None,
+    type=click.Choice(sorted(PRESETS)),
+    help='Built-in format of linter messages, overrides "--format"',
+)
+@click.option(
+    '--ext',
+    'extensions',
+    multiple=True,
+    help='Extension of linted files, for example "--ext py". Can be used multiple times',
+)
+@click.option(
+    '--only-violations',
+    default=False,
+    help='Show only violations',
+    is_flag=True,
+)
+@click.argument('command', nargs=-1, required=True)
+# click API based on decorators
+def run(  # noqa: WPS216, PLR0913, PLR0917
+    baseline: str,
+    jobs: int,
+    violation_format: str,
+    preset: str | None,
+    extensions: tuple[str, ...],
+    only_violations: bool,
+    command: tuple[str, ...],
+) -> None:
+    """Run linter on changed files and filter its output.
+
+    Changed files split to shards with near equal size, linter command runs for every shard,
+    "{files}" argument replaced by paths of shard, paths added to the end without it.
+    Kept lines printed in order of shards. Exit code 2 if linter exited
+    with non-zero code without output. Usage example:
+
+    ondivi run -j 8 --ext py -- flake8 {files}
+    """
+    from ondivi._internal.sharded_run import failed_run_message, sharded_lines  # noqa: WPS433, PLC0415 . Only for "run"
+    try:
+        changed_lines = cached_index(baseline)
+    except RevisionNotFoundError:
+        sys.stdout.write('Revision "{0}" not found'.format(baseline))
+        sys.exit(1)
+    try:
+        violation_found = write_stream(
+            sharded_lines(
+                command,
+                files_lines(changed_files(changed_lines, extensions, ()), with_ranges=False),
+                changed_lines,
+                preset_format(preset) if preset else compile_format(violation_format),
+                only_violations,
+                jobs,
+            ),
+            OUTPUT_FORMATS[TEXT_OUTPUT],
+        )
+    except (LinterFailedError, OSError) as err:
+        sys.stderr.write(failed_run_message(command[0], err))
+        sys.exit(2)
+    if violation_found:
+        sys.exit(1)
+
+
+@main.command()
+@click.option(
+    '--socket',
+    'socket_file',
+    default=None,
+    help=' '.join([
+        'Path to socket',
+        '(default: "ONDIVI_SOCKET" environment variable or "ondivi-<uid>.sock" in temp directory)',
+    ]),
+)
+def serve(socket_file: str | None) -> None:
+    """Start daemon for "ondivi --daemon".
+
+    Daemon keeps changed lines and compiled formats in memory between requests,
+    changed lines recalculated after change of HEAD, index or modified files.
+    Requests received concurrently and filtered one by one.
+    """
+    from ondivi._internal.daemon_server import serve as serve_requests  # noqa: WPS433, PLC0415 . Not needed in hot path
+    # Remove socket on "kill" like on Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        serve_requests(
+            Path(socket_file) if socket_file else None,
+            _daemon_cli,
+        )
+    except DaemonUnavailableError:
+        sys.stderr.write('Daemon not supported on this platform')
+        sys.exit(2)
+    except KeyboardInterrupt:
+        sys.stdout.write('Daemon stopped\n')
+
+
+def _daemon_cli(request_options: dict[str, Any]) -> None:
+    client_args = request_options.get('args')
+    if client_args is None:
+        cli(CliOptions(**request_options))
+    else:
+        # Arguments of "ondivi-client" parsed like arguments of "ondivi" without commands
+        click.Command(
+            'ondivi',
+            callback=lambda **option_values: cli(CliOptions(**option_values)),
+            params=[option for option in main.params if option.name != 'daemon'],
+            help=main.help,
+        ).main(client_args, prog_name='ondivi')
@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+r"""Session API for in-process integrations.
+
+Stable API: names of this module, their arguments and return values
+changed only with major version of ondivi.
+
+Usage example:
+
+>>> session = Session.from_diff('\n'.join([
+...     'diff --git a/app.py b/app.py',
+...     '--- a/app.py',
+...     '+++ b/app.py',
+...     '@@ -3,0 +4,1 @@',
+...     '+x = 1',
+... ]))
+>>> session.filtered(['app.py:1:1: E265 block comment', 'app.py:4:2: E225 missing whitespace'], 'flake8')
+(['app.py:4:2: E225 missing whitespace'], True)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TextIO
+
+# _internal allow into ondivi app
+from ondivi._internal.changed_lines_index import ChangedLinesIndex  # noqa: WPS436
+from ondivi._internal.compiled_format import DEFAULT_FORMAT, compile_format  # noqa: WPS436
+from ondivi._internal.define_changed_lines import define_changed_lines_index, index_from_diff_lines  # noqa: WPS436
+from ondivi._internal.exceptions import InvalidInputError as InvalidInputError  # noqa: F401, PLC0414, WPS436
+from ondivi._internal.exceptions import RevisionNotFoundError as RevisionNotFoundError  # noqa: F401, PLC0414, WPS436
+from ondivi._internal.filter_out_violations import lines_for_out, parallel_lines_for_out  # noqa: WPS436
+from ondivi._internal.git_diff import git_diff_lines  # noqa: WPS436
+from ondivi._internal.input_names import (  # noqa: WPS436
+    INPUT_FORMAT_NAMES,
+    TEXT_INPUT,
+    named_input_lines,
+    named_input_parser,
+)
+from ondivi._internal.ondivi_types import ViolationParser  # noqa: WPS436
+from ondivi._internal.presets import PRESETS, preset_format  # noqa: WPS436
+
+
+class Session:
+    """Changed lines of diff with compiled formats for filtering linter outputs.
+
+    Changed lines not modified after building and compiled formats cached under lock,
+    so one session can be shared across threads
+    """
+
+    def __init__(self, changed_lines: ChangedLinesIndex, directory: str | os.PathLike[str] | None = None) -> None:
+        """Ctor, use `from_diff` or `from_repo` for building session.
+
+        :param changed_lines: ChangedLinesIndex
+        :param directory: str | os.PathLike[str] | None, filenames of linter output relative to it,
+            None for current directory at time of filtering
+        """
+        self._changed_lines = changed_lines
+        self._directory = None
+        if directory is not None:
+            self._directory = os.fspath(Path(directory).absolute())
+        self._parsers: dict[str, ViolationParser] = {}
+        self._parsers_lock = threading.Lock()
+
+    @classmethod
+    def from_diff(cls, diff: str, *, context: int = 0) -> Session:
+        """Session for text of "git diff".
+
+        :param diff: str
+        :param context: int, count of lines before and after changed lines kept like changed
+        :return: Session
+        """
+        return cls(define_changed_lines_index(diff).widened(context))
+
+    @classmethod
+    def from_repo(
+        cls,
+        baseline: str = 'master',
+        repo: str | os.PathLike[str] | None = None,
+        *,
+        context: int = 0,
+    ) -> Session:
+        """Session for diff of working tree with baseline.
+
+        :param baseline: str, commit or branch with legacy code
+        :param repo: str | os.PathLike[str] | None, directory of repository, None for current directory.
+            Relative filenames of linter output are relative to it
+        :param context: int, count of lines before and after changed lines kept like changed
+        :return: Session
+        :raises RevisionNotFoundError: baseline not found
+        """
+        return cls(index_from_diff_lines(git_diff_lines(baseline, repo=repo)).widened(context), repo)
+
+    def filtered(
+        self,
+        linter_out: Iterable[str],
+        violation_format: str | ViolationParser = DEFAULT_FORMAT,
+        *,
+        only_violations: bool = False,
+        jobs: int = 1,
+    ) -> tuple[list[str], bool]:
+        """Lines of linter output for changed lines.
+
+        :param linter_out: Iterable[str], lines without line endings
+        :param violation_format: str | ViolationParser, template, name of built-in preset or parser
+        :param only_violations: bool, skip lines without violation
+        :param jobs: int, count of worker processes for output longer than 50000 lines
+        :return: tuple[list[str], bool], kept lines and flag of found violation
+        """
+        kept_lines = []
+        violation_found = False
+        for line, violation in parallel_lines_for_out(
+            self._changed_lines,
+            linter_out,
+            self._parser(violation_format),
+            only_violations,
+            jobs,
+        ):
+            violation_found = violation_found or violation is not None
+            kept_lines.append(line)
+        return kept_lines, violation_found
+
+    def stream_filtered(
+        self,
+        linter_out: TextIO,
+        violation_format: str | ViolationParser = DEFAULT_FORMAT,
+        *,
+        input_format: str = TEXT_INPUT,
+        only_violations: bool = False,
+    ) -> Iterator[str]:
+        """Lazy filter stream of linter output, memory not depend on output size.
+
+        :param linter_out: TextIO
+        :param violation_format: str | ViolationParser, ignored for JSON input format
+        :param input_format: str, "text" or JSON format of "--input-format"
+        :param only_violations: bool, skip lines without violation
+        :yields: str, kept line without line ending, JSON line for every kept result of JSON document
+        :raises InvalidInputError: document not match input format
+        """
+        for line, _ in lines_for_out(
+            self._changed_lines,
+            named_input_lines(linter_out, input_format),
+            (
+                named_input_parser(input_format, self._directory)
+                if input_format in INPUT_FORMAT_NAMES
+                else self._parser(violation_format)
+            ),
+            only_violations,
+        ):
+            yield line
+
+    def _parser(self, violation_format: str | ViolationParser) -> ViolationParser:
+        if not isinstance(violation_format, str):
+            return violation_format
+        with self._parsers_lock:
+            if violation_format not in self._parsers:
+                self._parsers[violation_format] = (
+                    preset_format(violation_format, self._directory)
+                    if violation_format in PRESETS
+                    else compile_format(violation_format, self._directory)
+                )
+            return self._parsers[violation_format]
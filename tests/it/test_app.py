@@ -1,14 +1,19 @@
 # SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
 # SPDX-License-Identifier: MIT
 
-# flake8: noqa: WPS202
-
 """Integration test with installing and check on real git repo."""
 
+import json
 import os
+import pstats
+import socket
 import subprocess
 import sys
+import tempfile
+import time
 from collections.abc import Callable, Generator
+from functools import partial
+from io import StringIO
 from pathlib import Path
 from typing import TypeAlias
 from unittest.mock import patch
@@ -19,7 +24,7 @@ from _pytest.legacypath import TempdirFactory
 from click.testing import CliRunner
 from git import Repo
 
-from ondivi.entry import main
+from ondivi.entry import CliOptions, cli, main
 from tests.helpers.define_repo import define_repo
 
 _RUN_SHELL_T: TypeAlias = Callable[
@@ -129,26 +134,25 @@ def assert_ondivi(bin_dir: Path, run_shell: _RUN_SHELL_T) -> Callable[[], None]:
 
     Run in subprocess
     """
-    def _assert_ondivi() -> None:
-        got = run_shell(
-            [str(bin_dir / 'flake8'), str(Path('inner/file.py'))],
-            [str(bin_dir / 'ondivi')],
-        )
-        assert (
-            got.stdout.decode('utf-8').strip()
-            == '{0}:12:80: E501 line too long (119 > 79 characters)'.format(
-                Path('inner/file.py'),
-            )
+    return partial(_assert_ondivi, bin_dir, run_shell)
+
+
+def _assert_ondivi(bin_dir: Path, run_shell: _RUN_SHELL_T) -> None:
+    got = run_shell(
+        [str(bin_dir / 'flake8'), str(Path('inner/file.py'))],
+        [str(bin_dir / 'ondivi')],
+    )
+    assert (
+        got.stdout.decode('utf-8').strip()
+        == '{0}:12:80: E501 line too long (119 > 79 characters)'.format(
+            Path('inner/file.py'),
         )
-        assert got.returncode == 1
-    return _assert_ondivi
+    )
+    assert got.returncode == 1
 
 
 @pytest.mark.usefixtures('test_repo')
 @pytest.mark.parametrize('version', [
-    ('gitpython==2.1.15',),
-    (_version_from_lock('gitpython'),),
-    ('gitpython', '-U'),
     ('parse==1.4',),
     (_version_from_lock('parse'),),
     ('parse', '-U'),
@@ -424,9 +428,9 @@ def test_git_with_custom_user_config(
 ) -> None:
     """Test that script works correctly when user has custom config for git."""
     monkeypatch.setenv('GIT_CONFIG_COUNT', str(len(git_config)))
-    for i, (k, v) in enumerate(git_config.items()):
-        monkeypatch.setenv(f'GIT_CONFIG_KEY_{i}', k)
-        monkeypatch.setenv(f'GIT_CONFIG_VALUE_{i}', v)
+    for config_idx, (config_key, config_value) in enumerate(git_config.items()):
+        monkeypatch.setenv(f'GIT_CONFIG_KEY_{config_idx}', config_key)
+        monkeypatch.setenv(f'GIT_CONFIG_VALUE_{config_idx}', config_value)
 
     assert_ondivi()
 
@@ -459,7 +463,7 @@ def test_random_additional() -> None:
     (
         '0.5',
         '\n'.join([
-            'Usage: main [OPTIONS]',
+            'Usage: main [OPTIONS] [COMMAND] [ARGS]...',
             "Try 'main --help' for help.",
             '',
             "Error: Invalid value for '--random-additional': '0.5' is not a valid integer.",
@@ -469,7 +473,7 @@ def test_random_additional() -> None:
     (
         'asdf',
         '\n'.join([
-            'Usage: main [OPTIONS]',
+            'Usage: main [OPTIONS] [COMMAND] [ARGS]...',
             "Try 'main --help' for help.",
             '',
             "Error: Invalid value for '--random-additional': 'asdf' is not a valid integer.",
@@ -492,3 +496,830 @@ def test_invalid_additional(size: str, err_text: str) -> None:
 
     assert got.exit_code == 2
     assert got.stderr.strip() == err_text
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [
+    ['--stream'],
+    ['--stream', '--only-violations'],
+])
+def test_stream(args: list[str]) -> None:
+    """Test stream mode."""
+    got = CliRunner().invoke(
+        main,
+        args,
+        input='\n'.join([
+            '',
+            '{0}:3:1: E302 expected 2 blank lines, found 1',
+            '{0}:12:80: E501 line too long (119 > 79 characters)',
+            '{0}:14:1: E305 expected 2 blank lines after class or function definition, found 1',
+            '',
+        ]).format(Path('inner/file.py')),
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout == '{0}:12:80: E501 line too long (119 > 79 characters)\n'.format(Path('inner/file.py'))
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_stream_info_message() -> None:
+    """Test stream mode with info message."""
+    got = CliRunner().invoke(main, ['--stream'], input='\n\nAll files correct!\n\n')
+
+    assert got.exit_code == 0
+    assert got.stdout == 'All files correct!\n'
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_stream_fromfile(file_with_violations: Path) -> None:
+    """Test stream mode with violations from file."""
+    fromfile = str(file_with_violations)
+
+    got = CliRunner().invoke(main, ['--stream', '--fromfile', fromfile], input='')
+
+    assert got.stdout == '{0}:12:80: E501 line too long (119 > 79 characters)\n'.format(Path('inner/file.py'))
+    assert got.exit_code == 1
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_stream_random_additional() -> None:
+    """Test stream mode not support random additional."""
+    got = CliRunner().invoke(main, ['--stream', '--random-additional', '1'], input='')
+
+    assert got.exit_code == 2
+    assert got.stderr == 'Option "--random-additional" can not be used with "--stream"'
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.skipif(sys.platform.startswith('win'), reason='win not support "head"')
+def test_stream_broken_pipe(bin_dir: Path, tmp_path: Path) -> None:
+    """Test stream mode when reader close pipe."""
+    violations_file = tmp_path / 'violations.txt'
+    violations_file.write_text(
+        '\n'.join(['Info message {0}'.format(idx) for idx in range(100000)]),
+        encoding='utf-8',
+    )
+    with subprocess.Popen(
+        [str(bin_dir / 'ondivi'), '--stream', '--fromfile', str(violations_file)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as ondivi_proc:
+        got = subprocess.run(
+            ['head', '-n', '1'],
+            stdin=ondivi_proc.stdout,
+            stdout=subprocess.PIPE,
+            check=False,
+        )
+        ondivi_proc.stdout.close()  # type: ignore [union-attr]
+        stderr = ondivi_proc.stderr.read()  # type: ignore [union-attr]
+
+    assert got.stdout.decode('utf-8') == 'Info message 0\n'
+    assert stderr == b''
+
+
+class _ClosedPipe(StringIO):
+
+    def __init__(self, fileno: int) -> None:
+        super().__init__()
+        self._fileno = fileno
+
+    def write(self, text: str) -> int:
+        raise BrokenPipeError
+
+    def fileno(self) -> int:
+        return self._fileno
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_stream_broken_pipe_in_process(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test stream mode redirect stdout to devnull when reader close pipe."""
+    with (tmp_path / 'stdout.txt').open('w') as stdout_file:
+        monkeypatch.setattr(sys, 'stdin', StringIO('Info message'))
+        monkeypatch.setattr(sys, 'stdout', _ClosedPipe(stdout_file.fileno()))
+        with pytest.raises(SystemExit) as exit_info:
+            cli(CliOptions(
+                'master',
+                None,
+                '{filename}:{line_num:d}{other}',
+                only_violations=False,
+                random_additional=None,
+                stream=True,
+            ))
+
+    assert exit_info.value.code == 1
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [
+    ['--preset', 'flake8'],
+    ['--preset', 'flake8', '--stream'],
+    ['--preset', 'flake8', '--format', 'line={line_num:d} file={filename} {other}'],
+])
+def test_preset(args: list[str]) -> None:
+    """Test built-in linter format."""
+    got = CliRunner().invoke(
+        main,
+        args,
+        input='\n'.join([
+            '{0}:3:1: E302 expected 2 blank lines, found 1',
+            '{0}:12:80: E501 line too long (119 > 79 characters)',
+        ]).format(Path('inner/file.py')),
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout == '{0}:12:80: E501 line too long (119 > 79 characters)\n'.format(Path('inner/file.py'))
+
+
+def test_unknown_preset() -> None:
+    """Test unknown preset."""
+    got = CliRunner().invoke(main, ['--preset', 'unknown'], input='')
+
+    assert got.exit_code == 2
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [
+    ['--format', 'auto'],
+    ['--format', 'auto', '--stream'],
+])
+def test_format_auto(args: list[str]) -> None:
+    """Test detect linter output format."""
+    got = CliRunner().invoke(
+        main,
+        args,
+        input='\n'.join([
+            '{0}:3: error: Function is missing a return type annotation  [no-untyped-def]',
+            '{0}:12: error: Name "x" is not defined  [name-defined]',
+            'Found 2 errors in 1 file (checked 1 source file)',
+        ]).format(Path('inner/file.py')),
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout == '\n'.join([
+        '{0}:12: error: Name "x" is not defined  [name-defined]',
+        'Found 2 errors in 1 file (checked 1 source file)',
+        '',
+    ]).format(Path('inner/file.py'))
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_format_candidate() -> None:
+    """Test detect linter output format from user templates."""
+    got = CliRunner().invoke(
+        main,
+        ['--format', 'auto', '--format-candidate', 'line={line_num:d} file={filename} {other}', '--only-violations'],
+        input='\n'.join([
+            'line=3 file={0} message=E302',
+            'line=12 file={0} message=E501',
+        ]).format(Path('inner/file.py')),
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout == 'line=12 file={0} message=E501\n'.format(Path('inner/file.py'))
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [
+    ['--jobs', '2'],
+    ['--jobs', '0', '--only-violations'],
+    ['--jobs', '2', '--stream'],
+])
+def test_jobs(args: list[str]) -> None:
+    """Test filtering of large linter output in process pool."""
+    got = CliRunner().invoke(
+        main,
+        args,
+        input='\n'.join([
+            '{0}:{1}:80: E501 line too long'.format(Path('inner/file.py'), line_num)
+            for line_num in range(60_000, 0, -1)
+        ]),
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout == '{0}:16:80: E501 line too long\n{0}:12:80: E501 line too long\n'.format(
+        Path('inner/file.py'),
+    )
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_diff_linted_files(file_with_violations: Path) -> None:
+    """Test diff only files from linter output."""
+    fromfile = str(file_with_violations)
+
+    got = CliRunner().invoke(main, ['--diff-linted-files', '--fromfile', fromfile], input='')
+
+    assert got.exit_code == 1
+    assert got.stdout == '{0}:12:80: E501 line too long (119 > 79 characters)\n'.format(Path('inner/file.py'))
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_diff_linted_files_stream() -> None:
+    """Test stream mode not support diff only files from linter output."""
+    got = CliRunner().invoke(main, ['--stream', '--diff-linted-files'], input='')
+
+    assert got.exit_code == 2
+    assert got.stderr == 'Option "--diff-linted-files" can not be used with "--stream"'
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [
+    [],
+    ['--no-cache'],
+    ['--no-cache', '--stream'],
+])
+def test_cache(file_with_violations: Path, args: list[str]) -> None:
+    """Test same result with and without cache of changed lines."""
+    fromfile = str(file_with_violations)
+    CliRunner().invoke(main, ['--fromfile', fromfile], input='')
+
+    got = CliRunner().invoke(main, [*args, '--fromfile', fromfile], input='')
+
+    assert got.exit_code == 1
+    assert got.stdout == '{0}:12:80: E501 line too long (119 > 79 characters)\n'.format(Path('inner/file.py'))
+    assert list(Path('.git/ondivi').glob('*.json'))
+
+
+def _sarif_document(*line_nums: int) -> str:
+    return json.dumps({
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {'name': 'flake8'}},
+            'results': [
+                {
+                    'ruleId': 'E501',
+                    'locations': [{'physicalLocation': {
+                        'artifactLocation': {'uri': 'inner/file.py'},
+                        'region': {'startLine': line_num},
+                    }}],
+                }
+                for line_num in line_nums
+            ],
+        }],
+    }, indent=2)
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [[], ['--stream'], ['--jobs', '2']])
+def test_input_format_sarif(args: list[str]) -> None:
+    """Test filtering results of SARIF document."""
+    sarif_document = _sarif_document(3, 12)
+
+    got = CliRunner().invoke(main, ['--input-format', 'sarif', *args], input=sarif_document)
+
+    assert got.exit_code == 1
+    assert [json.loads(line) for line in got.stdout.splitlines()] == [
+        json.loads(_sarif_document(12))['runs'][0]['results'][0],
+    ]
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_input_format_invalid() -> None:
+    """Test linter output not matched input format."""
+    got = CliRunner().invoke(
+        main,
+        ['--input-format', 'ruff-json'],
+        input='inner/file.py:12:80: E501 line too long (119 > 79 characters)',
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout == 'Linter output is not valid "ruff-json" document'
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [[], ['--stream'], ['--jobs', '2']])
+def test_output_format_sarif(args: list[str]) -> None:
+    """Test SARIF log with kept violations."""
+    got = CliRunner().invoke(
+        main,
+        ['--output-format', 'sarif', *args],
+        input='\n'.join([
+            '{0}:3:1: E302 expected 2 blank lines, found 1',
+            '{0}:12:80: E501 line too long (119 > 79 characters)',
+            'Found 2 errors',
+        ]).format(Path('inner/file.py')),
+    )
+
+    assert got.exit_code == 1
+    assert [
+        sarif_result['message']['text']
+        for sarif_result in json.loads(got.stdout)['runs'][0]['results']
+    ] == ['{0}:12:80: E501 line too long (119 > 79 characters)'.format(Path('inner/file.py'))]
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize(('output_format', 'expected'), [
+    ('github', '::error file=inner/file.py,line=12,endLine=12::inner/file.py:12:80: E501 line too long\n'),
+    ('junit', '<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n<testsuite name="ondivi">\n'),
+])
+def test_output_format(output_format: str, expected: str) -> None:
+    """Test output for CI systems."""
+    got = CliRunner().invoke(
+        main,
+        ['--output-format', output_format],
+        input='inner/file.py:3:1: E302 expected 2 blank lines, found 1\ninner/file.py:12:80: E501 line too long',
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout.startswith(expected)
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [['--no-cache'], ['--stream'], ['--random-additional', '1']])
+def test_stats(args: list[str]) -> None:
+    """Test time of stages and counters in stderr."""
+    got = CliRunner().invoke(
+        main,
+        ['--stats', *args],
+        input='inner/file.py:3:1: E302 expected 2 blank lines, found 1\ninner/file.py:12:80: E501 line too long',
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout.startswith('inner/file.py:12:80: E501 line too long\n')
+    assert {
+        line.split()[0]
+        for line in got.stderr.splitlines()
+        if line.startswith(('filter_out_violations', 'output', 'input_lines', 'kept_lines'))
+    } == {'output', 'filter_out_violations', 'input_lines', 'kept_lines'}
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_stats_file(tmp_path: Path) -> None:
+    """Test stats written as JSON."""
+    stats_file = tmp_path / 'stats.json'
+
+    got = CliRunner().invoke(
+        main,
+        ['--stats-file', str(stats_file), '--no-cache'],
+        input='inner/file.py:3:1: E302 expected 2 blank lines, found 1\nFound 1 error',
+    )
+
+    stats = json.loads(stats_file.read_text(encoding='utf-8'))
+    assert got.exit_code == 0
+    assert not got.stderr
+    assert {'git_diff', 'define_changed_lines', 'filter_out_violations', 'output'} <= set(stats['stages'])
+    assert {
+        counter_name: stats['counters'][counter_name]
+        for counter_name in ('input_lines', 'parsed_violations', 'unparsable_lines', 'kept_lines')
+    } == {'input_lines': 2, 'parsed_violations': 1, 'unparsable_lines': 1, 'kept_lines': 1}
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [['--no-cache'], []])
+def test_stats_diff_counters(tmp_path: Path, args: list[str]) -> None:
+    """Test counters of diff reported for changed lines from cache."""
+    stats_file = tmp_path / 'stats.json'
+    CliRunner().invoke(main)
+
+    CliRunner().invoke(main, ['--stats-file', str(stats_file), *args])
+
+    counters = json.loads(stats_file.read_text(encoding='utf-8'))['counters']
+    assert (counters['diff_files'], counters['diff_hunks']) == (1, 2)
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_profile(tmp_path: Path) -> None:
+    """Test CPU profile and memory report written."""
+    cpu_file = tmp_path / 'cpu.prof'
+    memory_file = tmp_path / 'memory.txt'
+
+    got = CliRunner().invoke(
+        main,
+        ['--profile-cpu', str(cpu_file), '--profile-memory', str(memory_file), '--daemon'],
+        input='inner/file.py:3:1: E302 expected 2 blank lines, found 1\ninner/file.py:12:80: E501 line too long',
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout == 'inner/file.py:12:80: E501 line too long\n'
+    assert not got.stderr
+    assert pstats.Stats(str(cpu_file)).get_stats_profile().func_profiles
+    assert 'Start of stage "filter_out_violations"' in memory_file.read_text(encoding='utf-8')
+
+
+@pytest.fixture
+def linter_inputs(tmp_path: Path) -> list[str]:
+    """Options with outputs of flake8 and mypy."""
+    flake8_file = tmp_path / 'flake8.txt'
+    flake8_file.write_text(
+        '\n'.join([
+            '{0}:3:1: E302 expected 2 blank lines, found 1',
+            '{0}:12:80: E501 line too long (119 > 79 characters)',
+        ]).format(Path('inner/file.py')),
+        encoding='utf-8',
+    )
+    mypy_file = tmp_path / 'mypy.txt'
+    mypy_file.write_text(
+        '\n'.join([
+            '{0}:3: error: Function is missing a return type annotation  [no-untyped-def]',
+            '{0}:12: error: Name "x" is not defined  [name-defined]',
+        ]).format(Path('inner/file.py')),
+        encoding='utf-8',
+    )
+    return [
+        '--input', 'flake8={0}:flake8'.format(flake8_file),
+        '--input', 'mypy={0}:{{filename}}:{{line_num:d}}: {{other}}'.format(mypy_file),
+    ]
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [
+    [],
+    ['--diff-linted-files', '--stats'],
+])
+def test_inputs(linter_inputs: list[str], args: list[str]) -> None:
+    """Test outputs of several linters filtered by one diff."""
+    got = CliRunner().invoke(main, [*linter_inputs, *args], input='')
+
+    assert got.exit_code == 1
+    assert got.stdout == '\n'.join([
+        '{0}:12:80: E501 line too long (119 > 79 characters)',
+        '{0}:12: error: Name "x" is not defined  [name-defined]',
+        '',
+    ]).format(Path('inner/file.py'))
+    assert got.stderr.startswith('flake8: 1 violation(s)\nmypy: 1 violation(s)\n')
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_inputs_random_additional(linter_inputs: list[str]) -> None:
+    """Test additional violations of every linter."""
+    got = CliRunner().invoke(main, [*linter_inputs, '--random-additional', '1'], input='')
+
+    assert got.exit_code == 1
+    assert len(got.stdout.splitlines()) == 4
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_input_not_found(linter_inputs: list[str]) -> None:
+    """Test path of not found output in message."""
+    got = CliRunner().invoke(main, [*linter_inputs, '--input', 'ruff=ruff.txt'], input='')
+
+    assert got.exit_code == 1
+    assert got.stdout == 'File with violations "ruff.txt" not found\n'
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_stream_inputs(linter_inputs: list[str]) -> None:
+    """Test stream mode not support several linters."""
+    got = CliRunner().invoke(main, [*linter_inputs, '--stream'], input='')
+
+    assert got.exit_code == 2
+    assert got.stderr == 'Option "--input" can not be used with "--stream"'
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [[], ['--stream']])
+def test_against_baseline(tmp_path: Path, args: list[str]) -> None:
+    """Test violations not found in saved baseline kept without git diff."""
+    baseline_file = str(tmp_path / 'baseline.bin')
+    saved = CliRunner().invoke(
+        main,
+        ['--save-baseline', baseline_file],
+        input='{0}:10:80: E501 line too long (123 > 79 characters)\n'.format(Path('inner/file.py')),
+    )
+
+    got = CliRunner().invoke(
+        main,
+        ['--against-baseline', baseline_file, '--baseline', 'fakeHash', *args],
+        input='\n'.join([
+            '{0}:10:80: E501 line too long (123 > 79 characters)',
+            '{0}:12:80: E501 line too long (119 > 79 characters)',
+        ]).format(Path('inner/file.py')),
+    )
+
+    assert saved.exit_code == 0
+    assert not saved.stdout
+    assert saved.stderr == '1 violation(s) saved to "{0}"\n'.format(baseline_file)
+    assert got.exit_code == 1
+    assert got.stdout == '{0}:12:80: E501 line too long (119 > 79 characters)\n'.format(Path('inner/file.py'))
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_against_baseline_not_found() -> None:
+    """Test not existing baseline snapshot."""
+    got = CliRunner().invoke(main, ['--against-baseline', 'not-existing.bin'], input='')
+
+    assert got.exit_code == 1
+    assert got.stdout == 'Baseline snapshot "not-existing.bin" not found or invalid'
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize(('args', 'expected'), [
+    (['--save-baseline', 'baseline.bin', '--stream'], 'Option "--save-baseline" can not be used with "--stream"'),
+    (
+        ['--save-baseline', 'baseline.bin', '--input', 'flake8=flake8.txt'],
+        'Option "--input" can not be used with baseline snapshot',
+    ),
+])
+def test_baseline_conflict(args: list[str], expected: str) -> None:
+    """Test options not supported with baseline snapshot."""
+    got = CliRunner().invoke(main, args, input='')
+
+    assert got.exit_code == 2
+    assert got.stderr == expected
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('args', [[], ['--stream'], ['--only-violations']])
+def test_bytes(args: list[str]) -> None:
+    """Test kept lines printed without decoding."""
+    got = CliRunner().invoke(
+        main,
+        ['--bytes', '--preset', 'flake8', *args],
+        input=b'\n'.join([
+            '{0}:3:1: E302 expected 2 blank lines, found 1'.format(Path('inner/file.py')).encode(),
+            '{0}:12:80: E501 line too long \xff'.format(Path('inner/file.py')).encode('latin-1'),
+        ]),
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout_bytes == '{0}:12:80: E501 line too long \xff\n'.format(Path('inner/file.py')).encode('latin-1')
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_bytes_fromfile(file_with_violations: Path) -> None:
+    """Test file filtered as bytes like decoded file."""
+    fromfile = str(file_with_violations)
+
+    got = CliRunner().invoke(main, ['--bytes', '--preset', 'flake8', '--fromfile', fromfile])
+    decoded = CliRunner().invoke(main, ['--preset', 'flake8', '--fromfile', fromfile])
+
+    assert got.exit_code == decoded.exit_code
+    assert got.stdout == decoded.stdout
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize(('args', 'expected'), [
+    (['--bytes'], 'Option "--bytes" requires "--preset"'),
+    (['--bytes', '--preset', 'flake8', '--jobs', '2'], 'Option "--jobs" can not be used with "--bytes"'),
+])
+def test_bytes_conflict(args: list[str], expected: str) -> None:
+    """Test options not supported with filtering of not decoded lines."""
+    got = CliRunner().invoke(main, args, input='')
+
+    assert got.exit_code == 2
+    assert got.stderr == expected
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize(('args', 'expected_lines'), [
+    ([], [12]),
+    (['--context', '1'], [12, 13]),
+    (['--context', '1', '--stream', '--no-cache'], [12, 13]),
+])
+def test_context(args: list[str], expected_lines: list[int]) -> None:
+    """Test violations near changed lines."""
+    got = CliRunner().invoke(
+        main,
+        ['--only-violations', *args],
+        input='\n'.join([
+            '{0}:3:1: E302 expected 2 blank lines, found 1',
+            '{0}:12:80: E501 line too long (119 > 79 characters)',
+            '{0}:13:1: W291 trailing whitespace',
+        ]).format(Path('inner/file.py')),
+    )
+
+    assert got.exit_code == 1
+    got_lines = got.stdout.splitlines()
+    assert [int(line.split(':')[1]) for line in got_lines] == expected_lines
+
+
+def test_negative_context() -> None:
+    """Test negative count of context lines rejected."""
+    got = CliRunner().invoke(main, ['--context', '-1'], input='')
+
+    assert got.exit_code == 2
+    assert got.stderr == 'Invalid "--context" value. Expected not negative integer got: "-1"'
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize(('args', 'expected'), [
+    ([], '{0}\n'),
+    (['--ext', 'py', '--lines'], '{0}:12,16\n'),
+    (['--glob', 'inner/*', '-z'], '{0}\0'),
+    (['--ext', 'md'], ''),
+])
+def test_files(args: list[str], expected: str) -> None:
+    """Test changed files for linter."""
+    got = CliRunner().invoke(main, ['files', *args])
+
+    assert got.exit_code == 0
+    assert got.stdout == expected.format(Path('inner/file.py'))
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_files_revision_not_found() -> None:
+    """Test changed files for not existing baseline."""
+    got = CliRunner().invoke(main, ['files', '--baseline', 'fakeHash'])
+
+    assert got.exit_code == 1
+    assert got.stdout == 'Revision "fakeHash" not found'
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('jobs', ['1', '0'])
+def test_run(bin_dir: Path, jobs: str) -> None:
+    """Test linter run on changed files."""
+    flake8 = str(bin_dir / 'flake8')
+
+    got = CliRunner().invoke(
+        main,
+        ['run', '-j', jobs, '--preset', 'flake8', '--ext', 'py', '--', flake8, '{files}'],
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout == '{0}:12:80: E501 line too long (119 > 79 characters)\n'.format(Path('inner/file.py'))
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_run_without_changed_files(bin_dir: Path) -> None:
+    """Test linter not run without changed files."""
+    flake8 = str(bin_dir / 'flake8')
+
+    got = CliRunner().invoke(main, ['run', '--ext', 'md', '--', flake8])
+
+    assert got.exit_code == 0
+    assert not got.stdout
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_run_command_not_found() -> None:
+    """Test not existing linter."""
+    got = CliRunner().invoke(main, ['run', '--', 'not-existing-linter'])
+
+    assert got.exit_code == 2
+    assert got.stderr == 'Command "not-existing-linter" not found'
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_run_linter_failed() -> None:
+    """Test linter exited with error code without output."""
+    got = CliRunner().invoke(main, ['run', '--', sys.executable, '-c', 'import sys; sys.exit(3)'])
+
+    assert got.exit_code == 2
+    assert got.stderr == 'Command "{0}" failed with exit code 3'.format(sys.executable)
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_run_revision_not_found() -> None:
+    """Test linter run for not existing baseline."""
+    got = CliRunner().invoke(main, ['run', '--baseline', 'fakeHash', '--', 'flake8'])
+
+    assert got.exit_code == 1
+    assert got.stdout == 'Revision "fakeHash" not found'
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_output_format_random_additional() -> None:
+    """Test additional violations in JSON lines."""
+    got = CliRunner().invoke(
+        main,
+        ['--output-format', 'json-lines', '--random-additional', '1'],
+        input='\n'.join([
+            'inner/file.py:3:1: E302 expected 2 blank lines, found 1',
+            'Found 1 error',
+        ]),
+    )
+
+    assert got.exit_code == 0
+    got_lines = got.stdout.splitlines()
+    assert [json.loads(line)['line_num'] for line in got_lines] == [3]
+
+
+@pytest.fixture
+def daemon_socket(bin_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Socket of started daemon."""
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = Path(socket_dir) / 'ondivi.sock'
+        monkeypatch.setenv('ONDIVI_SOCKET', str(socket_path))
+        serve_command = [str(bin_dir / 'ondivi'), 'serve']
+        with subprocess.Popen(serve_command, stdout=subprocess.PIPE) as daemon_proc:
+            while not socket_path.exists():
+                time.sleep(0.01)
+            yield socket_path
+            daemon_proc.terminate()
+            assert daemon_proc.communicate()[0] == b'Daemon stopped\n'
+        assert not socket_path.exists()
+
+
+@pytest.mark.usefixtures('test_repo', 'daemon_socket')
+@pytest.mark.skipif(sys.platform.startswith('win'), reason='win not support unix sockets')
+@pytest.mark.parametrize('args', [
+    ['--daemon'],
+    ['--daemon', '--stream'],
+    ['--daemon', '--format', 'auto'],
+    ['--daemon', '--bytes', '--preset', 'flake8'],
+])
+def test_daemon(args: list[str]) -> None:
+    """Test filtering by daemon."""
+    runner = CliRunner()
+    linter_out = '\n'.join([
+        '{0}:3:1: E302 expected 2 blank lines, found 1',
+        '{0}:12:80: E501 line too long (119 > 79 characters)',
+    ]).format(Path('inner/file.py'))
+    runner.invoke(main, args, input=linter_out)
+
+    got = runner.invoke(main, args, input=linter_out)
+
+    assert got.exit_code == 1
+    assert got.stdout == '{0}:12:80: E501 line too long (119 > 79 characters)\n'.format(Path('inner/file.py'))
+
+
+@pytest.mark.usefixtures('test_repo', 'daemon_socket')
+@pytest.mark.skipif(sys.platform.startswith('win'), reason='win not support unix sockets')
+def test_daemon_error() -> None:
+    """Test error message and exit code from daemon."""
+    got = CliRunner().invoke(main, ['--daemon', '--baseline', 'fakeHash'], input='')
+
+    assert got.exit_code == 1
+    assert got.stdout == 'Revision "fakeHash" not found'
+
+
+@pytest.mark.usefixtures('test_repo', 'daemon_socket')
+@pytest.mark.skipif(sys.platform.startswith('win'), reason='win not support unix sockets')
+@pytest.mark.parametrize('args', [[], ['--stream'], ['--bytes', '--preset', 'flake8']])
+def test_client(bin_dir: Path, args: list[str]) -> None:
+    """Test filtering by daemon with arguments parsed by daemon."""
+    got = subprocess.run(
+        [str(bin_dir / 'ondivi-client'), *args],
+        input='\n'.join([
+            '{0}:3:1: E302 expected 2 blank lines, found 1',
+            '{0}:12:80: E501 line too long (119 > 79 characters)',
+        ]).format(Path('inner/file.py')).encode(),
+        capture_output=True,
+        check=False,
+    )
+
+    assert got.returncode == 1
+    assert got.stdout == '{0}:12:80: E501 line too long (119 > 79 characters)\n'.format(Path('inner/file.py')).encode()
+
+
+@pytest.mark.usefixtures('test_repo', 'daemon_socket')
+@pytest.mark.skipif(sys.platform.startswith('win'), reason='win not support unix sockets')
+@pytest.mark.parametrize('args', [['--jobs', 'x'], ['files']])
+def test_client_invalid_args(bin_dir: Path, args: list[str]) -> None:
+    """Test usage error of arguments parsed by daemon."""
+    client = str(bin_dir / 'ondivi-client')
+
+    got = subprocess.run([client, *args], capture_output=True, check=False)
+
+    assert got.returncode == 2
+    assert b'Usage: ondivi' in got.stderr
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_daemon_not_started(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test filtering in current process without daemon."""
+    monkeypatch.setenv('ONDIVI_SOCKET', str(tmp_path / 'ondivi.sock'))
+
+    got = CliRunner().invoke(
+        main,
+        ['--daemon'],
+        input='{0}:12:80: E501 line too long (119 > 79 characters)'.format(Path('inner/file.py')),
+    )
+
+    assert got.exit_code == 1
+    assert got.stdout == '{0}:12:80: E501 line too long (119 > 79 characters)\n'.format(Path('inner/file.py'))
+
+
+def test_serve_interrupted() -> None:
+    """Test daemon stopped by Ctrl+C."""
+    with (
+        patch('ondivi._internal.daemon_server.serve', side_effect=KeyboardInterrupt),
+        patch('signal.signal'),
+    ):
+        got = CliRunner().invoke(main, ['serve', '--socket', 'ondivi.sock'])
+
+    assert got.exit_code == 0
+    assert got.stdout == 'Daemon stopped\n'
+
+
+@pytest.mark.usefixtures('test_repo')
+@pytest.mark.parametrize('client', [True, False])
+def test_serve_request(client: bool) -> None:
+    """Test arguments of "ondivi-client" and options of "--daemon" handled by daemon."""
+    args = ['--baseline', 'fakeHash']
+    option_values = main.make_context('ondivi', list(args)).params
+    del option_values['daemon']
+    request_options = {'args': args} if client else option_values
+    with (
+        patch(
+            'ondivi._internal.daemon_server.serve',
+            side_effect=lambda _, handle_request: handle_request(request_options),
+        ),
+        patch('signal.signal'),
+    ):
+        got = CliRunner().invoke(main, ['serve', '--socket', 'ondivi.sock'], input='')
+
+    assert got.exit_code == 1
+    assert got.stdout == 'Revision "fakeHash" not found'
+
+
+def test_serve_not_supported(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test daemon on platform without unix sockets."""
+    monkeypatch.delattr(socket, 'AF_UNIX', raising=False)
+    monkeypatch.delenv('ONDIVI_SOCKET', raising=False)
+
+    with patch('signal.signal'):
+        got = CliRunner().invoke(main, ['serve'])
+
+    assert got.exit_code == 2
+    assert got.stderr == 'Daemon not supported on this platform'
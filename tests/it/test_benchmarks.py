@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test benchmark suite of filtering pipeline."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from benchmarks.suite import main
+from benchmarks.synthetic import diff_text, linter_output
+from benchmarks.timings import Timings, regressions
+from ondivi._internal.define_changed_lines import define_changed_lines  # noqa: WPS436
+
+
+def test_diff_text() -> None:
+    """Test hunks spread across files."""
+    got = define_changed_lines(diff_text(5, 3))
+
+    assert got == {
+        'src/package_0/module_0.py': [1, 2, 21, 22],
+        'src/package_1/module_1.py': [1, 2, 21, 22],
+        'src/package_2/module_2.py': [1, 2],
+    }
+
+
+def test_linter_output() -> None:
+    """Test same output on every run."""
+    got = linter_output(100, 3, 'mypy')
+
+    assert got == linter_output(100, 3, 'mypy')
+    assert got[-1] == 'Found 100 errors in 1000 files (checked 1000 source files)'
+
+
+def test_regressions() -> None:
+    """Test stages compared by time relative to calibration."""
+    got = regressions(
+        Timings(0.5, {'small/diff': 0.01, 'small/parse': 0.01, 'small/output': 0.0001, 'large/diff': 1}),
+        Timings(1, {'small/diff': 0.02, 'small/parse': 0.03, 'small/output': 0.0009, 'medium/diff': 1}),
+        tolerance=0.25,
+    )
+
+    assert got == ['small/parse']
+
+
+def test_run_and_compare(tmp_path: Path) -> None:
+    """Test compare saved timings with slowed ones."""
+    runner = CliRunner()
+    baseline = str(tmp_path / 'baseline.json')
+    slowed = tmp_path / 'slowed.json'
+    runner.invoke(main, ['run', '--case', 'small', '--repeat', '1', '--save', baseline])
+    timings = json.loads(Path(baseline).read_text(encoding='utf-8'))
+    timings['stages'] = dict.fromkeys(timings['stages'], 1)
+    slowed.write_text(json.dumps(timings), encoding='utf-8')
+
+    got = runner.invoke(main, ['compare', baseline, '--timings', str(slowed)])
+
+    assert got.exit_code == 1
+    assert 'small/controller' in got.stdout
+    assert runner.invoke(main, ['compare', baseline, '--timings', baseline]).exit_code == 0
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test modules imported on CLI startup.
+
+Ondivi run on every commit in pre-commit hooks, so entrypoint must import
+only modules needed for every run. Heavy modules imported behind options which need them
+"""
+
+import os
+import site
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# ruff: noqa: S603 Not a production code
+
+
+def _interpreter_modules(code: str) -> set[str]:
+    """Modules of interpreter after code run.
+
+    Interpreter started without "site", so ".pth" files of environment not import modules on startup.
+    Packages of environment available by PYTHONPATH
+    """
+    repo_root = str(Path(__file__).parents[2])
+    python_path = os.pathsep.join([repo_root, *site.getsitepackages()])
+    return set(subprocess.run(
+        [sys.executable, '-S', '-c', 'import sys\n{0}\nprint(*sys.modules)'.format(code)],
+        capture_output=True,
+        check=True,
+        env={**os.environ, 'PYTHONPATH': python_path},
+    ).stdout.decode('utf-8').split())
+
+
+def _imported_modules() -> set[str]:
+    """Modules imported by entrypoint, excluding modules of bare interpreter started same way."""
+    return _interpreter_modules('import ondivi.entry') - _interpreter_modules('')
+
+
+@pytest.mark.parametrize('module', [
+    'git',
+    'subprocess',
+    'json',
+    'html',
+    'concurrent',
+    'mmap',
+    'heapq',
+    'queue',
+    'hashlib',
+    'random',
+    'ondivi._internal.input_formats',
+    'ondivi._internal.sharded_run',
+    'ondivi._internal.daemon_server',
+])
+def test_module_not_imported(module: str) -> None:
+    """Test module not imported on startup."""
+    got = _imported_modules()
+
+    assert module not in got
+    assert 'ondivi.entry' in got
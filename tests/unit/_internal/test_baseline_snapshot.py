@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test fingerprints of baseline violations."""
+
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.baseline_snapshot import (  # noqa: WPS436
+    BaselineSnapshot,
+    fingerprinted,
+    load_snapshot,
+    save_snapshot,
+)
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
+from ondivi._internal.exceptions import BaselineSnapshotError  # noqa: WPS436
+
+_PARSER = compile_format('{filename}:{line_num:d}{other}')
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Current directory with source file."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'app.py').write_text('import os\nx = 1\n', encoding='utf-8')
+    return tmp_path
+
+
+@pytest.mark.usefixtures('source_dir')
+def test_save_and_load() -> None:
+    """Test loaded fingerprints equal to fingerprints of saved violations."""
+    linter_out = ['app.py:1:1: F401 unused import', 'app.py:2:5: E1', 'app.py:2:5: E1', 'Found 3 errors']
+
+    got = save_snapshot('baseline.bin', linter_out, _PARSER)
+
+    assert got == 2
+    assert Path('baseline.bin').stat().st_size == 24
+    assert load_snapshot('baseline.bin') == BaselineSnapshot(frozenset(
+        fingerprint for _, violation, fingerprint in fingerprinted(linter_out, _PARSER) if violation
+    ))
+
+
+def test_moved_line(source_dir: Path) -> None:
+    """Test violation of moved line found in snapshot."""
+    save_snapshot('baseline.bin', ['app.py:2:5: E1 x'], _PARSER)
+    (source_dir / 'app.py').write_text('import os\n\n\nx  =  1\n', encoding='utf-8')
+
+    got = load_snapshot('baseline.bin').filtered(['app.py:4:7: E1 x', 'Found 1 error'], _PARSER, only_violations=False)
+
+    assert got == (['Found 1 error'], False)
+
+
+def test_edited_line(source_dir: Path) -> None:
+    """Test violation of edited line kept."""
+    save_snapshot('baseline.bin', ['app.py:2:5: E1 x'], _PARSER)
+    (source_dir / 'app.py').write_text('import os\nx = 2\n', encoding='utf-8')
+
+    got = load_snapshot('baseline.bin').filtered(['app.py:2:5: E1 x', 'Found 1 error'], _PARSER, only_violations=True)
+
+    assert got == (['app.py:2:5: E1 x'], True)
+
+
+@pytest.mark.usefixtures('source_dir')
+def test_rule_codes() -> None:
+    """Test violations of same line with different rule codes not collide."""
+    save_snapshot('baseline.bin', ['app.py:2:5: E501 x'], _PARSER)
+
+    got = load_snapshot('baseline.bin').filtered(['app.py:2:5: E502 x'], _PARSER, only_violations=True)
+
+    assert got == (['app.py:2:5: E502 x'], True)
+
+
+@pytest.mark.usefixtures('source_dir')
+@pytest.mark.parametrize('violation', ['app.py:5:1: E1', 'deleted.py:1:1: E1'])
+def test_missing_source_line(violation: str) -> None:
+    """Test violation without source line fingerprinted by message."""
+    save_snapshot('baseline.bin', [violation], _PARSER)
+
+    got = list(load_snapshot('baseline.bin').lines_for_out([violation], _PARSER, only_violations=False))
+
+    assert not got
+
+
+@pytest.mark.usefixtures('source_dir')
+@pytest.mark.parametrize('snapshot', [b'', b'ONDIVIB1', b'ONDIVIB2\x01'])
+def test_invalid_snapshot(snapshot: bytes) -> None:
+    """Test file not saved by save_snapshot."""
+    Path('baseline.bin').write_bytes(snapshot)
+
+    with pytest.raises(BaselineSnapshotError):
+        load_snapshot('baseline.bin')
+
+
+@pytest.mark.usefixtures('source_dir')
+def test_snapshot_not_found() -> None:
+    """Test not existing snapshot file."""
+    with pytest.raises(BaselineSnapshotError):
+        load_snapshot('not-existing.bin')
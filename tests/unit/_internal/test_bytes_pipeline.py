@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test filtering of not decoded linter output."""
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.bytes_pipeline import bytes_lines_for_out  # noqa: WPS436
+from ondivi._internal.changed_lines_index import index_from_ranges  # noqa: WPS436
+from ondivi._internal.presets import preset_bytes_pattern  # noqa: WPS436
+
+
+@pytest.mark.parametrize(('only_violations', 'expected'), [
+    (False, [(b'./file.py:3:1: E302 \xff', True), (b'Found 3 errors', False)]),
+    (True, [(b'./file.py:3:1: E302 \xff', True)]),
+])
+def test_bytes_lines_for_out(only_violations: bool, expected: list[tuple[bytes, bool]]) -> None:
+    """Test violations of changed lines kept as is."""
+    got = list(bytes_lines_for_out(
+        index_from_ranges({'file.py': [(3, 4)]}),
+        [b'./file.py:3:1: E302 \xff', b'file.py:9:1: E302 msg', b'other.py:3:1: E302 msg', b'Found 3 errors'],
+        preset_bytes_pattern('flake8'),
+        only_violations,
+    ))
+
+    assert got == expected
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test changed files."""
+
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.changed_files import changed_files, files_lines  # noqa: WPS436
+from ondivi._internal.changed_lines_index import index_from_ranges  # noqa: WPS436
+
+_CHANGED_LINES = index_from_ranges({
+    str(Path('src/app.py')): [(3, 5), (12, 12)],
+    str(Path('src/deleted.py')): [],
+    str(Path('docs/index.md')): [(1, 1)],
+    'setup.py': [(7, 8)],
+})
+
+
+@pytest.mark.parametrize(('extensions', 'globs', 'expected'), [
+    ([], [], ['src/app.py', 'docs/index.md', 'setup.py']),
+    (['py'], [], ['src/app.py', 'setup.py']),
+    (['.md', 'py'], ['src/*', 'docs/*'], ['src/app.py', 'docs/index.md']),
+])
+def test_changed_files(extensions: list[str], globs: list[str], expected: list[str]) -> None:
+    """Test files filtered by extension and glob."""
+    got = changed_files(_CHANGED_LINES, extensions, globs)
+
+    assert list(got) == [str(Path(filename)) for filename in expected]
+
+
+@pytest.mark.parametrize(('with_ranges', 'expected'), [
+    (False, ['src/app.py', 'setup.py']),
+    (True, ['src/app.py:3-5,12', 'setup.py:7-8']),
+])
+def test_files_lines(with_ranges: bool, expected: list[str]) -> None:
+    """Test paths with and without ranges."""
+    got = files_lines(changed_files(_CHANGED_LINES, ['py'], []), with_ranges)
+
+    assert list(got) == [str(Path(file_line)) for file_line in expected]
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test index of changed lines."""
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.changed_lines_index import index_from_lines, index_from_ranges  # noqa: WPS436
+
+
+def test_merge_ranges() -> None:
+    """Test merging overlapped and adjacent ranges."""
+    got = index_from_ranges({
+        'file.py': [(30, 31), (1, 5), (3, 10), (11, 11)],
+        'deleted.py': [(28, 27)],
+    })
+
+    assert got.ranges() == {
+        'file.py': [(1, 11), (30, 31)],
+        'deleted.py': [],
+    }
+
+
+@pytest.mark.parametrize(('filename', 'line_num', 'expected'), [
+    ('file.py', 1, True),
+    ('file.py', 2, True),
+    ('file.py', 3, False),
+    ('file.py', 0, False),
+    ('file.py', 30, True),
+    ('file.py', 31, False),
+    ('foo.py', 1, False),
+    ('empty.py', 1, False),
+])
+def test_contains(filename: str, line_num: int, expected: bool) -> None:
+    """Test lookup changed line."""
+    index = index_from_ranges({
+        'file.py': [(1, 2), (10, 20), (30, 30)],
+        'empty.py': [],
+    })
+
+    got = index.contains(filename, line_num)
+
+    assert got is expected
+
+
+def test_from_lines() -> None:
+    """Test index from dict with lists of lines."""
+    got = index_from_lines({
+        'file.py': [3, 1, 2, 7],
+        'empty.py': [],
+    })
+
+    assert got.ranges() == {
+        'file.py': [(1, 3), (7, 7)],
+        'empty.py': [],
+    }
+
+
+def test_as_dict() -> None:
+    """Test index in form of dict with lists of lines."""
+    got = index_from_ranges({
+        'file.py': [(27, 28), (30, 31)],
+        'empty.py': [],
+    })
+
+    assert got.as_dict() == {
+        'file.py': [27, 28, 30, 31],
+        'empty.py': [],
+    }
+
+
+@pytest.mark.parametrize(('first_line', 'last_line', 'expected'), [
+    (8, 9, False),
+    (8, 10, True),
+    (15, 25, True),
+    (20, 29, True),
+    (21, 29, False),
+    (1, 100, True),
+])
+def test_overlaps(first_line: int, last_line: int, expected: bool) -> None:
+    """Test lookup changed line in range."""
+    index = index_from_ranges({'file.py': [(10, 20), (30, 30)]})
+
+    got = index.overlaps('file.py', first_line, last_line)
+
+    assert got is expected
+
+
+def test_overlaps_not_changed_file() -> None:
+    """Test lookup range in file without changes."""
+    index = index_from_ranges({'file.py': [(10, 20)]})
+
+    got = index.overlaps('foo.py', 1, 100)
+
+    assert not got
+
+
+def test_widened() -> None:
+    """Test ranges widened and merged."""
+    index = index_from_ranges({
+        'file.py': [(2, 2), (10, 12), (15, 15), (100, 100)],
+        'empty.py': [],
+    })
+
+    got = index.widened(2)
+
+    assert got.ranges() == {
+        'file.py': [(1, 4), (8, 17), (98, 102)],
+        'empty.py': [],
+    }
+
+
+def test_widened_without_context() -> None:
+    """Test index as is without context."""
+    index = index_from_ranges({'file.py': [(2, 2)]})
+
+    assert index.widened(0) is index
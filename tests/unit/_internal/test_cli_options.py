@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test options of command line interface."""
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.cli_options import CliOptions  # noqa: WPS436
+from ondivi._internal.exceptions import (  # noqa: WPS436
+    BaselineSnapshotError,
+    FromFileNotFoundError,
+    InvalidInputError,
+    RevisionNotFoundError,
+)
+from ondivi._internal.input_formats import INPUT_FORMATS  # noqa: WPS436
+from ondivi._internal.presets import preset_format  # noqa: WPS436
+
+
+def _options(**kwargs: object) -> CliOptions:
+    return CliOptions(
+        **{  # type: ignore [arg-type]
+            'baseline': 'master',
+            'fromfile': 'violations.txt',
+            'violation_format': '{filename}:{line_num:d}{other}',
+            'only_violations': False,
+            'random_additional': None,
+            'stream': False,
+            **kwargs,
+        },
+    )
+
+
+def test_parser_priority() -> None:
+    """Test input format parser before preset."""
+    got = _options(preset='flake8', input_format='sarif').parser([])
+
+    assert got is INPUT_FORMATS['sarif']
+
+
+def test_preset_parser() -> None:
+    """Test preset parser before template."""
+    got = _options(preset='flake8').parser([])
+
+    assert got is preset_format('flake8')
+
+
+@pytest.mark.parametrize(('error', 'expected'), [
+    (FromFileNotFoundError(), 'File with violations "violations.txt" not found\n'),
+    (InvalidInputError(), 'Linter output is not valid "text" document'),
+    (RevisionNotFoundError(), 'Revision "master" not found'),
+    (BaselineSnapshotError(), 'Baseline snapshot "baseline.bin" not found or invalid'),
+])
+def test_error_message(error: Exception, expected: str) -> None:
+    """Test message for error."""
+    got = _options(against_baseline='baseline.bin').error_message(error)
+
+    assert got == expected
+
+
+@pytest.mark.parametrize(('kwargs', 'expected'), [
+    ({}, None),
+    ({'random_additional': 1}, '--random-additional'),
+    ({'diff_linted_files': True}, '--diff-linted-files'),
+    ({'save_baseline': 'baseline.bin'}, '--save-baseline'),
+])
+def test_stream_conflict(kwargs: dict[str, object], expected: str | None) -> None:
+    """Test option not supported by stream mode."""
+    got = _options(**kwargs).stream_conflict()
+
+    assert got == expected
+
+
+@pytest.mark.parametrize(('kwargs', 'expected'), [
+    ({}, None),
+    ({'random_additional': 1}, '--random-additional'),
+    ({'output_format': 'sarif'}, '--output-format'),
+    ({'jobs': 0}, '--jobs'),
+    ({'against_baseline': 'baseline.bin'}, '--against-baseline'),
+])
+def test_bytes_conflict(kwargs: dict[str, object], expected: str | None) -> None:
+    """Test option not supported by filtering of not decoded lines."""
+    got = _options(**kwargs).bytes_conflict()
+
+    assert got == expected
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test filtering of linter output by command line options."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.changed_lines_index import index_from_ranges  # noqa: WPS436
+from ondivi._internal.cli_options import CliOptions  # noqa: WPS436
+from ondivi._internal.cli_pipeline import batch_output, stream_output  # noqa: WPS436
+
+_FORMAT = '{filename}:{line_num:d}{other}'
+
+
+@pytest.fixture
+def violations_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Linter output with diff of one changed line."""
+    monkeypatch.setattr(
+        CliOptions,
+        'changed_lines',
+        lambda *_: index_from_ranges({'file.py': [(3, 3)]}),
+    )
+    linter_output = tmp_path / 'violations.txt'
+    linter_output.write_text('file.py:1:1: E1\nfile.py:3:1: E2\n', encoding='utf-8')
+    return linter_output
+
+
+@pytest.mark.parametrize('output', [batch_output, stream_output])
+def test_output(
+    violations_file: Path,
+    capsys: pytest.CaptureFixture[str],
+    output: Callable[[CliOptions], bool],
+) -> None:
+    """Test kept lines printed."""
+    got = output(CliOptions(
+        'master',
+        str(violations_file),
+        _FORMAT,
+        only_violations=False,
+        random_additional=None,
+        stream=False,
+    ))
+
+    assert got is True
+    assert capsys.readouterr().out == 'file.py:3:1: E2\n'
+
+
+def test_stream_conflict(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test stream mode not support random additional."""
+    with pytest.raises(SystemExit, match='2'):
+        stream_output(CliOptions('master', None, _FORMAT, only_violations=False, random_additional=1, stream=True))
+
+    assert capsys.readouterr().err == 'Option "--random-additional" can not be used with "--stream"'
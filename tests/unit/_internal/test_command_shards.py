@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test changed files split to linter commands."""
+
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.command_shards import balanced_shards, shard_command, shard_commands  # noqa: WPS436
+
+
+def test_balanced_shards(tmp_path: Path) -> None:
+    """Test shards with near equal size."""
+    file_sizes = {'a.py': 60, 'b.py': 50, 'c.py': 40, 'd.py': 30, 'e.py': 20}
+    for filename, file_size in file_sizes.items():
+        (tmp_path / filename).write_text('x' * file_size, encoding='utf-8')
+
+    got = balanced_shards([str(tmp_path / name) for name in file_sizes], 2)
+
+    shard_names = [[Path(path).name for path in shard] for shard in got]
+    assert shard_names == [['a.py', 'd.py', 'e.py'], ['b.py', 'c.py']]
+
+
+def test_more_shards_than_files() -> None:
+    """Test empty shards skipped, not existing file has zero size."""
+    got = balanced_shards(['deleted.py'], 4)
+
+    assert got == [['deleted.py']]
+
+
+@pytest.mark.parametrize(('command', 'expected'), [
+    (['flake8', '--count'], ['flake8', '--count', 'a.py', 'b.py']),
+    (['mypy', '{files}', '--strict'], ['mypy', 'a.py', 'b.py', '--strict']),
+])
+def test_shard_command(command: list[str], expected: list[str]) -> None:
+    """Test paths of shard in command."""
+    got = shard_command(command, ['a.py', 'b.py'])
+
+    assert got == expected
+
+
+def test_shard_commands(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test paths split to several commands by size of command line."""
+    monkeypatch.setattr('ondivi._internal.command_shards.COMMAND_SIZE_LIMIT', 25)
+
+    got = shard_commands(['flake8', '{files}'], ['a.py', 'b.py', 'c.py', 'long-file-name.py'])
+
+    assert got == [['flake8', 'a.py', 'b.py'], ['flake8', 'c.py'], ['flake8', 'long-file-name.py']]
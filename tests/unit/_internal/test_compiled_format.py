@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test compiled linter message format."""
+
+import re
+from collections.abc import Callable
+
+# _internal allow into ondivi app
+from ondivi._internal.compiled_format import (  # noqa: WPS436
+    RegexFormat,
+    compile_format,
+    violation_parser,
+)
+from ondivi._internal.ondivi_types import Violation  # noqa: WPS436
+
+
+def test_violation(localize_violation_path: Callable[[str], str]) -> None:
+    """Test parse violation."""
+    got = compile_format('{filename}:{line_num:d}:{col_num:d}: {message}').violation(
+        'inner/file.py:12:80: E501 line too long (119 > 79 characters)',
+    )
+
+    assert got == Violation(localize_violation_path('inner/file.py'), 12)
+
+
+def test_not_violation() -> None:
+    """Test line without violation."""
+    got = compile_format('{filename}:{line_num:d}:{col_num:d}: {message}').violation('Found 18 errors.')
+
+    assert got is None
+
+
+def test_line_num_without_conversion() -> None:
+    """Test line number of template without ":d" conversion."""
+    parser = compile_format('{filename}:{line_num}: {message}')
+
+    got = [parser.violation('file.py:12: E1'), parser.violation('file.py:col: E1')]
+
+    assert got == [Violation('file.py', 12), None]
+
+
+def test_reuse_compiled_format() -> None:
+    """Test one compiled format for several lines."""
+    compiled_format = compile_format('line={line_num:d} file={filename} {other}')
+
+    assert [
+        compiled_format.violation(line)
+        for line in ('line=12 file=file.py message=`print` found', 'line=3 file=foo.py message=E302')
+    ] == [Violation('file.py', 12), Violation('foo.py', 3)]
+
+
+def test_regex_format() -> None:
+    """Test parse violation by regular expression."""
+    regex_format = RegexFormat(re.compile(r'line=(?P<line_num>\d+) file=(?P<filename>\S+) '))
+
+    assert [
+        regex_format.violation(line)
+        for line in ('line=12 file=file.py message=`print` found', 'Found 1 error')
+    ] == [Violation('file.py', 12), None]
+
+
+def test_violation_parser_from_template() -> None:
+    """Test parser compiled from template."""
+    got = violation_parser('line={line_num:d} file={filename} {other}')
+
+    assert got.violation('line=12 file=file.py message=`print` found') == Violation('file.py', 12)
+
+
+def test_violation_parser_compiled() -> None:
+    """Test already compiled parser returned as is."""
+    regex_format = RegexFormat(re.compile(r'(?P<filename>.+):(?P<line_num>\d+)'))
+
+    assert violation_parser(regex_format) is regex_format
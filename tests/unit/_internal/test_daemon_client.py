@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test client of ondivi daemon."""
+
+import json
+import socket
+import sys
+import tempfile
+import threading
+from collections.abc import Generator
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.daemon_client import SOCKET_ENV, daemon_exit_code, run_by_daemon, socket_path  # noqa: WPS436
+from ondivi._internal.exceptions import DaemonUnavailableError  # noqa: WPS436
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='win not support unix sockets')
+
+
+@pytest.fixture
+def short_tmp_path() -> Generator[Path, None, None]:
+    """Temp directory with short path, length of unix socket path limited."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield Path(tmp_dir)
+
+
+def _fake_daemon(path: Path, answer: bytes) -> list[bytes]:
+    """Start daemon answering same frames for one request, request stored in returned list."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen()
+    requests: list[bytes] = []
+
+    def _serve() -> None:  # noqa: WPS430
+        connection, _ = server.accept()
+        with server, connection, connection.makefile('rb') as reader:
+            requests.append(reader.read())
+            connection.sendall(answer)
+    threading.Thread(target=_serve, daemon=True).start()
+    return requests
+
+
+def test_socket_path_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test socket path from environment variable."""
+    monkeypatch.setenv(SOCKET_ENV, '/run/ondivi.sock')
+
+    assert socket_path() == Path('/run/ondivi.sock')
+
+
+def test_default_socket_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test socket in temp directory."""
+    monkeypatch.delenv(SOCKET_ENV, raising=False)
+
+    assert socket_path().parent == Path(tempfile.gettempdir())
+
+
+def test_unix_socket_not_supported(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test platform without unix sockets."""
+    monkeypatch.delattr(socket, 'AF_UNIX')
+
+    with pytest.raises(DaemonUnavailableError):
+        socket_path()
+
+
+def test_daemon_not_started(short_tmp_path: Path) -> None:
+    """Test daemon not started."""
+    with pytest.raises(DaemonUnavailableError):
+        daemon_exit_code(short_tmp_path / 'ondivi.sock', {'fromfile': None})
+
+
+def test_daemon_exit_code(
+    short_tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test linter output sent and answer written to stdout and stderr."""
+    monkeypatch.setattr(sys, 'stdin', StringIO('file.py:3:1: E302\n'))
+    requests = _fake_daemon(short_tmp_path / 'ondivi.sock', b'o6\nFound\ne5\nerrorx1\n')
+
+    got = daemon_exit_code(short_tmp_path / 'ondivi.sock', {'fromfile': None})
+
+    header, linter_out = requests[0].split(b'\n', 1)
+    assert got == 1
+    assert capsys.readouterr() == ('Found\n', 'error')
+    assert json.loads(header) == {
+        'cwd': str(Path.cwd()),
+        'options': {'fromfile': None},
+    }
+    assert linter_out == b'file.py:3:1: E302\n'
+
+
+def test_bytes_not_decoded(short_tmp_path: Path, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+    """Test payload written to stdout as is."""
+    _fake_daemon(short_tmp_path / 'ondivi.sock', b'o2\n\xff\nx1\n')
+
+    got = daemon_exit_code(short_tmp_path / 'ondivi.sock', {'fromfile': 'violations.txt'})
+
+    assert got == 1
+    assert capsysbinary.readouterr() == (b'\xff\n', b'')
+
+
+def test_fromfile_not_sent(short_tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test stdin not sent for linter output from file."""
+    monkeypatch.setattr(sys, 'stdin', StringIO('file.py:3:1: E302\n'))
+    requests = _fake_daemon(short_tmp_path / 'ondivi.sock', b'x0\n')
+
+    got = daemon_exit_code(short_tmp_path / 'ondivi.sock', {'fromfile': 'violations.txt'})
+
+    assert got == 0
+    assert requests[0].endswith(b'}\n')
+
+
+def test_daemon_closed_connection(short_tmp_path: Path) -> None:
+    """Test daemon closed connection without exit code."""
+    _fake_daemon(short_tmp_path / 'ondivi.sock', b'')
+
+    got = daemon_exit_code(short_tmp_path / 'ondivi.sock', {'fromfile': 'violations.txt'})
+
+    assert got == 1
+
+
+def test_run_by_daemon(short_tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test exit with code of daemon."""
+    monkeypatch.setenv(SOCKET_ENV, str(short_tmp_path / 'ondivi.sock'))
+    _fake_daemon(short_tmp_path / 'ondivi.sock', b'x2\n')
+
+    with pytest.raises(SystemExit) as exit_info:
+        run_by_daemon({'fromfile': 'violations.txt'})
+
+    assert exit_info.value.code == 2
+
+
+def test_run_without_daemon(short_tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test return if daemon not started."""
+    monkeypatch.setenv(SOCKET_ENV, str(short_tmp_path / 'ondivi.sock'))
+
+    run_by_daemon({'fromfile': 'violations.txt'})
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test ondivi daemon."""
+
+import json
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.daemon_client import RequestOptions  # noqa: WPS436
+from ondivi._internal.daemon_server import serve  # noqa: WPS436
+from ondivi._internal.exceptions import DaemonUnavailableError  # noqa: WPS436
+
+_DEFAULT_OPTIONS = MappingProxyType({'fail': '', 'code': 0, 'raw': False, 'stream': False})
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='win not support unix sockets')
+
+
+def _handle_request(options: RequestOptions) -> None:
+    if options['fail']:
+        raise ValueError(options['fail'])
+    if options['raw']:
+        sys.stdout.buffer.write(sys.stdin.buffer.read())
+    else:
+        sys.stdout.write(sys.stdin.read().upper())
+    sys.stderr.write('err')
+    if options['code'] is not None:
+        sys.exit(options['code'])
+
+
+@pytest.fixture
+def daemon_socket() -> Generator[Path, None, None]:
+    """Socket of started daemon."""
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = Path(socket_dir) / 'ondivi.sock'
+        threading.Thread(target=serve, args=(socket_path, _handle_request), daemon=True).start()
+        while not socket_path.exists():
+            time.sleep(0.01)
+        yield socket_path
+
+
+def _answer(socket_path: Path, options: RequestOptions, linter_out: bytes, cwd: str = '') -> bytes:
+    return _raw_answer(socket_path, b'\n'.join([_request_header(options, cwd), linter_out]))
+
+
+def _request_header(options: RequestOptions, cwd: str = '') -> bytes:
+    return json.dumps({
+        'cwd': cwd or str(Path.cwd()),
+        'options': {**_DEFAULT_OPTIONS, **options},
+    }).encode()
+
+
+def _raw_answer(socket_path: Path, request: bytes) -> bytes:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path))
+        connection.sendall(request)
+        connection.shutdown(socket.SHUT_WR)
+        with connection.makefile('rb') as reader:
+            return reader.read()
+
+
+@pytest.mark.parametrize(('code', 'exit_frame'), [
+    (1, b'x1\n'),
+    (0, b'x0\n'),
+    (None, b'x0\n'),
+])
+@pytest.mark.parametrize('stream', [True, False])
+def test_answer(daemon_socket: Path, code: int | None, exit_frame: bytes, stream: bool) -> None:
+    """Test frames of stdout, stderr and exit code."""
+    got = _answer(daemon_socket, {'code': code, 'stream': stream}, b'line\n')
+
+    assert got == b''.join([b'o5\nLINE\n', b'e3\nerr', exit_frame])
+
+
+def test_bytes_answer(daemon_socket: Path) -> None:
+    """Test bytes written to stdout buffer sent without decoding."""
+    got = _answer(daemon_socket, {'raw': True}, b'\xff\n')
+
+    assert got == b'o2\n\xff\ne3\nerrx0\n'
+
+
+@pytest.mark.parametrize('request_header', [b'', b'not json\n', b'{}\n', b'[]\n'])
+def test_invalid_request(daemon_socket: Path, request_header: bytes) -> None:
+    """Test error answered for invalid request and next request handled."""
+    got = _raw_answer(daemon_socket, request_header)
+
+    assert got == b'e15\nInvalid requestx2\n'
+    assert _answer(daemon_socket, {}, b'a') == b'o1\nAe3\nerrx0\n'
+
+
+def test_concurrent_requests(daemon_socket: Path) -> None:
+    """Test request handled while linter output of other request not received."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as slow_connection:
+        slow_connection.connect(str(daemon_socket))
+        slow_connection.sendall(b'\n'.join([_request_header({}), b'first ']))
+
+        got = _answer(daemon_socket, {}, b'a')
+
+        slow_connection.sendall(b'line')
+        slow_connection.shutdown(socket.SHUT_WR)
+        with slow_connection.makefile('rb') as reader:
+            assert reader.read() == b'o10\nFIRST LINEe3\nerrx0\n'
+    assert got == b'o1\nAe3\nerrx0\n'
+
+
+def test_fail(daemon_socket: Path) -> None:
+    """Test traceback on fail of request."""
+    got = _answer(daemon_socket, {'fail': 'Fail'}, b'')
+
+    assert b'ValueError: Fail' in got
+    assert got.endswith(b'x1\n')
+
+
+def test_next_request_after_fail(daemon_socket: Path) -> None:
+    """Test daemon serve requests after not existing working directory."""
+    first = _answer(daemon_socket, {}, b'', cwd='/not/exist')
+
+    got = _answer(daemon_socket, {}, b'a')
+
+    assert first.endswith(b'x1\n')
+    assert got == b'o1\nAe3\nerrx0\n'
+
+
+def test_socket_mode(daemon_socket: Path) -> None:
+    """Test socket available only for owner."""
+    socket_mode = daemon_socket.stat().st_mode
+
+    assert socket_mode & 0o777 == 0o600
+
+
+def test_unix_socket_not_supported(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test daemon on platform without unix sockets."""
+    monkeypatch.delattr(socket, 'AF_UNIX')
+
+    with pytest.raises(DaemonUnavailableError):
+        serve(tmp_path / 'ondivi.sock', _handle_request)
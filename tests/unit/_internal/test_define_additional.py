@@ -5,8 +5,10 @@
 
 import pytest
 
-from ondivi._internal.define_additional import define_additional, valid_size
+from ondivi._internal.compiled_format import compile_format
+from ondivi._internal.define_additional import define_additional, valid_size, with_additional
 from ondivi._internal.exceptions import InvalidSizeError
+from ondivi._internal.ondivi_types import Violation
 
 
 def test() -> None:
@@ -122,3 +124,22 @@ def test_additional_after_fix() -> None:
     )
 
     assert before_fix == after_fix
+
+
+def test_with_additional() -> None:
+    """Test additional lines with violations after filtered lines."""
+    got = with_additional(
+        [('file.py:3:1: Error #2', Violation('file.py', 3)), ('Found 3 errors', None)],
+        ['file.py:1:1: Error #1', 'file.py:3:1: Error #2', 'Found 3 errors'],
+        compile_format('{filename}:{line_num:d}{other}'),
+        2,
+    )
+
+    assert got == (
+        [
+            ('file.py:3:1: Error #2', Violation('file.py', 3)),
+            ('Found 3 errors', None),
+            ('file.py:1:1: Error #1', Violation('file.py', 1)),
+        ],
+        True,
+    )
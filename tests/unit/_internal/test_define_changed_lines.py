@@ -7,7 +7,7 @@ from collections.abc import Callable
 from pathlib import Path
 
 # _internal allow into ondivi app
-from ondivi._internal.define_changed_lines import define_changed_lines  # noqa: WPS436
+from ondivi._internal.define_changed_lines import define_changed_lines, define_changed_lines_index  # noqa: WPS436
 
 
 def test_define_changed_files(localize_violation_path: Callable[[str], str]) -> None:
@@ -41,3 +41,29 @@ def test_define_filename() -> None:
     )
 
     assert got == {'file.py': []}
+
+
+def test_define_changed_ranges(localize_violation_path: Callable[[str], str]) -> None:
+    """Testing search changed ranges."""
+    got = define_changed_lines_index(
+        '\n'.join([
+            'diff --git a/ondivi/__main__.py b/ondivi/__main__.py',
+            'index 669d0ff..7a518fa 100644',
+            '--- a/ondivi/__main__.py',
+            '+++ b/ondivi/__main__.py',
+            '@@ -26,0 +27,2 @@ from git import Repo',
+            '+Diff = str',
+            '+FileName = str',
+            '@@ -28 +30,2 @@ from git import Repo',
+            '-def define_changed_lines(diff):',
+            '+',
+            '+def define_changed_lines(diff: Diff) -> dict[FileName, list[int]]:',
+            '@@ -40,2 +41,0 @@ from git import Repo',
+            '-removed = 1',
+            '-removed = 2',
+        ]),
+    )
+
+    assert got.ranges() == {
+        localize_violation_path('ondivi/__main__.py'): [(27, 28), (30, 31)],
+    }
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test detect format of linter output."""
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.detect_format import auto_candidates, detected_parser, sampled  # noqa: WPS436
+from ondivi._internal.ondivi_types import Violation  # noqa: WPS436
+from ondivi._internal.presets import preset_format  # noqa: WPS436
+
+
+@pytest.mark.parametrize(('sample', 'line', 'expected'), [
+    (
+        [
+            'file.py:16: error: Argument 2 to "User" has incompatible type "str"  [arg-type]',
+            'Found 1 error in 1 file (checked 1 source file)',
+        ],
+        'file.py:3: note: See https://mypy.rtfd.io',
+        Violation('file.py', 3),
+    ),
+    (
+        [
+            '************* Module file',
+            'file.py:1:0: C0114: Missing module docstring (missing-module-docstring)',
+        ],
+        'file.py:7:4: W0612: Unused variable (unused-variable)',
+        Violation('file.py', 7),
+    ),
+    (
+        ['line=12 file=file.py message=`print` found'],
+        'line=3 file=foo.py message=E302',
+        Violation('foo.py', 3),
+    ),
+])
+def test_detect(sample: list[str], line: str, expected: Violation) -> None:
+    """Test detect format by sample."""
+    got = detected_parser(sample, auto_candidates(['line={line_num:d} file={filename} {other}']))
+
+    assert got.violation(line) == expected
+
+
+def test_best_match_rate() -> None:
+    """Test candidate with the best match rate chosen."""
+    mypy_preset = preset_format('mypy')
+
+    got = detected_parser(
+        [
+            'file.py:16: error: Argument 2 to "User" has incompatible type "str"  [arg-type]',
+            'file.py:18:5: error: Name "x" is not defined  [name-defined]',
+        ],
+        [preset_format('flake8'), mypy_preset],
+    )
+
+    assert got is mypy_preset
+
+
+def test_nothing_matched() -> None:
+    """Test default template when nothing matched."""
+    got = detected_parser(['All checks passed!'], [preset_format('flake8')])
+
+    assert got.violation('file.py:3: custom message') == Violation('file.py', 3)
+
+
+def test_sampled() -> None:
+    """Test sample read ahead and returned to output."""
+    sample, linter_out = sampled(iter(['a', 'b', 'c']), 2)
+
+    assert sample == ['a', 'b']
+    assert list(linter_out) == ['a', 'b', 'c']
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test cache of changed lines index."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+# _internal allow into ondivi app
+from ondivi._internal import diff_cache  # noqa: WPS436
+from ondivi._internal.define_changed_lines import index_from_diff_lines  # noqa: WPS436
+from ondivi._internal.exceptions import RevisionNotFoundError  # noqa: WPS436
+from ondivi._internal.git_diff import git_diff_lines  # noqa: WPS436
+from tests.helpers.define_repo import define_repo
+
+
+@pytest.fixture
+def test_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Repo:
+    """Real git repository from fixture."""
+    define_repo(Path('tests/fixtures/test-repo.yaml').read_text(), tmp_path)
+    monkeypatch.chdir(tmp_path)
+    return Repo(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def _memory_cleared() -> None:
+    _clear_memory()
+
+
+@pytest.fixture
+def baseline(test_repo: Repo) -> str:
+    """Hash of first commit."""
+    return str(list(test_repo.iter_commits())[-1])
+
+
+def _clear_memory() -> None:
+    diff_cache._entry_index.cache_clear()  # noqa: SLF001, WPS437 . Entries kept in memory between tests
+
+
+def _failed_diff(baseline: str, filenames: object = None) -> Iterator[str]:
+    raise AssertionError
+
+
+def _failed_touch(path: object) -> None:
+    # Not writable by owner of process, root can update read only file
+    raise PermissionError
+
+
+def test_cache_miss(baseline: str) -> None:
+    """Test index built from diff and stored in git directory."""
+    got = diff_cache.cached_index(baseline)
+
+    assert got == index_from_diff_lines(git_diff_lines(baseline))
+    assert len(list(Path('.git/ondivi').glob('*.json'))) == 1
+
+
+def test_cache_hit(baseline: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test git diff not run for cached index."""
+    expected = diff_cache.cached_index(baseline)
+    _clear_memory()
+    monkeypatch.setattr('ondivi._internal.diff_cache.git_diff_lines', _failed_diff)
+
+    got = diff_cache.cached_index(baseline)
+
+    assert got == expected
+
+
+@pytest.mark.parametrize('filenames', [['inner/file.py'], []])
+def test_filenames_in_key(baseline: str, filenames: list[str]) -> None:
+    """Test separate entries for diff of different files."""
+    diff_cache.cached_index(baseline)
+
+    got = diff_cache.cached_index(baseline, filenames)
+
+    assert got == index_from_diff_lines(git_diff_lines(baseline, filenames))
+    assert len(list(Path('.git/ondivi').glob('*.json'))) == 2
+
+
+def test_memory_cache(baseline: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test index kept in memory for same repository state."""
+    expected = diff_cache.cached_index(baseline)
+    next(Path('.git/ondivi').glob('*.json')).unlink()
+    monkeypatch.setattr('ondivi._internal.diff_cache.git_diff_lines', _failed_diff)
+
+    got = diff_cache.cached_index(baseline)
+
+    assert got == expected
+
+
+def test_read_only_entry(baseline: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test entry used when its modification time can not be updated."""
+    expected = diff_cache.cached_index(baseline)
+    _clear_memory()
+    next(Path('.git/ondivi').glob('*.json')).chmod(0o444)
+    monkeypatch.setattr('ondivi._internal.diff_cache.os.utime', _failed_touch)
+    monkeypatch.setattr('ondivi._internal.diff_cache.git_diff_lines', _failed_diff)
+
+    got = diff_cache.cached_index(baseline)
+
+    assert got == expected
+
+
+def test_modified_file(baseline: str) -> None:
+    """Test cache invalidated by change of working tree."""
+    diff_cache.cached_index(baseline)
+    Path('inner/file.py').write_text('from dataclasses import dataclass\n', encoding='utf-8')
+
+    got = diff_cache.cached_index(baseline)
+
+    assert got == index_from_diff_lines(git_diff_lines(baseline))
+
+
+def test_deleted_file(baseline: str) -> None:
+    """Test diff with deleted file."""
+    Path('inner/file.py').unlink()
+
+    got = diff_cache.cached_index(baseline)
+
+    assert got == index_from_diff_lines(git_diff_lines(baseline))
+
+
+def test_corrupted_entry(baseline: str) -> None:
+    """Test corrupted entry rebuilt."""
+    diff_cache.cached_index(baseline)
+    cache_file = next(Path('.git/ondivi').glob('*.json'))
+    cache_file.write_text('{', encoding='utf-8')
+    _clear_memory()
+
+    got = diff_cache.cached_index(baseline)
+
+    assert got == index_from_diff_lines(git_diff_lines(baseline))
+    assert cache_file.read_text(encoding='utf-8') != '{'
+
+
+def test_not_writable_cache(baseline: str) -> None:
+    """Test index returned when cache can not be stored."""
+    Path('.git/ondivi').write_text('', encoding='utf-8')
+
+    got = diff_cache.cached_index(baseline)
+
+    assert got == index_from_diff_lines(git_diff_lines(baseline))
+
+
+def test_eviction(test_repo: Repo, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test least recently used entries evicted."""
+    commits = [str(commit) for commit in test_repo.iter_commits()]
+    diff_cache.cached_index(commits[-1])
+    first_entry = next(Path('.git/ondivi').glob('*.json'))
+    monkeypatch.setattr('ondivi._internal.diff_cache.CACHE_SIZE_LIMIT', first_entry.stat().st_size)
+
+    diff_cache.cached_index(commits[0])
+
+    assert not first_entry.exists()
+    assert len(list(Path('.git/ondivi').glob('*.json'))) == 1
+
+
+def test_repo_path_with_space(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test repository in directory with space in name."""
+    repo_path = tmp_path / 'my repo'
+    repo_path.mkdir()
+    define_repo(Path('tests/fixtures/test-repo.yaml').read_text(), repo_path)
+    monkeypatch.chdir(repo_path)
+    baseline = str(list(Repo(repo_path).iter_commits())[-1])
+
+    got = diff_cache.cached_index(baseline)
+
+    assert got == index_from_diff_lines(git_diff_lines(baseline))
+    assert len(list(Path('.git/ondivi').glob('*.json'))) == 1
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_revision_not_found() -> None:
+    """Test undefined revision."""
+    with pytest.raises(RevisionNotFoundError):
+        diff_cache.cached_index('fakeHash')
@@ -3,8 +3,51 @@
 
 """Tests for ondivi."""
 
+import os
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import ClassVar, TypeAlias
+
+import pytest
+
 # _internal allow into ondivi app
-from ondivi._internal.filter_out_violations import filter_out_violations  # noqa: WPS436
+from ondivi._internal import filter_out_violations as filter_module  # noqa: WPS436
+from ondivi._internal.changed_lines_index import index_from_ranges  # noqa: WPS436
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
+from ondivi._internal.filter_out_violations import (  # noqa: WPS436
+    filter_out_violations,
+    lines_for_out,
+    parallel_lines_for_out,
+)
+from ondivi._internal.input_formats import INPUT_FORMATS  # noqa: WPS436
+
+_Chunk: TypeAlias = list[str]
+_ChunkFilter: TypeAlias = Callable[[_Chunk], object]
+
+
+class _InlinePool:
+
+    chunks: ClassVar[list[_Chunk]] = []
+
+    def __init__(
+        self,
+        workers: int,
+        initializer: Callable[..., None],
+        initargs: tuple[object, ...],
+    ) -> None:
+        initializer(*initargs)
+
+    def __enter__(self) -> '_InlinePool':  # noqa: PYI034 . typing.Self not available in python3.10
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Nothing to shutdown."""
+
+    def submit(self, chunk_filter: _ChunkFilter, chunk: _Chunk) -> Future[object]:
+        self.chunks.append(chunk)
+        future: Future[object] = Future()
+        future.set_result(chunk_filter(chunk))
+        return future
 
 
 def test_without_violation() -> None:
@@ -86,3 +129,91 @@ def test_path_starts_with_dot() -> None:
 
     assert violations == ['./file.py:3:1: line too long']
     assert found
+
+
+def test_changed_lines_index() -> None:
+    """Test filtering by changed lines index."""
+    violations, found = filter_out_violations(
+        index_from_ranges({'file.py': [(10, 20)]}),
+        [
+            'file.py:9:1: line too long',
+            'file.py:15:1: line too long',
+            'file.py:21:1: line too long',
+        ],
+        '{filename}:{line_num:d}:{col_num:d}: {message}',
+        only_violations=False,
+    )
+
+    assert violations == ['file.py:15:1: line too long']
+    assert found
+
+
+@pytest.mark.parametrize('jobs', [2, 0])
+def test_parallel_order_preserved(monkeypatch: pytest.MonkeyPatch, jobs: int) -> None:
+    """Test filtering in process pool keep order of lines."""
+    monkeypatch.setattr(filter_module, 'PARALLEL_THRESHOLD', 4)
+    monkeypatch.setattr(filter_module, 'CHUNK_SIZE', 3)
+    monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+    linter_out = [
+        'file.py:{0}:1: line too long'.format(line_num) if line_num % 3 else 'Info message {0}'.format(line_num)
+        for line_num in range(1, 30)
+    ]
+    changed_lines = index_from_ranges({'file.py': [(5, 8), (20, 25)]})
+    parser = compile_format('{filename}:{line_num:d}:{col_num:d}: {message}')
+
+    got = list(parallel_lines_for_out(changed_lines, linter_out, parser, only_violations=False, jobs=jobs))
+
+    assert got == list(lines_for_out(changed_lines, linter_out, parser, only_violations=False))
+
+
+def test_parallel_chunks_submitted_without_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test index and parser sent to workers by pool initializer, only chunks submitted."""
+    monkeypatch.setattr(filter_module, 'PARALLEL_THRESHOLD', 4)
+    monkeypatch.setattr(filter_module, 'CHUNK_SIZE', 3)
+    monkeypatch.setattr('concurrent.futures.ProcessPoolExecutor', _InlinePool)
+    monkeypatch.setattr(_InlinePool, 'chunks', [])
+    linter_out = ['file.py:{0}:1: line too long'.format(line_num) for line_num in range(1, 30)]
+
+    got = list(parallel_lines_for_out(
+        index_from_ranges({'file.py': [(5, 8)]}),
+        linter_out,
+        compile_format('{filename}:{line_num:d}:{col_num:d}: {message}'),
+        only_violations=True,
+        jobs=2,
+    ))
+
+    assert [line for line, _ in got] == linter_out[4:8]
+    assert _InlinePool.chunks == [
+        linter_out[chunk_start:chunk_start + 3]
+        for chunk_start in range(0, 29, 3)
+    ]
+
+
+def test_parallel_violation_found() -> None:
+    """Test violation found in one of chunks."""
+    violations, found = filter_out_violations(
+        {'file.py': [25_000]},
+        ['file.py:{0}:1: line too long'.format(line_num) for line_num in range(1, 60_001)],
+        '{filename}:{line_num:d}:{col_num:d}: {message}',
+        only_violations=True,
+        jobs=2,
+    )
+
+    assert violations == ['file.py:25000:1: line too long']
+    assert found
+
+
+def test_multiline_violation() -> None:
+    """Test violation kept if any of its lines changed."""
+    violations, found = filter_out_violations(
+        {'file.py': [14]},
+        [
+            '{"file": "file.py", "line": 10, "end_line": 20}',
+            '{"file": "file.py", "line": 15, "end_line": 20}',
+        ],
+        INPUT_FORMATS['json-lines'],
+        only_violations=False,
+    )
+
+    assert violations == ['{"file": "file.py", "line": 10, "end_line": 20}']
+    assert found
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test diff of working tree with baseline."""
+
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+# _internal allow into ondivi app
+from ondivi._internal.define_changed_lines import define_changed_lines, index_from_diff_lines  # noqa: WPS436
+from ondivi._internal.exceptions import RevisionNotFoundError  # noqa: WPS436
+from ondivi._internal.git_diff import PATHSPEC_FILES_LIMIT, git_diff_lines  # noqa: WPS436
+from tests.helpers.define_repo import define_repo
+
+
+@pytest.fixture
+def test_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Repo:
+    """Real git repository from fixture."""
+    define_repo(Path('tests/fixtures/test-repo.yaml').read_text(), tmp_path)
+    monkeypatch.chdir(tmp_path)
+    return Repo(tmp_path)
+
+
+@pytest.fixture
+def two_files_repo(test_repo: Repo) -> Repo:
+    """Repository with changes in two files."""
+    other_file = Path(test_repo.working_dir) / 'other.py'
+    other_file.write_text('x = 1\n', encoding='utf-8')
+    test_repo.index.add(['other.py'])
+    test_repo.index.commit('Add other file')
+    other_file.write_text('x = 1\ny = 2\n', encoding='utf-8')
+    return test_repo
+
+
+@pytest.mark.parametrize('commit_idx', [0, -1])
+def test_diff_lines_equal_to_full_diff(test_repo: Repo, commit_idx: int) -> None:
+    """Test changed lines from diff stream equal to changed lines from full diff."""
+    baseline = str(list(test_repo.iter_commits())[commit_idx])
+
+    got = index_from_diff_lines(git_diff_lines(baseline)).as_dict()
+
+    assert got == define_changed_lines(
+        test_repo.git.diff('--unified=0', '--no-ext-diff', '--src-prefix=a/', '--dst-prefix=b/', baseline),
+    )
+    assert got
+
+
+def test_only_header_lines(test_repo: Repo) -> None:
+    """Test only lines with filename and changed ranges yielded."""
+    baseline = str(list(test_repo.iter_commits())[-1])
+
+    got = list(git_diff_lines(baseline))
+
+    assert all(line.startswith(('diff --git', '@@')) for line in got)
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_revision_not_found() -> None:
+    """Test diff with undefined revision."""
+    with pytest.raises(RevisionNotFoundError):
+        list(git_diff_lines('fakeHash'))
+
+
+@pytest.mark.parametrize('filenames', [
+    ['inner/file.py'],
+    ['inner/file.py', 'not_changed.py'],
+])
+def test_restricted_to_files(two_files_repo: Repo, filenames: list[str]) -> None:
+    """Test diff only of given files."""
+    baseline = str(list(two_files_repo.iter_commits())[-1])
+
+    got = index_from_diff_lines(git_diff_lines(baseline, filenames)).as_dict()
+
+    full_diff = index_from_diff_lines(git_diff_lines(baseline)).as_dict()
+    assert got == {'inner/file.py': full_diff['inner/file.py']}
+
+
+@pytest.mark.parametrize('filenames', [
+    ['inner/file.py', '/etc/passwd'],
+    ['inner/file.py', '../outside.py'],
+    ['file_{0}.py'.format(idx) for idx in range(PATHSPEC_FILES_LIMIT + 1)],
+])
+def test_full_diff_fallback(two_files_repo: Repo, filenames: list[str]) -> None:
+    """Test whole tree diffed for files outside of repository or too many files."""
+    baseline = str(list(two_files_repo.iter_commits())[-1])
+
+    got = index_from_diff_lines(git_diff_lines(baseline, filenames)).as_dict()
+
+    assert sorted(got) == ['inner/file.py', 'other.py']
+
+
+def test_pathspec_batches(two_files_repo: Repo, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test files split by several git calls."""
+    monkeypatch.setattr('ondivi._internal.git_diff._PATHSPEC_BATCH_LENGTH', 10)
+    baseline = str(list(two_files_repo.iter_commits())[-1])
+
+    got = index_from_diff_lines(git_diff_lines(baseline, ['other.py', 'inner/file.py'])).as_dict()
+
+    assert got == index_from_diff_lines(git_diff_lines(baseline)).as_dict()
+
+
+def test_without_files(test_repo: Repo) -> None:
+    """Test empty diff for empty files set."""
+    first_commit = list(test_repo.iter_commits())[-1]
+
+    got = list(git_diff_lines(str(first_commit), []))
+
+    assert not got
+
+
+@pytest.mark.usefixtures('test_repo')
+def test_without_files_revision_not_found() -> None:
+    """Test baseline checked for empty files set."""
+    with pytest.raises(RevisionNotFoundError):
+        list(git_diff_lines('fakeHash', []))
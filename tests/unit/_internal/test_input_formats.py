@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test structured linter output."""
+
+import io
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.exceptions import InvalidInputError  # noqa: WPS436
+from ondivi._internal.input_formats import INPUT_FORMATS, input_lines  # noqa: WPS436
+from ondivi._internal.ondivi_types import Violation  # noqa: WPS436
+
+
+def _sarif_result(uri: str, start_line: int) -> dict[str, object]:
+    return {
+        'ruleId': 'E501',
+        'locations': [{'physicalLocation': {
+            'artifactLocation': {'uri': uri},
+            'region': {'startLine': start_line, 'endLine': start_line + 2},
+        }}],
+    }
+
+
+def test_sarif_lines() -> None:
+    """Test line for every result of every run."""
+    document = json.dumps({
+        'version': '2.1.0',
+        'runs': [
+            {'tool': {'driver': {'name': 'ruff'}}, 'results': [_sarif_result('file.py', 12)]},
+            {'tool': {'driver': {'name': 'mypy'}}, 'results': [_sarif_result('foo.py', 3)]},
+        ],
+    }, indent=2)
+
+    got = list(input_lines(io.StringIO(document), 'sarif'))
+
+    expected = [_sarif_result('file.py', 12), _sarif_result('foo.py', 3)]
+    assert [json.loads(line) for line in got] == expected
+    assert all('\n' not in line for line in got)
+
+
+def test_ruff_json_lines() -> None:
+    """Test line for every element of array."""
+    document = json.dumps([
+        {'filename': 'file.py', 'location': {'row': 12, 'column': 80}, 'message': 'Line too long'},
+        {'filename': 'file.py', 'location': {'row': 3, 'column': 1}, 'message': 'Ünicode'},
+    ])
+
+    got = list(input_lines(io.StringIO(document), 'ruff-json'))
+
+    assert got == [
+        '{"filename":"file.py","location":{"row":12,"column":80},"message":"Line too long"}',
+        '{"filename":"file.py","location":{"row":3,"column":1},"message":"Ünicode"}',
+    ]
+
+
+def test_eslint_json_lines() -> None:
+    """Test line for every message with path of file."""
+    document = json.dumps([
+        {'filePath': '/app/file.js', 'messages': [{'line': 1, 'ruleId': 'no-unused-vars'}, {'line': 5}]},
+        {'filePath': '/app/clean.js', 'messages': []},
+    ])
+
+    got = list(input_lines(io.StringIO(document), 'eslint-json'))
+
+    assert got == [
+        '{"filePath":"/app/file.js","line":1,"ruleId":"no-unused-vars"}',
+        '{"filePath":"/app/file.js","line":5}',
+    ]
+
+
+@pytest.mark.parametrize('input_format', ['text', 'json-lines'])
+def test_line_formats(input_format: str) -> None:
+    """Test lines passed as is."""
+    got = list(input_lines(io.StringIO('\n{"file": "file.py", "line": 1}\nFound 1 error\n\n'), input_format))
+
+    assert got == ['{"file": "file.py", "line": 1}', 'Found 1 error']
+
+
+@pytest.mark.parametrize(('document', 'input_format'), [
+    ('file.py:1:1: E302', 'sarif'),
+    ('{"runs": {}}', 'sarif'),
+    ('[{"filePath": "file.js", "messages": [1]}]', 'eslint-json'),
+    ('[{"filename": "file.py"}', 'ruff-json'),
+])
+def test_invalid_document(document: str, input_format: str) -> None:
+    """Test document not matched input format."""
+    with pytest.raises(InvalidInputError):
+        list(input_lines(io.StringIO(document), input_format))
+
+
+@pytest.mark.parametrize(('input_format', 'line', 'expected'), [
+    ('sarif', json.dumps(_sarif_result('inner/file.py', 12)), Violation('inner/file.py', 12, 14)),
+    ('sarif', json.dumps(_sarif_result('file:///inner/my%20file.py', 12)), Violation('/inner/my file.py', 12, 14)),
+    ('sarif', '{"ruleId": "E501", "locations": []}', None),
+    (
+        'ruff-json',
+        '{"filename": "file.py", "location": {"row": 3}, "end_location": {"row": 4}}',
+        Violation('file.py', 3, 4),
+    ),
+    ('json-lines', '{"filename": "file.py", "location": {"row": 3}}', Violation('file.py', 3)),
+    ('json-lines', '{"file": "file.py", "line": 3, "column": 1}', Violation('file.py', 3)),
+    ('json-lines', '{"file": "file.py", "line": "3"}', None),
+    ('json-lines', 'Found 1 error', None),
+    ('eslint-json', '{"filePath": "./file.js", "line": 1, "endLine": 2}', Violation('file.js', 1, 2)),
+])
+def test_violation(
+    input_format: str,
+    line: str,
+    expected: Violation | None,
+    localize_violation_path: Callable[[str], str],
+) -> None:
+    """Test location of result."""
+    got = INPUT_FORMATS[input_format].violation(line)
+
+    assert got == (expected and expected._replace(filename=localize_violation_path(expected.filename)))
+
+
+def test_absolute_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test absolute path relative to working directory."""
+    monkeypatch.chdir(tmp_path)
+
+    file_path = str(tmp_path / 'src' / 'file.js')
+    eslint_message = json.dumps({'filePath': file_path, 'line': 1})
+
+    got = INPUT_FORMATS['eslint-json'].violation(eslint_message)
+
+    assert got == Violation(str(Path('src/file.js')), 1)
@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test input formats by name."""
+
+import io
+
+# _internal allow into ondivi app
+from ondivi._internal.input_formats import INPUT_FORMATS  # noqa: WPS436
+from ondivi._internal.input_names import (  # noqa: WPS436
+    INPUT_FORMAT_NAMES,
+    TEXT_INPUT,
+    named_input_lines,
+    named_input_parser,
+)
+
+
+def test_names() -> None:
+    """Test names match parsers of input formats."""
+    assert tuple(INPUT_FORMATS) == INPUT_FORMAT_NAMES
+
+
+def test_text_lines() -> None:
+    """Test text lines stripped."""
+    got = list(named_input_lines(io.StringIO('file.py:1:1: E225\r\n\nInfo\n'), TEXT_INPUT))
+
+    assert got == ['file.py:1:1: E225', '', 'Info']
+
+
+def test_json_lines() -> None:
+    """Test result of JSON document on own line."""
+    got = list(named_input_lines(io.StringIO('[{"filename": "file.py"}]'), 'ruff-json'))
+
+    assert got == ['{"filename":"file.py"}']
+
+
+def test_parser() -> None:
+    """Test parser of JSON input format."""
+    got = named_input_parser('json-lines')
+
+    assert got is INPUT_FORMATS['json-lines']
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test values of "--input" option."""
+
+from dataclasses import replace
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.cli_options import CliOptions  # noqa: WPS436
+from ondivi._internal.input_specs import input_linters, input_options  # noqa: WPS436
+
+_OPTIONS = CliOptions(
+    baseline='master',
+    fromfile=None,
+    violation_format='{filename}:{line_num:d}{other}',
+    only_violations=False,
+    random_additional=None,
+    stream=False,
+    preset='ruff',
+    input_format='sarif',
+)
+
+
+@pytest.mark.parametrize(('input_spec', 'expected'), [
+    ('flake8=flake8.txt', ('flake8.txt', '{filename}:{line_num:d}{other}', 'ruff', 'sarif')),
+    ('flake8=flake8.txt:flake8', ('flake8.txt', '{filename}:{line_num:d}{other}', 'flake8', 'text')),
+    ('ruff=ruff.json:ruff-json', ('ruff.json', '{filename}:{line_num:d}{other}', 'ruff', 'ruff-json')),
+    ('mypy=mypy.txt:{filename}:{line_num:d}: {other}', ('mypy.txt', '{filename}:{line_num:d}: {other}', None, 'text')),
+    (r'flake8=C:\out\flake8.txt', (r'C:\out\flake8.txt', '{filename}:{line_num:d}{other}', 'ruff', 'sarif')),
+    (r'flake8=C:\flake8.txt:flake8', (r'C:\flake8.txt', '{filename}:{line_num:d}{other}', 'flake8', 'text')),
+    (r'mypy=C:\mypy.txt:{filename}:{line_num}{other}', (r'C:\mypy.txt', '{filename}:{line_num}{other}', None, 'text')),
+])
+def test_input_options(input_spec: str, expected: tuple[str, str, str | None, str]) -> None:
+    """Test format of input override options of run."""
+    linter_name, got = input_options(_OPTIONS, input_spec)
+
+    assert linter_name == input_spec.partition('=')[0]
+    assert (got.fromfile, got.violation_format, got.preset, got.input_format) == expected
+
+
+@pytest.mark.parametrize('input_spec', ['flake8', '=flake8.txt', 'flake8=', 'flake8=:flake8'])
+def test_invalid_input(input_spec: str, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test name and path required."""
+    with pytest.raises(SystemExit, match='2'):
+        input_options(_OPTIONS, input_spec)
+
+    assert capsys.readouterr().err == 'Invalid "--input" value. Expected "NAME=PATH[:FORMAT]" got: "{0}"'.format(
+        input_spec,
+    )
+
+
+def test_input_linters() -> None:
+    """Test options of linters in order of "--input" options."""
+    got = input_linters(replace(_OPTIONS, inputs=('mypy=mypy.txt:mypy', 'flake8=flake8.txt')))
+
+    assert [(linter_name, linter_options.fromfile) for linter_name, linter_options in got.items()] == [
+        ('mypy', 'mypy.txt'),
+        ('flake8', 'flake8.txt'),
+    ]
+
+
+def test_duplicate_name(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test output of linter not replaced by output with same name."""
+    with pytest.raises(SystemExit, match='2'):
+        input_linters(replace(_OPTIONS, inputs=('flake8=first.txt', 'flake8=second.txt')))
+
+    assert capsys.readouterr().err == 'Names of "--input" values must be unique'
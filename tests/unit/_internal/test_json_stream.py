@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test incremental reader of JSON documents."""
+
+import io
+import json
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal import json_stream as json_stream_module  # noqa: WPS436
+from ondivi._internal.json_stream import JsonStream, found  # noqa: WPS436
+
+_SARIF_LIKE = json.dumps({
+    'version': '2.1.0',
+    'runs': [
+        {
+            'tool': {'driver': {'rules': [{'id': 'E501'}]}},
+            'results': [{'line': 12}, {'line': 1.5e3}],
+        },
+        {'results': [], 'invocations': [{'exitCode': 1}]},
+        {'results': [{'message': 'multi\nline ]} "quoted"'}]},
+    ],
+}, indent=2)
+
+
+@pytest.fixture(params=[1, 3, 65536])
+def chunk_size(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> int:
+    """Chunk size, small chunks split values."""
+    monkeypatch.setattr(json_stream_module, '_CHUNK_SIZE', request.param)
+    return int(request.param)
+
+
+@pytest.mark.usefixtures('chunk_size')
+def test_found_at_path() -> None:
+    """Test values at path with skipped siblings."""
+    json_stream = JsonStream(io.StringIO(_SARIF_LIKE))
+
+    got = list(found(json_stream, ('runs', '*', 'results', '*')))
+
+    assert got == [{'line': 12}, {'line': 1500.0}, {'message': 'multi\nline ]} "quoted"'}]
+
+
+@pytest.mark.usefixtures('chunk_size')
+def test_number_split_by_chunks() -> None:
+    """Test number at end of chunk not truncated."""
+    got = list(found(JsonStream(io.StringIO('[123456789, 987654321]')), ('*',)))
+
+    assert got == [123456789, 987654321]
+
+
+def test_missing_path() -> None:
+    """Test document without values at path."""
+    json_stream = JsonStream(io.StringIO('{"version": "2.1.0"}'))
+
+    got = list(found(json_stream, ('runs', '*', 'results', '*')))
+
+    assert not got
+
+
+def test_elements_skipped() -> None:
+    """Test elements not read by consumer skipped."""
+    got = list(JsonStream(io.StringIO(' [ {"a": [1, 2]}, "b" , 3 ] ')).elements())
+
+    assert got == [0, 1, 2]
+
+
+def test_whole_document() -> None:
+    """Test empty path for whole document."""
+    got = list(found(JsonStream(io.StringIO('{"a": 1}')), ()))
+
+    assert got == [{'a': 1}]
+
+
+@pytest.mark.parametrize(('document', 'path'), [
+    ('{"runs": []}', ('*',)),
+    ('[1, 2]', ('runs',)),
+    ('{"runs" 1}', ('runs',)),
+    ('[1, 2', ('*',)),
+    ('', ('*',)),
+    ('[{"line": 12}, {"line": ]', ('*',)),
+])
+def test_invalid_document(document: str, path: tuple[str, ...]) -> None:
+    """Test document not matched path."""
+    with pytest.raises(json.JSONDecodeError):
+        list(found(JsonStream(io.StringIO(document)), path))
+
+
+@pytest.mark.parametrize(('document', 'path'), [
+    ('[{"line": 12} {"line": 14}]', ('*',)),
+    ('{"runs": [] "version": "2.1.0"}', ('runs',)),
+    ('[1, 2,]', ('*',)),
+    ('[, 1]', ('*',)),
+])
+def test_invalid_separators(document: str, path: tuple[str, ...]) -> None:
+    """Test entries not separated by commas rejected like by eager reader."""
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(document)
+    with pytest.raises(json.JSONDecodeError):
+        list(found(JsonStream(io.StringIO(document)), path))
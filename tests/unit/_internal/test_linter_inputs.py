@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test outputs of several linters filtered by one diff."""
+
+from collections.abc import Collection
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.changed_lines_index import ChangedLinesIndex, index_from_ranges  # noqa: WPS436
+from ondivi._internal.cli_options import CliOptions  # noqa: WPS436
+from ondivi._internal.linter_inputs import filtered_inputs  # noqa: WPS436
+
+
+def _changed_lines(options: CliOptions, filenames: Collection[str] | None = None) -> ChangedLinesIndex:
+    return index_from_ranges({'file.py': [(3, 3)]})
+
+
+def test_filtered_inputs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test kept lines of all linters in order of inputs and count of violations of every linter."""
+    monkeypatch.setattr(CliOptions, 'changed_lines', _changed_lines)
+    (tmp_path / 'flake8.txt').write_text(
+        'file.py:1:1: E101 indentation\nfile.py:3:1: E225 whitespace\n',
+        encoding='utf-8',
+    )
+    (tmp_path / 'mypy.txt').write_text('file.py:3: error: x\n', encoding='utf-8')
+    options = CliOptions(
+        baseline='master',
+        fromfile=None,
+        violation_format='{filename}:{line_num:d}{other}',
+        only_violations=False,
+        random_additional=None,
+        stream=False,
+        inputs=(
+            'flake8={0}:flake8'.format(tmp_path / 'flake8.txt'),
+            'mypy={0}:mypy'.format(tmp_path / 'mypy.txt'),
+        ),
+    )
+
+    got = filtered_inputs(options)
+
+    assert got
+    assert capsys.readouterr() == (
+        'file.py:3:1: E225 whitespace\nfile.py:3: error: x\n',
+        'flake8: 1 violation(s)\nmypy: 1 violation(s)\n',
+    )
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test read linter output."""
+
+import sys
+from collections.abc import Callable
+from io import BytesIO, TextIOWrapper
+from pathlib import Path
+
+import pytest
+
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
+
+# _internal allow into ondivi app
+from ondivi._internal.exceptions import FromFileNotFoundError  # noqa: WPS436
+from ondivi._internal.linter_output import (  # noqa: WPS436
+    linted_files,
+    linter_output_lines,
+    linter_output_stream,
+    raw_lines,
+    stripped_lines,
+)
+
+
+@pytest.fixture
+def violations_file(tmp_path: Path) -> Path:
+    """File with violations."""
+    violations_path = tmp_path / 'violations.txt'
+    violations_path.write_text(
+        '\n'.join([
+            '',
+            'file.py:3:1: E302 expected 2 blank lines, found 1',
+            'file.py:9:1: E302 expected 2 blank lines, found 1',
+            '',
+        ]),
+        encoding='utf-8',
+    )
+    return violations_path
+
+
+def test_lines_from_file(violations_file: Path) -> None:
+    """Test read lines from file."""
+    got = linter_output_lines(str(violations_file))
+
+    assert got == [
+        'file.py:3:1: E302 expected 2 blank lines, found 1',
+        'file.py:9:1: E302 expected 2 blank lines, found 1',
+    ]
+
+
+def test_stream_from_file(violations_file: Path) -> None:
+    """Test read stream from file."""
+    with linter_output_stream(str(violations_file)) as linter_output:
+        got = list(stripped_lines(linter_output))
+
+    assert got == [
+        'file.py:3:1: E302 expected 2 blank lines, found 1',
+        'file.py:9:1: E302 expected 2 blank lines, found 1',
+    ]
+
+
+def test_raw_lines_from_file(violations_file: Path) -> None:
+    """Test read lines of file by memory map."""
+    with raw_lines(str(violations_file)) as linter_output:
+        got = list(linter_output)
+
+    assert got == [
+        b'\n',
+        b'file.py:3:1: E302 expected 2 blank lines, found 1\n',
+        b'file.py:9:1: E302 expected 2 blank lines, found 1\n',
+    ]
+
+
+def test_raw_lines_from_stdin(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test read lines of stdin as bytes."""
+    monkeypatch.setattr(sys, 'stdin', TextIOWrapper(BytesIO(b'file.py:3:1: E302\nFound 1 error')))
+
+    with raw_lines(None) as linter_output:
+        got = list(linter_output)
+
+    assert got == [b'file.py:3:1: E302\n', b'Found 1 error']
+
+
+def test_raw_lines_empty_file(tmp_path: Path) -> None:
+    """Test empty file not mapped."""
+    (tmp_path / 'violations.txt').touch()
+
+    with raw_lines(str(tmp_path / 'violations.txt')) as linter_output:
+        got = list(linter_output)
+
+    assert not got
+
+
+def test_raw_lines_file_not_found() -> None:
+    """Test file for memory map not found."""
+    with pytest.raises(FromFileNotFoundError), raw_lines('undefined.txt') as linter_output:
+        next(linter_output)
+
+
+@pytest.mark.parametrize('read', [linter_output_lines, linter_output_stream])
+def test_file_not_found(read: Callable[[str], object]) -> None:
+    """Test file with violations not found."""
+    with pytest.raises(FromFileNotFoundError):
+        read('undefined.txt')
+
+
+@pytest.mark.parametrize(('lines', 'expected'), [
+    (['\n', '  \n', 'a\n', '\n', 'b\n', ' \n', '\n'], ['a', '', 'b']),
+    (['a\r\n', 'b'], ['a', 'b']),
+    (['\n', '\n'], []),
+    ([], []),
+])
+def test_stripped_lines(lines: list[str], expected: list[str]) -> None:
+    """Test lazy strip of lines."""
+    got = list(stripped_lines(lines))
+
+    assert got == expected
+
+
+@pytest.mark.parametrize(('lines', 'expected'), [
+    ([b'\n', b'  \n', b'a\n', b'\n', b'b\n', b' \n', b'\n'], [b'a', b'', b'b']),
+    ([b'a\r\n', b'b'], [b'a', b'b']),
+    ([b'\n', b'\n'], []),
+])
+def test_stripped_byte_lines(lines: list[bytes], expected: list[bytes]) -> None:
+    """Test lazy strip of not decoded lines."""
+    got = list(stripped_lines(lines))
+
+    assert got == expected
+
+
+def test_linted_files() -> None:
+    """Test files with violations from linter output."""
+    got = linted_files(
+        [
+            'file.py:3:1: E302 expected 2 blank lines, found 1',
+            './inner/file.py:9:1: E302 expected 2 blank lines, found 1',
+            'file.py:12:80: E501 line too long (119 > 79 characters)',
+            'Found 3 errors.',
+        ],
+        compile_format('{filename}:{line_num:d}:{col:d}: {message}'),
+    )
+
+    assert got == {'file.py', str(Path('inner/file.py'))}
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test formats of filtered linter output."""
+
+import json
+from typing import Any, TypeAlias
+from xml.etree.ElementTree import fromstring  # noqa: S405 . Parse own output
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.ondivi_types import Violation  # noqa: WPS436
+from ondivi._internal.output_formats import OUTPUT_FORMATS  # noqa: WPS436
+
+_LINES_FOR_OUT = (
+    ('inner/file.py:12:80: E501 line too long', Violation('inner/file.py', 12)),
+    ('Found 2 errors', None),
+    ('file.py:3: error: "a" & "b" <types>, 100%\nnote', Violation('file.py', 3, 5)),
+)
+# URI and region of SARIF result
+_SarifLocation: TypeAlias = tuple[str, dict[str, int]]
+
+
+def _formatted(output_format: str) -> str:
+    fmt = OUTPUT_FORMATS[output_format]
+    formatted_lines = [fmt.formatted(line, violation) for line, violation in _LINES_FOR_OUT]
+    body = fmt.separator.join(filter(None, formatted_lines))
+    return ''.join((fmt.header, body, fmt.footer))
+
+
+def _sarif_location(sarif_result: dict[str, Any]) -> _SarifLocation:
+    physical_location = sarif_result['locations'][0]['physicalLocation']
+    uri = physical_location['artifactLocation']['uri']
+    return uri, physical_location['region']
+
+
+def test_text() -> None:
+    """Test lines as is."""
+    got = _formatted('text')
+
+    assert got == '\n'.join([
+        'inner/file.py:12:80: E501 line too long',
+        'Found 2 errors',
+        'file.py:3: error: "a" & "b" <types>, 100%',
+        'note\n',
+    ])
+
+
+def test_json_lines() -> None:
+    """Test JSON line for each violation."""
+    got = _formatted('json-lines')
+
+    assert [json.loads(line) for line in got.splitlines()] == [
+        {'filename': 'inner/file.py', 'line_num': 12, 'end_line_num': None, 'line': _LINES_FOR_OUT[0][0]},
+        {'filename': 'file.py', 'line_num': 3, 'end_line_num': 5, 'line': _LINES_FOR_OUT[2][0]},
+    ]
+
+
+def test_sarif() -> None:
+    """Test SARIF log with result for each violation."""
+    got = json.loads(_formatted('sarif'))
+
+    sarif_run = got['runs'][0]
+
+    assert got['version'] == '2.1.0'
+    assert sarif_run['tool']['driver']['name'] == 'ondivi'
+    assert [
+        (*_sarif_location(sarif_result), sarif_result['message']['text'])
+        for sarif_result in sarif_run['results']
+    ] == [
+        ('inner/file.py', {'startLine': 12, 'endLine': 12}, _LINES_FOR_OUT[0][0]),
+        ('file.py', {'startLine': 3, 'endLine': 5}, _LINES_FOR_OUT[2][0]),
+    ]
+
+
+def test_junit() -> None:
+    """Test failed testcase for each violation."""
+    got = fromstring(_formatted('junit'))  # noqa: S314 . Parse own output
+
+    assert [
+        (testcase.get('name'), testcase.find('failure').get('message'))  # type: ignore [union-attr]
+        for testcase in got.iter('testcase')
+    ] == [
+        ('inner/file.py:12', _LINES_FOR_OUT[0][0]),
+        ('file.py:3', _LINES_FOR_OUT[2][0]),
+    ]
+
+
+def test_junit_invalid_chars() -> None:
+    """Test characters not allowed in XML removed."""
+    testcase = OUTPUT_FORMATS['junit'].formatted('\x1b[31mfile.py:3:1: E1\x1b[0m', Violation('file\x00.py', 3))
+
+    got = fromstring(testcase or '')  # noqa: S314 . Parse own output
+
+    assert got.get('name') == 'file.py:3'
+    assert got.find('failure').get('message') == '[31mfile.py:3:1: E1[0m'  # type: ignore [union-attr]
+
+
+def test_github() -> None:
+    """Test workflow command for each violation."""
+    got = _formatted('github')
+
+    assert got == ''.join([
+        '::error file=inner/file.py,line=12,endLine=12::inner/file.py:12:80: E501 line too long\n',
+        '::error file=file.py,line=3,endLine=5::file.py:3: error: "a" & "b" <types>, 100%25%0Anote\n',
+    ])
+
+
+@pytest.mark.parametrize('output_format', ['json-lines', 'sarif', 'junit', 'github'])
+def test_without_violations(output_format: str) -> None:
+    """Test lines without violation skipped by structured formats."""
+    fmt = OUTPUT_FORMATS[output_format]
+
+    got = fmt.formatted('Found 0 errors', None)
+
+    assert got is None
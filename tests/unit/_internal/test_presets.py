@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test built-in formats of popular linters."""
+
+from collections.abc import Callable
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.ondivi_types import Violation  # noqa: WPS436
+from ondivi._internal.presets import PRESETS, preset_bytes_pattern, preset_format  # noqa: WPS436
+
+
+@pytest.mark.parametrize(('preset', 'line', 'filename', 'line_num'), [
+    ('flake8', 'inner/file.py:12:80: E501 line too long (119 > 79 characters)', 'inner/file.py', 12),
+    ('flake8', 'inner/file.py:3:1: WPS221 Found line with high Jones Complexity: 15 > 14', 'inner/file.py', 3),
+    ('ruff', 'inner/file.py:12:5: T201 `print` found', 'inner/file.py', 12),
+    ('pylint', 'inner/file.py:1:0: C0114: Missing module docstring (missing-module-docstring)', 'inner/file.py', 1),
+    ('mypy', 'inner/file.py:16: error: Argument 2 to "User" has incompatible type "str"', 'inner/file.py', 16),
+    ('mypy', 'inner/file.py:16:11: note: Revealed type is "builtins.int"', 'inner/file.py', 16),
+    ('eslint', "src/file.js:1:10: 'x' is defined but never used. [Error/no-unused-vars]", 'src/file.js', 1),
+    ('eslint', 'src/file.js:4:1: Parsing error: Unexpected token [Error]', 'src/file.js', 4),
+    ('rubocop', 'lib/file.rb:3:1: C: Style/FrozenStringLiteralComment: Missing comment.', 'lib/file.rb', 3),
+    ('stylelint', 'src/style.css:1:7: Unexpected unit (length-zero-no-unit) [error]', 'src/style.css', 1),
+])
+def test_preset(
+    preset: str,
+    line: str,
+    filename: str,
+    line_num: int,
+    localize_violation_path: Callable[[str], str],
+) -> None:
+    """Test parse linter line by preset."""
+    got = preset_format(preset).violation(line)
+
+    assert got == Violation(localize_violation_path(filename), line_num)
+
+
+@pytest.mark.parametrize('line', [
+    'Found 18 errors.',
+    'Found 2 errors in 1 file (checked 1 source file)',
+    '************* Module file',
+    '',
+])
+@pytest.mark.parametrize('preset', sorted(PRESETS))
+def test_not_violation(preset: str, line: str) -> None:
+    """Test line without violation."""
+    got = preset_format(preset).violation(line)
+
+    assert got is None
+
+
+def test_windows_path() -> None:
+    """Test filename with drive letter."""
+    got = preset_format('flake8').violation(r'C:\app\file.py:12:80: E501 line too long')
+
+    assert got is not None
+    assert got.line_num == 12
+
+
+@pytest.mark.parametrize(('preset', 'line', 'expected'), [
+    ('flake8', b'inner/file.py:12:80: E501 line too long (119 > 79 characters)', (b'inner/file.py', b'12')),
+    ('mypy', b'inner/file.py:16: error: Argument 2 to "User" has incompatible type "str"', (b'inner/file.py', b'16')),
+    ('stylelint', b'src/style.css:1:7: Unexpected unit (length-zero-no-unit) [error]', (b'src/style.css', b'1')),
+    ('flake8', b'Found 18 errors.', None),
+])
+def test_bytes_pattern(preset: str, line: bytes, expected: tuple[bytes, bytes] | None) -> None:
+    """Test not decoded line matched like decoded line."""
+    got = preset_bytes_pattern(preset).match(line)
+
+    assert (got and got.group('filename', 'line_num')) == expected
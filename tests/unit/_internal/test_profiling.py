@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test CPU and memory profiles of run."""
+
+import pstats
+import tracemalloc
+from pathlib import Path
+
+# _internal allow into ondivi app
+from ondivi._internal.profiling import profiled  # noqa: WPS436
+
+
+def test_disabled() -> None:
+    """Test hook not created without profile files."""
+    with profiled(None, None) as stage_hook:
+        assert stage_hook is None
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_cpu_profile(tmp_path: Path) -> None:
+    """Test cProfile dump readable by pstats."""
+    profile_file = tmp_path / 'cpu.prof'
+
+    with profiled(str(profile_file), None):
+        sorted(str(number) for number in range(1000))
+
+    assert pstats.Stats(str(profile_file)).get_stats_profile().func_profiles
+
+
+def test_memory_profile(tmp_path: Path) -> None:
+    """Test snapshot for each started stage and for end of run."""
+    report_file = tmp_path / 'memory.txt'
+
+    with profiled(None, str(report_file)) as stage_hook:
+        assert stage_hook
+        stage_hook('read_linter_output')
+        allocated = [str(number) for number in range(1000)]
+        stage_hook('output')
+
+    sections = report_file.read_text(encoding='utf-8').strip().split('\n\n')
+    titles = [section.partition(':')[0] for section in sections]
+    assert len(allocated) == 1000
+    assert titles == ['Start of stage "read_linter_output"', 'Start of stage "output"', 'End of run']
+    assert 'test_profiling.py' in sections[1]
+    assert not tracemalloc.is_tracing()
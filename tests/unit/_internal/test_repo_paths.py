@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test filenames of linter output and diff in one form."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.repo_paths import diff_filename, local_filename, normalized_filename  # noqa: WPS436
+
+
+@pytest.fixture
+def repo_subdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Current directory inside of repository."""
+    (tmp_path / '.git').mkdir()
+    subdir = tmp_path / 'src' / 'app'
+    subdir.mkdir(parents=True)
+    monkeypatch.chdir(subdir)
+    return subdir
+
+
+def test_normalized_filename(localize_violation_path: Callable[[str], str]) -> None:
+    """Test filename normalization."""
+    got = normalized_filename(r'.\inner\file.py')
+
+    assert got == localize_violation_path('inner/file.py')
+
+
+@pytest.mark.parametrize(('filename', 'expected'), [
+    ('views.py', 'src/app/views.py'),
+    ('./views.py', 'src/app/views.py'),
+    (r'.\models\user.py', 'src/app/models/user.py'),
+    ('../lib.py', 'src/lib.py'),
+    ('inner/./file.py', 'src/app/inner/file.py'),
+])
+@pytest.mark.usefixtures('repo_subdir')
+def test_relative_to_subdir(filename: str, expected: str) -> None:
+    """Test paths relative to subdirectory of repository."""
+    got = normalized_filename(filename)
+
+    assert got == str(Path(expected))
+
+
+def test_absolute(repo_subdir: Path) -> None:
+    """Test absolute paths inside and outside of repository."""
+    outside_file = str(repo_subdir.parents[2] / 'other.py')
+
+    got = [normalized_filename(str(repo_subdir / 'views.py')), normalized_filename(outside_file)]
+
+    assert got == [str(Path('src/app/views.py')), outside_file]
+
+
+def test_outside_of_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test current directory is root without repository."""
+    monkeypatch.chdir(tmp_path)
+
+    got = normalized_filename('./inner/file.py')
+
+    assert got == str(Path('inner/file.py'))
+
+
+def test_diff_filename() -> None:
+    """Test filename of diff in form of normalized filename."""
+    got = diff_filename('inner/file.py')
+
+    assert got == str(Path('inner/file.py'))
+
+
+@pytest.mark.usefixtures('repo_subdir')
+def test_local_filename() -> None:
+    """Test path relative to current directory."""
+    got = [local_filename(str(Path('src/app/views.py'))), local_filename('setup.py')]
+
+    assert got == [str(Path('views.py')), str(Path('../../setup.py'))]
@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test time of stages and counters of run."""
+
+import pickle  # noqa: S403 . Parser pickled like for worker processes
+import time
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
+from ondivi._internal.ondivi_types import Violation  # noqa: WPS436
+from ondivi._internal.run_stats import RunStats, stats_report  # noqa: WPS436
+
+
+@pytest.fixture
+def run_stats() -> RunStats:
+    """Stats with started recording."""
+    recording = RunStats()
+    recording.start(enabled=True)
+    return recording
+
+
+def test_nested_stage(run_stats: RunStats) -> None:
+    """Test time of nested stage excluded from outer stage."""
+    with run_stats.stage('outer'), run_stats.stage('inner'):
+        time.sleep(0.05)
+
+    got = run_stats.as_dict()['stages']
+
+    assert got['inner']['wall'] >= 0.05
+    assert got['outer']['wall'] < 0.05
+
+
+def test_timed(run_stats: RunStats) -> None:
+    """Test items counted."""
+    got = list(run_stats.timed('read', iter('abc'), 'input_lines'))
+
+    assert got == ['a', 'b', 'c']
+    assert run_stats.as_dict()['counters']['input_lines'] == 3
+    assert set(run_stats.as_dict()['stages']) == {'read'}
+
+
+def test_counted(run_stats: RunStats) -> None:
+    """Test parsed and unparsable lines counted."""
+    parser = run_stats.counted(compile_format('{filename}:{line_num:d}{other}'))
+
+    got = [parser.violation(line) for line in ('file.py:1:1: E1', 'file.py:3:1: E2', 'Found 2 errors')]
+
+    counters = run_stats.as_dict()['counters']
+    assert got == [Violation('file.py', 1), Violation('file.py', 3), None]
+    assert (counters['parsed_violations'], counters['unparsable_lines']) == (2, 1)
+
+
+def test_counted_pickled() -> None:
+    """Test origin parser pickled for worker processes, stage hook not picklable."""
+    run_stats = RunStats()
+    run_stats.start(enabled=True, stage_hook=lambda _: None)
+    parser = pickle.loads(  # noqa: S301 . Pickled by test
+        pickle.dumps(run_stats.counted(compile_format('{filename}:{line_num:d}{other}'))),
+    )
+
+    got = parser.violation('file.py:1:1: E1')
+
+    assert got == Violation('file.py', 1)
+    assert 'parsed_violations' not in run_stats.as_dict()['counters']
+
+
+def test_disabled() -> None:
+    """Test objects passed as is without recording."""
+    run_stats = RunStats()
+    lines = iter('abc')
+    parser = compile_format('{filename}:{line_num:d}{other}')
+
+    with run_stats.stage('read'):
+        run_stats.count('input_lines')
+
+    assert run_stats.timed('read', lines, 'input_lines') is lines
+    assert run_stats.counted(parser) is parser
+    assert not run_stats.as_dict()['stages']
+    assert set(run_stats.as_dict()['counters']) <= {'peak_rss_kib'}
+
+
+def test_restart(run_stats: RunStats) -> None:
+    """Test new recording reset stages and counters."""
+    with run_stats.stage('read'):
+        run_stats.count('input_lines', 3)
+
+    run_stats.start(enabled=True)
+
+    assert not run_stats.as_dict()['stages']
+    assert 'input_lines' not in run_stats.as_dict()['counters']
+
+
+def test_report(run_stats: RunStats) -> None:
+    """Test table of stages and counters."""
+    with run_stats.stage('output'):
+        run_stats.count('kept_lines', 12)
+
+    got = stats_report(run_stats).splitlines()
+
+    assert got[:3] == [
+        'stage                        wall, s      cpu, s',
+        'output                         0.000       0.000',
+        'counter                        value',
+    ]
+    assert got[3] == 'kept_lines                        12'
+
+
+def test_stage_hook() -> None:
+    """Test hook called on first start of every stage."""
+    started: list[str] = []
+    run_stats = RunStats()
+    run_stats.start(enabled=True, stage_hook=started.append)
+
+    list(run_stats.timed('read', iter('abc')))
+    with run_stats.stage('output'):
+        list(run_stats.timed('read', iter('abc')))
+
+    assert started == ['read', 'output']
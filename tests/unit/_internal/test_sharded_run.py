@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test linter runs on shards of changed files."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.changed_lines_index import index_from_ranges  # noqa: WPS436
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
+from ondivi._internal.exceptions import LinterFailedError  # noqa: WPS436
+from ondivi._internal.sharded_run import failed_run_message, sharded_lines  # noqa: WPS436
+
+
+def test_sharded_lines() -> None:
+    """Test output of every shard filtered in order of shards."""
+    got = sharded_lines(
+        [sys.executable, '-c', 'import sys\nfor path in sys.argv[1:]: print(path + ":3: E1")'],
+        ['a.py', 'b.py', 'c.py'],
+        index_from_ranges({'a.py': [(3, 3)], 'c.py': [(3, 3)]}),
+        compile_format('{filename}:{line_num:d}{other}'),
+        only_violations=True,
+        jobs=2,
+    )
+
+    assert sorted(line for line, _ in got) == ['a.py:3: E1', 'c.py:3: E1']
+
+
+def test_lines_yielded_while_linter_runs(tmp_path: Path) -> None:
+    """Test line of shard yielded before linter finished."""
+    marker = tmp_path / 'marker'
+    got = sharded_lines(
+        [
+            sys.executable,
+            '-c',
+            '\n'.join([
+                'import sys, time, pathlib',
+                'print("a.py:3: E1", flush=True)',
+                'while not pathlib.Path(sys.argv[1]).exists(): time.sleep(0.01)',
+            ]),
+            str(marker),
+        ],
+        ['a.py'],
+        index_from_ranges({'a.py': [(3, 3)]}),
+        compile_format('{filename}:{line_num:d}{other}'),
+        only_violations=True,
+        jobs=1,
+    )
+
+    first_line = next(got)
+    marker.touch()
+
+    assert first_line[0] == 'a.py:3: E1'
+    assert not list(got)
+
+
+@pytest.mark.parametrize(('script', 'expected'), [
+    ('import sys\nprint("x.py:1: E1")\nsys.exit(1)', []),
+    ('import sys\nsys.exit(0)', []),
+])
+def test_exit_code_with_output(script: str, expected: list[str]) -> None:
+    """Test non-zero exit code of linter with output and zero exit code without output."""
+    got = sharded_lines(
+        [sys.executable, '-c', script],
+        ['a.py'],
+        index_from_ranges({}),
+        compile_format('{filename}:{line_num:d}{other}'),
+        only_violations=True,
+        jobs=1,
+    )
+
+    assert [line for line, _ in got] == expected
+
+
+def test_linter_failed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test lines of all shards yielded before fail of linter without output."""
+    monkeypatch.chdir(tmp_path)
+    Path('a.py').write_text('x = 1\n', encoding='utf-8')
+    Path('b.py').write_text('x = 1\ny = 2\n', encoding='utf-8')
+    got = sharded_lines(
+        [sys.executable, '-c', 'import sys\nif "a.py" in sys.argv: sys.exit(3)\nprint("b.py:1: E1")'],
+        ['a.py', 'b.py'],
+        index_from_ranges({'b.py': [(1, 1)]}),
+        compile_format('{filename}:{line_num:d}{other}'),
+        only_violations=True,
+        jobs=2,
+    )
+    lines: list[str] = []
+
+    with pytest.raises(LinterFailedError) as err_info:
+        lines.extend(line for line, _ in got)
+
+    assert lines == ['b.py:1: E1']
+    assert err_info.value.args == (3,)
+
+
+def test_command_not_found() -> None:
+    """Test error of linter start."""
+    got = sharded_lines(
+        ['not-existing-linter'],
+        ['a.py'],
+        index_from_ranges({}),
+        compile_format('{filename}:{line_num:d}{other}'),
+        only_violations=True,
+        jobs=1,
+    )
+
+    with pytest.raises(FileNotFoundError):
+        list(got)
+
+
+@pytest.mark.parametrize(('err', 'expected'), [
+    (LinterFailedError(3), 'Command "flake8" failed with exit code 3'),
+    (FileNotFoundError(2, 'No such file or directory'), 'Command "flake8" not found'),
+    (OSError(7, 'Argument list too long'), 'Command "flake8" not started: Argument list too long'),
+])
+def test_failed_run_message(err: LinterFailedError | OSError, expected: str) -> None:
+    """Test message of linter run error."""
+    got = failed_run_message('flake8', err)
+
+    assert got == expected
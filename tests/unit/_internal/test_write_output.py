@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test write filtered linter output."""
+
+import sys
+from collections.abc import Callable
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.ondivi_types import Violation  # noqa: WPS436
+from ondivi._internal.output_formats import OUTPUT_FORMATS  # noqa: WPS436
+from ondivi._internal.write_output import write_raw_lines, write_stream  # noqa: WPS436
+
+
+class _ClosedPipe(StringIO):
+
+    def __init__(self, fileno: int) -> None:
+        super().__init__()
+        self._fileno = fileno
+
+    def write(self, text: str | bytes) -> int:
+        raise BrokenPipeError
+
+    def fileno(self) -> int:
+        return self._fileno
+
+    @property
+    def buffer(self) -> '_ClosedPipe':  # type: ignore [override]
+        return self
+
+
+def test_write_stream(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test lines written and violation found."""
+    got = write_stream(
+        [('file.py:3:1: E302', Violation('file.py', 3)), ('Found 1 error', None)],
+        OUTPUT_FORMATS['text'],
+    )
+
+    assert got
+    assert capsys.readouterr().out == 'file.py:3:1: E302\nFound 1 error\n'
+
+
+def test_write_stream_without_violations(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test lines without violations."""
+    got = write_stream([('All checks passed!', None)], OUTPUT_FORMATS['text'])
+
+    assert not got
+    assert capsys.readouterr().out == 'All checks passed!\n'
+
+
+@pytest.mark.parametrize('write', [
+    lambda: write_stream([('Info message', None)], OUTPUT_FORMATS['text']),
+    lambda: write_raw_lines([(b'Info message', False)]),
+])
+def test_broken_pipe(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, write: Callable[[], bool]) -> None:
+    """Test stdout redirected to devnull when reader close pipe."""
+    with (tmp_path / 'stdout.txt').open('w') as stdout_file:
+        monkeypatch.setattr(sys, 'stdout', _ClosedPipe(stdout_file.fileno()))
+        with pytest.raises(SystemExit) as exit_info:
+            write()
+
+    assert exit_info.value.code == 1
+
+
+def test_separator(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test separator only between written items."""
+    got = write_stream(
+        [
+            ('file.py:3:1: E302', Violation('file.py', 3)),
+            ('Found 2 errors', None),
+            ('file.py:5:1: E302', Violation('file.py', 5)),
+        ],
+        OUTPUT_FORMATS['sarif'],
+        flush_lines=False,
+    )
+
+    assert got
+    assert capsys.readouterr().out.count('},\n{') == 1
+
+
+@pytest.mark.parametrize('flush_lines', [True, False])
+def test_write_raw_lines(capsysbinary: pytest.CaptureFixture[bytes], flush_lines: bool) -> None:
+    """Test lines written as bytes."""
+    got = write_raw_lines(
+        [(b'file.py:3:1: E302 \xff', True), (b'Found 1 error', False)],
+        flush_lines=flush_lines,
+    )
+
+    assert got
+    assert capsysbinary.readouterr().out == b'file.py:3:1: E302 \xff\nFound 1 error\n'
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test minimal client of ondivi daemon."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.daemon_client import RequestOptions  # noqa: WPS436
+from ondivi.client import main
+
+
+@pytest.mark.parametrize(('args', 'fromfile', 'stream'), [
+    ([], None, False),
+    (['--fromfile', 'out.txt', '--stream'], 'out.txt', True),
+    (['--stream', '--fromfile=out.txt'], 'out.txt', True),
+    (['--only-violations', '--fromfile'], None, False),
+])
+def test_request_options(
+    monkeypatch: pytest.MonkeyPatch,
+    args: list[str],
+    fromfile: str | None,
+    stream: bool,
+) -> None:
+    """Test arguments sent to daemon with options of request."""
+    requests: list[RequestOptions] = []
+    monkeypatch.setattr(sys, 'argv', ['ondivi-client', *args])
+    monkeypatch.setattr('ondivi.client.run_by_daemon', requests.append)
+    monkeypatch.setattr('ondivi.entry.main', lambda: None)
+
+    main()
+
+    assert requests == [{'args': args, 'fromfile': fromfile, 'stream': stream}]
+
+
+def test_daemon_not_started(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test arguments parsed in current process without daemon."""
+    monkeypatch.setenv('ONDIVI_SOCKET', str(tmp_path / 'ondivi.sock'))
+    monkeypatch.setattr(sys, 'argv', ['ondivi-client', '--help'])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == 0
+    assert 'Usage:' in capsys.readouterr().out
@@ -5,6 +5,9 @@
 
 from collections.abc import Callable
 
+# _internal allow into ondivi app
+from ondivi._internal.baseline_snapshot import BaselineSnapshot, fingerprinted  # noqa: WPS436
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
 from ondivi.entry import controller
 
 
@@ -27,3 +30,43 @@ def test_controller(localize_violation_path: Callable[[str], str]) -> None:
 
     assert got == [localize_violation_path('ondivi/__main__.py:27:1: Error message')]
     assert found
+
+
+def test_controller_random_additional(localize_violation_path: Callable[[str], str]) -> None:
+    """Testing additional violations after filtered lines."""
+    got, found = controller(
+        '\n'.join([
+            'diff --git a/ondivi/__main__.py b/ondivi/__main__.py',
+            '--- a/ondivi/__main__.py',
+            '+++ b/ondivi/__main__.py',
+            '@@ -26,0 +27,1 @@ from git import Repo',
+            '+Diff = str',
+        ]),
+        [localize_violation_path('ondivi/__main__.py:3:1: Error message')],
+        '{filename}:{line_num:d}:{col_num:d}: {message}',
+        only_violations=True,
+        random_additional=1,
+    )
+
+    assert got == [localize_violation_path('ondivi/__main__.py:3:1: Error message')]
+    assert not found
+
+
+def test_controller_baseline_snapshot() -> None:
+    """Testing violations not found in baseline snapshot."""
+    parser = compile_format('{filename}:{line_num:d}:{col_num:d}: {message}')
+    baseline_fingerprints = frozenset(
+        fingerprint
+        for _, _, fingerprint in fingerprinted(['ondivi/__main__.py:3:1: Old error'], parser)
+    )
+
+    got, found = controller(
+        BaselineSnapshot(baseline_fingerprints),
+        ['ondivi/__main__.py:3:1: Old error', 'ondivi/__main__.py:5:1: New error', 'Found 2 errors'],
+        parser,
+        only_violations=False,
+        random_additional=None,
+    )
+
+    assert got == ['ondivi/__main__.py:5:1: New error', 'Found 2 errors']
+    assert found
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test session API."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import StringIO
+from itertools import repeat
+from pathlib import Path
+
+import pytest
+
+# _internal allow into ondivi app
+from ondivi._internal.compiled_format import compile_format  # noqa: WPS436
+from ondivi._internal.ondivi_types import ViolationParser  # noqa: WPS436
+from ondivi.session import RevisionNotFoundError, Session
+from tests.helpers.define_repo import define_repo
+
+_DIFF = '\n'.join([
+    'diff --git a/app.py b/app.py',
+    '--- a/app.py',
+    '+++ b/app.py',
+    '@@ -3,0 +4,1 @@',
+    '+x = 1',
+])
+_LINTER_OUT = (
+    'app.py:1:1: E265 block comment should start with "# "',
+    'app.py:4:2: E225 missing whitespace around operator',
+    'Found 2 errors',
+)
+
+
+@pytest.fixture
+def session() -> Session:
+    """Session for diff."""
+    return Session.from_diff(_DIFF)
+
+
+@pytest.mark.parametrize('violation_format', [
+    'flake8',
+    '{filename}:{line_num:d}:{col:d}: {message}',
+    compile_format('{filename}:{line_num:d}:{col:d}: {message}'),
+])
+def test_filtered(session: Session, violation_format: str | ViolationParser) -> None:
+    """Test template, preset and parser."""
+    got = session.filtered(_LINTER_OUT, violation_format)
+
+    assert got == (['app.py:4:2: E225 missing whitespace around operator', 'Found 2 errors'], True)
+
+
+def test_only_violations(session: Session) -> None:
+    """Test lines without violation skipped."""
+    got = session.filtered(_LINTER_OUT[:1], only_violations=True)
+
+    assert got == ([], False)
+
+
+def test_stream_filtered(session: Session) -> None:
+    """Test lines of stream without line endings."""
+    linter_out = StringIO('\n'.join(_LINTER_OUT))
+
+    got = list(session.stream_filtered(linter_out, 'flake8', only_violations=True))
+
+    assert got == ['app.py:4:2: E225 missing whitespace around operator']
+
+
+def test_stream_filtered_json(session: Session) -> None:
+    """Test JSON input format."""
+    got = session.stream_filtered(
+        StringIO('\n'.join([
+            json.dumps({'filename': 'app.py', 'location': {'row': 1}}),
+            json.dumps({'filename': 'app.py', 'location': {'row': 4}}),
+        ])),
+        input_format='json-lines',
+    )
+
+    expected = {'filename': 'app.py', 'location': {'row': 4}}
+    assert [json.loads(line) for line in got] == [expected]
+
+
+def test_context() -> None:
+    """Test violations near changed lines."""
+    got = Session.from_diff(_DIFF, context=3).filtered(_LINTER_OUT, 'flake8')
+
+    assert got == (list(_LINTER_OUT), True)
+
+
+def test_shared_across_threads(session: Session) -> None:
+    """Test one session used by several threads."""
+    filtered = partial(session.filtered, violation_format='flake8')
+
+    with ThreadPoolExecutor(4) as pool:
+        got = list(pool.map(filtered, repeat(_LINTER_OUT, 100)))
+
+    assert got.count((['app.py:4:2: E225 missing whitespace around operator', 'Found 2 errors'], True)) == 100
+
+
+def test_from_repo(tmp_path: Path) -> None:
+    """Test diff of repository in other directory."""
+    define_repo(Path('tests/fixtures/test-repo.yaml').read_text(), tmp_path)
+
+    got = Session.from_repo('master', tmp_path).filtered([
+        '{0}:3:1: E302 expected 2 blank lines, found 1'.format(Path('inner/file.py')),
+        '{0}:12:80: E501 line too long (119 > 79 characters)'.format(Path('inner/file.py')),
+    ], 'flake8')
+
+    assert got == (['{0}:12:80: E501 line too long (119 > 79 characters)'.format(Path('inner/file.py'))], True)
+
+
+def test_from_repo_outside_of_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test linter output relative to repository used from other current directory."""
+    define_repo(Path('tests/fixtures/test-repo.yaml').read_text(), tmp_path / 'repo')
+    (tmp_path / 'other' / '.git').mkdir(parents=True)
+    (tmp_path / 'other' / 'src').mkdir()
+    monkeypatch.chdir(tmp_path / 'other' / 'src')
+    session = Session.from_repo('master', tmp_path / 'repo')
+    linter_out = ['inner/file.py:12:80: E501 line too long']
+    json_line = json.dumps({'filename': 'inner/file.py', 'location': {'row': 12}})
+
+    got = [
+        session.filtered(linter_out, 'flake8')[0],
+        session.filtered(linter_out, '{filename}:{line_num:d}:{col:d}: {message}')[0],
+        list(session.stream_filtered(StringIO(json_line), input_format='json-lines')),
+    ]
+
+    assert got == [linter_out, linter_out, [json_line]]
+
+
+def test_revision_not_found(tmp_path: Path) -> None:
+    """Test baseline not found."""
+    define_repo(Path('tests/fixtures/test-repo.yaml').read_text(), tmp_path)
+
+    with pytest.raises(RevisionNotFoundError):
+        Session.from_repo('fakeHash', tmp_path)